@@ -0,0 +1,143 @@
+# This file is part of Alva Sequencer.
+# Copyright (C) 2024 Alva Theaters
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+'''
+=====================================================================
+                      DESIGNED BY ALVA THEATERS
+                       FOR THE SOLE PURPOSE OF
+                         MAKING PEOPLE HAPPY
+=====================================================================
+'''
+
+
+## Double hashtag indicates notes for future development requiring some level of attention
+
+
+'''
+Builds a show file's deliverables without opening the interface. For one file:
+
+    blender -b show.blend --python-expr "import addon_utils, importlib; addon_utils.enable('Sequencer'); importlib.import_module('Sequencer.batch_deliverables').main()" -- --output deliverables
+
+Use render_shows.py to run a whole folder of show files in parallel.
+'''
+
+
+import bpy
+import argparse
+import os
+import sys
+
+from .sequencer_main import partition_render_events, diff_render_events, get_render_packets, load_render_manifest, save_render_manifest, send_osc_string, osc_transport, dry_run
+from .sequencer_operators import get_usitt_exports, write_usitt_exports, bake_audio_volumes
+
+
+def render_event_lists(scene, rebuild=False):
+    """Same as Render All, but sent in the foreground since there are no timers without a window. Returns events sent."""
+    ip_address = scene.scene_props.str_osc_ip_address
+    port = scene.scene_props.int_osc_port
+    manifest = load_render_manifest(scene)
+    packets = []
+    event_count = 0
+    
+    for event_list, events in sorted(partition_render_events(scene).items()):
+        previous = None if rebuild else manifest.get(str(event_list))
+        commands, deletions, manifest[str(event_list)] = diff_render_events(event_list, previous, events)
+        if previous is None or commands or deletions:
+            packets += get_render_packets(scene, event_list, previous is None, commands, deletions)
+            event_count += len(commands)
+            
+    if not packets:
+        return 0
+    
+    packets = [("/eos/key/blind", "1"), ("/eos/key/blind", "0")] + packets + [("/eos/key/live", "1"), ("/eos/key/live", "0")]
+    for address, argument in packets:
+        send_osc_string(address, ip_address, port, argument)
+        osc_transport.sleep(0.1)
+        
+    if not osc_transport.recording:
+        save_render_manifest(scene, manifest)
+    return event_count
+
+
+def export_usitt(scene, output_directory):
+    """Writes one USITT ASCII file per event list, named after the show file. Returns events and bytes written."""
+    show_name = bpy.path.display_name_from_filepath(bpy.data.filepath) or scene.name
+    exports = get_usitt_exports(scene, os.path.join(output_directory, show_name + ".asc"), True)
+    return write_usitt_exports(scene, exports)
+
+
+def bake_audio(scene):
+    """Bakes every speaker strip, not just the group under the active strip. Returns strips baked."""
+    speaker_strips = [strip for strip in scene.sequence_editor.sequences_all if strip.type == 'SOUND' and strip.audio_type_enum == "option_speaker"]
+    if speaker_strips:
+        bake_audio_volumes(scene, speaker_strips)
+    return len(speaker_strips)
+
+
+def plan_event_lists(scene, output_directory, rebuild=False):
+    """Writes what rendering would send to the console to <show>.plan.txt instead of sending it. Returns the plan."""
+    show_name = bpy.path.display_name_from_filepath(bpy.data.filepath) or scene.name
+    with dry_run(show_name) as plan:
+        render_event_lists(scene, rebuild)
+    with open(os.path.join(output_directory, show_name + ".plan.txt"), "w", encoding="utf-8") as file:
+        file.write(plan.to_text())
+    return plan
+
+
+def render_deliverables(output_directory, render=True, export=True, bake=True, rebuild=False, save=True, plan_only=False):
+    scene = bpy.context.scene
+    if not scene.sequence_editor:
+        print("Alva Sequencer: nothing to render in", bpy.data.filepath)
+        return
+    
+    os.makedirs(output_directory, exist_ok=True)
+    
+    if render and plan_only:
+        print("Alva Sequencer: dry run,", plan_event_lists(scene, output_directory, rebuild).summary())
+        render = False
+    elif render:
+        print("Alva Sequencer: rendered", render_event_lists(scene, rebuild), "events")
+    if export:
+        events_written, bytes_written = export_usitt(scene, output_directory)
+        print(f"Alva Sequencer: wrote {events_written} events ({bytes_written} bytes) of USITT ASCII")
+    if bake:
+        print("Alva Sequencer: baked", bake_audio(scene), "speaker strips")
+        
+    if save and bpy.data.filepath and (render or bake):
+        bpy.ops.wm.save_mainfile()
+
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+        
+    parser = argparse.ArgumentParser(prog="batch_deliverables", description="Render Alva Sequencer deliverables for the open show file.")
+    parser.add_argument("--output", default="//deliverables", help="Folder for exported files, // is the show file's folder")
+    parser.add_argument("--skip-render", action="store_true", help="Don't send event lists to the console")
+    parser.add_argument("--skip-export", action="store_true", help="Don't write USITT ASCII files")
+    parser.add_argument("--skip-bake", action="store_true", help="Don't bake speaker volumes")
+    parser.add_argument("--rebuild", action="store_true", help="Re-send whole event lists instead of only changes")
+    parser.add_argument("--no-save", action="store_true", help="Leave the show file unsaved")
+    parser.add_argument("--dry-run", action="store_true", help="Write the render's command plan to the output folder instead of sending it")
+    args = parser.parse_args(argv)
+    
+    try:
+        render_deliverables(bpy.path.abspath(args.output), not args.skip_render, not args.skip_export, not args.skip_bake, args.rebuild, not args.no_save, args.dry_run)
+    except Exception:
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
@@ -819,6 +819,11 @@ class ModalStripController(Operator):
                 box.separator()
                 row = box.row()
                 row.operator("my.generate_text", icon="TEXT")
+                row.operator("my.export_usitt_ascii", icon="EXPORT")
+                row.operator("my.import_usitt_ascii_operator", icon="IMPORT")
+                row = box.row()
+                row.operator("my.export_show_timeline", icon="EXPORT")
+                row.operator("my.import_show_timeline", icon="IMPORT")
                 box.separator()
                 row = box.row(align=True)
                 row.operator("my.bump_left_five", icon='BACK')
@@ -1150,7 +1155,7 @@ class ModalStripController(Operator):
                     row = box.row(align=True)
                     row.operator("my.clear_red", icon='CANCEL')
                     row.prop(active_strip, "red_prefix", text="")
-                    row.label(text="")
+                    row.prop(active_strip, "color_emitter_model", text="")
                     row = box.row(align=True)
                     row.operator("my.clear_green", icon='CANCEL')
                     row.prop(active_strip, "green_prefix", text="")
@@ -1223,6 +1228,9 @@ class ModalStripController(Operator):
                     row.alert = 0
                     row.operator("my.add_strip_operator", text="", icon='ADD')
                     row = box.row(align=True)
+                    row.label(text="Or drive * as channels:")
+                    row.prop(active_strip, "animation_channels", text="")
+                    row = box.row(align=True)
                     row.operator("my.record_preset", text="Store Preset", icon='NLA_PUSHDOWN')
                     row.operator("my.load_preset", text="Load Preset", icon='FILE_PARENT')
                     row = box.separator()
@@ -1280,6 +1288,8 @@ class ModalStripController(Operator):
                         #row.operator("my.stop_animation_clock_operator", text="", icon='PAUSE')
                         row.prop(active_strip, "animation_event_list_number", text="Event List")
                         #row = box.row()
+                        row.prop(active_strip, "qmeo_tolerance", text="Tolerance")
+                        row.prop(active_strip, "qmeo_delta", text="Delta", toggle=True)
                         row.operator("my.bake_fcurves_to_cues_operator", text="", icon_value=orb.icon_id)
                         #row = box.row()
                         row.operator("my.rerecord_cues_operator", text="", icon_value=orb.icon_id)
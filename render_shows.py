@@ -0,0 +1,76 @@
+# This file is part of Alva Sequencer.
+# Copyright (C) 2024 Alva Theaters
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+'''
+Runs batch_deliverables on many show files at once, one background Blender per file.
+Run with plain Python, not inside Blender:
+
+    python render_shows.py shows/*.blend --blender /path/to/blender --jobs 4 -- --skip-render
+
+Everything after the first -- is passed to batch_deliverables for each file.
+'''
+
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+def render_show(blender, addon, blend_file, deliverable_args):
+    expression = (f"import addon_utils, importlib; addon_utils.enable({addon!r}, default_set=False); "
+                  f"importlib.import_module({addon!r} + '.batch_deliverables').main()")
+    # Without --python-exit-code, Blender exits 0 even when the add-on or the expression raises.
+    command = [blender, "-b", blend_file, "--python-exit-code", "1", "--python-expr", expression, "--", *deliverable_args]
+    
+    start = time.perf_counter()
+    result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    return blend_file, result.returncode, time.perf_counter() - start, result.stdout
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    deliverable_args = []
+    if "--" in argv:
+        argv, deliverable_args = argv[:argv.index("--")], argv[argv.index("--") + 1:]
+        
+    parser = argparse.ArgumentParser(description="Regenerate Alva Sequencer deliverables for several show files in parallel.")
+    parser.add_argument("blend_files", nargs="+")
+    parser.add_argument("--blender", default="blender", help="Blender executable")
+    parser.add_argument("--addon", default=os.path.basename(os.path.dirname(os.path.abspath(__file__))), help="Module name the add-on is installed under")
+    parser.add_argument("--jobs", type=int, default=max(1, (os.cpu_count() or 2) // 2), help="Show files to run at the same time")
+    args = parser.parse_args(argv)
+    
+    failures = 0
+    # Threads only wait on the Blender processes, which do the actual work in parallel.
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        jobs = [pool.submit(render_show, args.blender, args.addon, blend_file, deliverable_args) for blend_file in args.blend_files]
+        for job in as_completed(jobs):
+            blend_file, returncode, seconds, output = job.result()
+            status = "done" if returncode == 0 else f"failed ({returncode})"
+            print(f"{blend_file}: {status} in {seconds:.1f}s")
+            if returncode != 0:
+                failures += 1
+                print(output)
+                
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -42,6 +42,7 @@ def school_mode_password_updater(self, context):
 class SceneProperties(bpy.types.PropertyGroup):
     str_osc_ip_address: StringProperty(default="192.168.1.1", description="This should be the IP address of the console. This must set for anything to work. Press the About key on the console to find the console's IP address. Console must be on same local network")
     int_osc_port: IntProperty(min=0, max=65535, description="On the console, Displays > Setup > System Settings > Show Control > OSC > (enable OSC RX and make the port number there on the left match the one in this field in Alva. OSC TX = transmit and OSC RX = receive. We want receive", default=8000)
+    int_osc_reply_port: IntProperty(min=0, max=65535, description="Optional. Enable OSC TX on the console, point it at this computer and put its port number here so Orb can wait for the console to answer instead of pausing a fixed time between records. 0 turns this off", default=0)
 
     school_mode_password: StringProperty(default="", description="Reduces potential for students or volunteers to break things", update=school_mode_password_updater)
     school_mode_enabled: BoolProperty(default=False, description="Reduces potential for students or volunteers to break things")
@@ -34,8 +34,15 @@ import time
 import re
 import math
 from functools import partial
+from collections import deque
+from contextlib import contextmanager
 from bpy.app.handlers import persistent
 import os
+import json
+import bisect
+import hashlib
+import struct
+import numpy as np
 import bpy.utils.previews
 
 
@@ -109,6 +116,63 @@ def find_available_channel(sequence_editor, start_frame, end_frame, start_channe
         current_channel += 1
 
 
+# Evaluated world matrices of every light a strip follows, refreshed once per frame so
+# constraints and drivers are already solved and every consumer sees the same transforms.
+class LightMatrixCache:
+    def __init__(self):
+        self.matrices = {}
+        self.frame = None
+
+    def clear(self):
+        self.matrices.clear()
+        self.frame = None
+
+    def fill(self, scene, depsgraph):
+        self.matrices.clear()
+        self.frame = scene.frame_current
+        if not scene.sequence_editor:
+            return
+        
+        light_names = {strip.selected_light for strip in scene.sequence_editor.sequences_all
+                       if strip.type == 'COLOR' and strip.selected_light}
+        for light_name in light_names:
+            light_object = bpy.data.objects.get(light_name)
+            if light_object and light_object.type == 'LIGHT':
+                self.matrices[light_name] = light_object.evaluated_get(depsgraph).matrix_world.copy()
+
+    def get(self, light_name):
+        """World matrix of a light, or None if it no longer exists. Falls back to the original object before the first fill."""
+        matrix = self.matrices.get(light_name)
+        if matrix is not None:
+            return matrix
+        
+        light_object = bpy.data.objects.get(light_name)
+        if light_object and light_object.type == 'LIGHT':
+            return light_object.matrix_world
+        return None
+
+
+light_matrix_cache = LightMatrixCache()
+
+
+@persistent
+def light_matrix_cache_handler(scene, depsgraph):
+    light_matrix_cache.fill(scene, depsgraph)
+
+
+# Lights moved by hand between frame changes.
+@persistent
+def light_matrix_cache_update_handler(scene, depsgraph):
+    if depsgraph.id_type_updated('OBJECT'):
+        light_matrix_cache.fill(scene, depsgraph)
+
+
+# Matrices from the last file would aim lights of the same name in the new one.
+@persistent
+def light_matrix_cache_load_handler(*args):
+    light_matrix_cache.clear()
+
+
 def get_light_rotation_degrees(light_name):
     """
     Returns the X (tilt) and Y (pan) rotation angles in degrees for a given light object,
@@ -118,10 +182,9 @@ def get_light_rotation_degrees(light_name):
     :return: Tuple containing the X (tilt) and Y (pan) rotation angles in degrees.
     """
     
-    light_object = bpy.data.objects.get(light_name)
+    matrix = light_matrix_cache.get(light_name)
 
-    if light_object and light_object.type == 'LIGHT':
-        matrix = light_object.matrix_world
+    if matrix is not None:
         euler = matrix.to_euler('XYZ')
         x_rot_deg = math.degrees(euler.x)
         y_rot_deg = math.degrees(euler.z)  # Pan seems to be on zed euler, not on y as y resolves to super tiny number
@@ -136,6 +199,96 @@ def get_light_rotation_degrees(light_name):
         return None, None
 
 
+def get_light_rotations_degrees(light_names):
+    """
+    Batch version of get_light_rotation_degrees for every light followed by a path this frame.
+    Reads the evaluated world matrices from light_matrix_cache and solves all the XYZ eulers in a single NumPy pass.
+    
+    :param light_names: Iterable of light object names.
+    :return: Dict of light name to (tilt, pan) in degrees, with pan in the -270 to 270 range.
+    """
+    names = []
+    matrices = []
+    for light_name in set(light_names):
+        matrix = light_matrix_cache.get(light_name)
+        if matrix is not None:
+            names.append(light_name)
+            matrices.append(matrix)
+        else:
+            print("It appears as though", light_name,"has left the chat.")
+            
+    if not names:
+        return {}
+    
+    tilt, pan = rotation_matrices_to_tilt_pan(np.array(matrices, dtype=np.float64)[:, :3, :3])
+    return {name: (float(tilt[i]), float(pan[i])) for i, name in enumerate(names)}
+
+
+def rotation_matrices_to_tilt_pan(rotation):
+    """XYZ euler X (tilt) and Z (pan) in degrees for an (N, 3, 3) array of rotation matrices, pan in the -270 to 270 range."""
+    rotation = rotation / np.maximum(np.linalg.norm(rotation, axis=1, keepdims=True), 1e-12)  # Strip scale from each axis.
+    
+    # Both euler solutions, keeping whichever has the smaller sum of absolute angles like Matrix.to_euler() does.
+    cos_y = np.hypot(rotation[:, 0, 0], rotation[:, 1, 0])
+    first = np.stack((np.arctan2(rotation[:, 2, 1], rotation[:, 2, 2]), np.arctan2(-rotation[:, 2, 0], cos_y), np.arctan2(rotation[:, 1, 0], rotation[:, 0, 0])), axis=1)
+    second = np.stack((np.arctan2(-rotation[:, 2, 1], -rotation[:, 2, 2]), np.arctan2(-rotation[:, 2, 0], -cos_y), np.arctan2(-rotation[:, 1, 0], -rotation[:, 0, 0])), axis=1)
+    euler = np.where((np.abs(first).sum(axis=1) > np.abs(second).sum(axis=1))[:, None], second, first)
+    
+    locked = cos_y <= 16 * np.finfo(np.float32).eps  # Gimbal lock, same threshold and fallback mathutils uses.
+    x_rot = np.where(locked, np.arctan2(-rotation[:, 1, 2], rotation[:, 1, 1]), euler[:, 0])
+    z_rot = np.where(locked, 0.0, euler[:, 2])
+    
+    tilt = np.degrees(x_rot)
+    pan = np.degrees(z_rot)
+    pan = np.where(pan > 90, pan - 360, pan)
+    return tilt, pan
+
+
+def euler_xyz_to_matrices(rotation):
+    """(N, 3, 3) rotation matrices for an (N, 3) array of XYZ eulers in radians, same as Euler.to_matrix()."""
+    cos_x, cos_y, cos_z = np.cos(rotation).T
+    sin_x, sin_y, sin_z = np.sin(rotation).T
+    return np.stack((
+        np.stack((cos_y * cos_z, sin_x * sin_y * cos_z - cos_x * sin_z, cos_x * sin_y * cos_z + sin_x * sin_z), axis=-1),
+        np.stack((cos_y * sin_z, sin_x * sin_y * sin_z + cos_x * cos_z, cos_x * sin_y * sin_z - sin_x * cos_z), axis=-1),
+        np.stack((-sin_y, sin_x * cos_y, cos_x * cos_y), axis=-1),
+    ), axis=1)
+
+
+def sample_light_tilt_pan(scene, light_name, frames):
+    """
+    Tilt and pan of a followed light at each frame without moving the playhead.
+    Lights driven only by their own rotation F-curves are read straight from them. Constraints,
+    parents, drivers and other rotation modes need the depsgraph, so those step through the frames once.
+    
+    :return: Dict of frame to (tilt, pan) in degrees, empty if the light is gone.
+    """
+    light_object = bpy.data.objects.get(light_name)
+    if not light_object or light_object.type != 'LIGHT':
+        return {}
+    
+    animation_data = light_object.animation_data
+    if light_object.constraints or light_object.parent or light_object.rotation_mode != 'XYZ' or (animation_data and animation_data.drivers):
+        original_frame = scene.frame_current
+        matrices = []
+        # Stepping frames fires the live handlers, which mustn't reach the console in the middle of a bake.
+        with live_output_muted():
+            for frame in frames:
+                scene.frame_set(frame)
+                matrices.append(light_object.evaluated_get(bpy.context.evaluated_depsgraph_get()).matrix_world.copy())
+            scene.frame_set(original_frame)
+        tilt, pan = rotation_matrices_to_tilt_pan(np.array(matrices, dtype=np.float64)[:, :3, :3])
+    else:
+        rotation = np.tile(np.array(light_object.rotation_euler, dtype=np.float64), (len(frames), 1))
+        if animation_data and animation_data.action:
+            for fcurve in animation_data.action.fcurves:
+                if fcurve.data_path == "rotation_euler" and not fcurve.mute:
+                    rotation[:, fcurve.array_index] = [fcurve.evaluate(frame) for frame in frames]
+        tilt, pan = rotation_matrices_to_tilt_pan(euler_xyz_to_matrices(rotation))
+        
+    return {frame: (float(tilt[i]), float(pan[i])) for i, frame in enumerate(frames)}
+
+
 # For flash end macro.
 def calculate_bias_offseter(bias, frame_rate, strip_length_in_frames):
     if bias == 0:
@@ -230,16 +383,105 @@ def fire_livemap(live_map_prefix, eos_cue_number_livemap):
     send_osc_string(live_map_prefix, ip_address, port, eos_cue_number_livemap)
 
 
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0
+    index = max(0, math.ceil(pct / 100 * len(sorted_values)) - 1)
+    return sorted_values[index]
+
+
+# Opt-in recorder for how late trigger strips actually fire during playback.
+class TriggerTimingRecorder:
+    report_name = "Trigger Timing Report.txt"
+    
+    def __init__(self):
+        self.active = False
+        self.reset()
+
+    def reset(self):
+        self.events = []
+        self.dropped_frames = 0
+        self.missed_events = 0
+        self.fps = 1
+        self.origin_time = 0
+        self.origin_frame = 0
+        self.frame_time = 0
+
+    def start(self, scene):
+        self.reset()
+        self.fps = get_frame_rate(scene)
+        self.rebase(scene.frame_current)
+        self.active = True
+
+    def rebase(self, frame):
+        # Intended times are measured from the moment playback (re)started at this frame.
+        self.origin_time = time.perf_counter()
+        self.origin_frame = frame
+
+    def elapsed(self):
+        return time.perf_counter() - self.origin_time
+
+    def frame_entered(self, frame):
+        self.frame_time = self.elapsed()
+
+    def frames_skipped(self, skipped_frames, mappings):
+        self.dropped_frames += len(skipped_frames)
+        for frame in skipped_frames:
+            for mapping in mappings:
+                self.missed_events += len(mapping.get(frame, ()))
+
+    def record(self, kind, frame, argument):
+        send_time = self.elapsed()
+        intended_time = (frame - self.origin_frame) / self.fps
+        self.events.append((kind, frame, intended_time, self.frame_time, send_time, send_time - intended_time, argument))
+
+    def write_report(self):
+        import csv
+        import io
+        
+        self.active = False
+        lateness = sorted(event[5] * 1000 for event in self.events)
+        summary = (
+            f"# Events fired: {len(self.events)}, dropped frames: {self.dropped_frames}, missed events: {self.missed_events}\n"
+            f"# Lateness in ms, p50: {percentile(lateness, 50):.2f}, p95: {percentile(lateness, 95):.2f}, "
+            f"p99: {percentile(lateness, 99):.2f}, max: {lateness[-1] if lateness else 0:.2f}\n"
+        )
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(("kind", "intended_frame", "intended_time", "frame_time", "send_time", "lateness_ms", "argument"))
+        for kind, frame, intended_time, frame_time, send_time, late, argument in self.events:
+            writer.writerow((kind, frame, f"{intended_time:.4f}", f"{frame_time:.4f}", f"{send_time:.4f}", f"{late * 1000:.2f}", argument))
+        
+        text_block = bpy.data.texts.get(self.report_name) or bpy.data.texts.new(name=self.report_name)
+        text_block.clear()
+        text_block.write("# Alva trigger timing report\n" + summary + buffer.getvalue())
+        print("Trigger timing:", summary.replace("# ", "").replace("\n", " "))
+
+
 class PlaybackMonitor:
     def __init__(self):
         self.last_frame = -1
         self.is_playing_back = False
+        self.timing_recorder = TriggerTimingRecorder()
 
     @persistent
     def frame_change_handler(self, scene, depsgraph):
         current_frame = scene.frame_current
+        previous_frame = self.last_frame
+        recorder = self.timing_recorder
+        
+        if recorder.active:
+            recorder.frame_entered(current_frame)
 
         if abs(current_frame - self.last_frame) > 1 and self.last_frame != -1:
+            # Short forward jumps while recording are frames Blender dropped, anything else is a scrub.
+            if recorder.active and 1 < current_frame - previous_frame <= recorder.fps:
+                recorder.frames_skipped(range(previous_frame + 1, current_frame), (self.start_mapping, self.offset_start_mapping, self.end_mapping))
+            elif recorder.active:
+                recorder.rebase(current_frame)
+                
             self.on_scrub_detected(current_frame)
             
         self.last_frame = current_frame
@@ -250,18 +492,24 @@ class PlaybackMonitor:
             if frame in self.start_mapping:
                 for trigger_prefix, osc_trigger in self.start_mapping[frame]:
                     fire_start(trigger_prefix, osc_trigger, frame)
+                    if recorder.active:
+                        recorder.record("start", frame, osc_trigger)
                     
             if frame in self.offset_start_mapping:
                 for item in self.offset_start_mapping[frame]:
                     try:
                         trigger_prefix, osc_trigger = item
                         fire_offset_start(trigger_prefix, osc_trigger, frame)
+                        if recorder.active:
+                            recorder.record("offset", frame, osc_trigger)
                     except ValueError:
                         print("Error.")
                         
             if frame in self.end_mapping:
                 for trigger_prefix, osc_trigger_end in self.end_mapping[frame]:
                     fire_end(trigger_prefix, osc_trigger_end, frame) 
+                    if recorder.active:
+                        recorder.record("end", frame, osc_trigger_end)
 
     @persistent
     def on_scrub_detected(self, current_frame):
@@ -291,6 +539,10 @@ class PlaybackMonitor:
     @persistent           
     def playback_start_handler(self, scene, depsgraph):
         self.is_playing_back = True
+        
+        # The console may have been touched since the last send, so the first frame sends everything.
+        animation_output_cache.clear()
+        animation_output_clock.start(scene)
 
         # Abort if unarmed
         if not scene.is_armed_osc:
@@ -308,6 +560,9 @@ class PlaybackMonitor:
         self.start_mapping = get_trigger_start_map(scene)
         self.offset_start_mapping = get_trigger_offset_start_map(scene)
         self.end_mapping = get_trigger_end_map(scene)
+        
+        if scene.record_trigger_timing:
+            self.timing_recorder.start(scene)
              
         # Go timecode sync.    
         if scene.sync_timecode:
@@ -350,8 +605,12 @@ class PlaybackMonitor:
     @persistent
     def playback_stop_handler(self, scene, depsgraph):
         self.is_playing_back = False
+        animation_output_clock.stop()
         scene = bpy.context.scene
         
+        if self.timing_recorder.active:
+            self.timing_recorder.write_report()
+        
         # Go house up.
         if scene.house_up_on_stop == True:
             ip_address = scene.scene_props.str_osc_ip_address
@@ -385,21 +644,810 @@ class PlaybackMonitor:
 playback_monitor = PlaybackMonitor()
 
 
+animation_parameters = ("osc_intensity", "osc_color", "osc_pan", "osc_tilt", "osc_zoom", "osc_iris")
+animation_data_path = re.compile(r'^sequence_editor\.sequences_all\["(.+)"\]\.(osc_\w+)$')
+
+
+# Per F-curve float32 samples over the owning strip's frames, filled in the background so scrubbing is an array lookup.
+class AnimationSampleCache:
+    time_budget = 0.004  # Seconds of sampling per timer tick, keeps the UI responsive.
+    
+    def __init__(self):
+        self.samples = {}
+        self.pending = []
+        self.filling = False
+
+    @staticmethod
+    def fingerprint(fcurve, first_frame, last_frame):
+        keyframe_points = fcurve.keyframe_points
+        count = len(keyframe_points)
+        coordinates = np.empty(count * 9, dtype=np.float32)
+        keyframe_points.foreach_get("co", coordinates[:count * 2])
+        keyframe_points.foreach_get("handle_left", coordinates[count * 2:count * 4])
+        keyframe_points.foreach_get("handle_right", coordinates[count * 4:count * 6])
+        keyframe_points.foreach_get("back", coordinates[count * 6:count * 7])
+        keyframe_points.foreach_get("amplitude", coordinates[count * 7:count * 8])
+        keyframe_points.foreach_get("period", coordinates[count * 8:])
+        modes = tuple((point.interpolation, point.easing) for point in keyframe_points)
+        return hash((coordinates.tobytes(), modes, fcurve.extrapolation, first_frame, last_frame))
+
+    def request(self, key, fcurve, first_frame, last_frame):
+        """Queues the curve for sampling unless the stored samples still match it."""
+        if len(fcurve.modifiers):
+            # Modifier settings are too varied to fingerprint, so these curves are always evaluated live.
+            self.samples.pop(key, None)
+            return
+        
+        fingerprint = self.fingerprint(fcurve, first_frame, last_frame)
+        stored = self.samples.get(key)
+        if stored is not None and stored[0] == fingerprint:
+            return
+        
+        self.samples.pop(key, None)
+        self.pending.append([key, fcurve, fingerprint, first_frame, np.empty(last_frame - first_frame + 1, dtype=np.float32), 0])
+        
+        if not self.filling:
+            self.filling = True
+            bpy.app.timers.register(self.fill_step, first_interval=0.05)
+
+    def drop_pending(self):
+        # Pending work holds F-curve references that undo or edits may free.
+        self.pending = []
+
+    def fill_step(self):
+        deadline = time.perf_counter() + self.time_budget
+        
+        while self.pending and time.perf_counter() < deadline:
+            job = self.pending[0]
+            key, fcurve, fingerprint, first_frame, values, position = job
+            stop = min(len(values), position + 64)
+            for offset in range(position, stop):
+                values[offset] = fcurve.evaluate(first_frame + offset)
+            job[5] = stop
+            if stop == len(values):
+                self.samples[key] = (fingerprint, first_frame, values)
+                self.pending.pop(0)
+                
+        if self.pending:
+            return 0.01
+        self.filling = False
+        return None
+
+    def lookup(self, key, frame):
+        stored = self.samples.get(key)
+        if stored is None or frame != int(frame):
+            return None
+        fingerprint, first_frame, values = stored
+        offset = int(frame) - first_frame
+        if 0 <= offset < len(values):
+            return float(values[offset])
+        return None
+    
+    
+animation_sample_cache = AnimationSampleCache()
+
+
+# Collects the osc_* F-curves of animation strips once and evaluates them directly,
+# instead of poking every property through RNA so its update callback fires.
+class AnimationEvaluator:
+    def __init__(self):
+        self.tracks = None
+        self.events = []
+        self.event_frames = []
+        self.active = set()
+        self.cursor = 0
+        self.cursor_frame = None
+
+    def invalidate(self):
+        self.tracks = None
+
+    def build(self, scene):
+        curves = {}
+        animation_data = scene.animation_data
+        if animation_data and animation_data.action:
+            for fcurve in animation_data.action.fcurves:
+                match = animation_data_path.match(fcurve.data_path)
+                if match and match.group(2) in animation_parameters and not fcurve.mute:
+                    name = bpy.utils.unescape_identifier(match.group(1))
+                    curves.setdefault(name, {}).setdefault(match.group(2), {})[fcurve.array_index] = (fcurve, (fcurve.data_path, fcurve.array_index))
+
+        self.tracks = []
+        for strip in filter_animation_strips(scene.sequence_editor.sequences_all):
+            strip_curves = curves.get(strip.name, {})
+            if strip_curves or strip.use_paths:
+                statics = {parameter: getattr(strip, parameter) for parameter in animation_parameters}
+                statics["osc_color"] = tuple(strip.osc_color)
+                self.tracks.append((strip, strip_curves, statics))
+                
+                for channels in strip_curves.values():
+                    for fcurve, key in channels.values():
+                        animation_sample_cache.request(key, fcurve, int(strip.frame_start), int(strip.frame_final_end))
+                
+        # Sorted enter/exit events so the active set only changes when the playhead crosses a strip edge.
+        self.events = []
+        for index, (strip, curves, statics) in enumerate(self.tracks):
+            self.events.append((strip.frame_start, 1, index))
+            self.events.append((strip.frame_final_end + 1, -1, index))
+        self.events.sort()
+        self.event_frames = [event[0] for event in self.events]
+        self.active = set()
+        self.cursor = 0
+        self.cursor_frame = None
+
+    def update_active(self, frame):
+        from bisect import bisect_right
+        
+        if self.cursor_frame is None or frame < self.cursor_frame:
+            # Scrubbed backwards (or first frame), rebuild the set around the playhead.
+            self.cursor = bisect_right(self.event_frames, frame)
+            self.active = {
+                index for index, (strip, curves, statics) in enumerate(self.tracks)
+                if strip.frame_start <= frame <= strip.frame_final_end
+            }
+        else:
+            while self.cursor < len(self.events) and self.events[self.cursor][0] <= frame:
+                event_frame, kind, index = self.events[self.cursor]
+                if kind > 0:
+                    self.active.add(index)
+                else:
+                    self.active.discard(index)
+                self.cursor += 1
+                
+        self.cursor_frame = frame
+
+    def evaluate(self, scene, frame):
+        """Yields (strip, values) for every animation strip whose range covers the frame."""
+        if self.tracks is None:
+            self.build(scene)
+            
+        self.update_active(frame)
+            
+        for index in sorted(self.active):
+            strip, curves, statics = self.tracks[index]
+            values = dict(statics)
+            for parameter, channels in curves.items():
+                if parameter == "osc_color":
+                    color = list(values["osc_color"])
+                    for channel_index, (fcurve, key) in channels.items():
+                        color[channel_index] = self.sample(fcurve, key, frame)
+                    values["osc_color"] = tuple(color)
+                elif 0 in channels:
+                    fcurve, key = channels[0]
+                    values[parameter] = self.sample(fcurve, key, frame)
+                    
+            yield strip, values
+
+    @staticmethod
+    def sample(fcurve, key, frame):
+        value = animation_sample_cache.lookup(key, frame)
+        if value is None:
+            value = fcurve.evaluate(frame)
+        return value
+            
+            
+animation_evaluator = AnimationEvaluator()
+
+
+# Keyframe edits, strip edits, undo and file loads can all change or free what the evaluator holds on to.
 @persistent
-def frame_change_handler_animation(scene):
+def animation_evaluator_invalidate_handler(*args):
+    depsgraph = args[1] if len(args) > 1 else None
+    if depsgraph is None or depsgraph.id_type_updated('ACTION') or depsgraph.id_type_updated('SCENE'):
+        animation_evaluator.invalidate()
+        animation_sample_cache.drop_pending()
+
+
+def clamp(value, minimum, maximum):
+    return max(minimum, min(value, maximum))
+
+
+# Last value and send time per (strip, parameter), so flat stretches of animation cost no packets.
+class AnimationOutputCache:
+    def __init__(self):
+        self.last_sent = {}
+        self.last_seen = {}
+
+    def clear(self):
+        self.last_sent.clear()
+        self.last_seen.clear()
+
+    def remember(self, strip_name, parameter, value):
+        self.last_sent[(strip_name, parameter)] = (value, time.perf_counter())
+
+    def should_send(self, scene, strip_name, parameter, value, final=False):
+        """
+        :param final: The strip's last frame, which always goes out if it differs from what was sent.
+        """
+        now = time.perf_counter()
+        previous = self.last_sent.get((strip_name, parameter))
+        seen = self.last_seen.get((strip_name, parameter))
+        self.last_seen[(strip_name, parameter)] = value
+        
+        if previous is not None:
+            last_value, last_time = previous
+            deadband = max(scene.animation_deadband_absolute, abs(last_value) * scene.animation_deadband_relative / 100)
+            refresh_interval = scene.animation_refresh_interval
+            is_due = refresh_interval and now - last_time >= refresh_interval
+            # Without a refresh, a value that stops moving inside the deadband would never be sent.
+            is_settled = not refresh_interval and value == seen
+            if abs(value - last_value) <= deadband and not is_due and not ((final or is_settled) and value != last_value):
+                return False
+            
+        self.last_sent[(strip_name, parameter)] = (value, now)
+        return True
+
+
+animation_output_cache = AnimationOutputCache()
+
+
+# Recording wants every change, however small, so only exact repeats are dropped.
+class ExactOutputCache(AnimationOutputCache):
+    def should_send(self, scene, strip_name, parameter, value, final=False):
+        previous = self.last_sent.get((strip_name, parameter))
+        if previous is not None and previous[0] == value:
+            return False
+        self.remember(strip_name, parameter, value)
+        return True
+
+
+# Emitters each fixture type mixes color with, in the order the LUTs store them.
+emitter_models = {
+    'option_rgbw': ("red", "green", "blue", "white"),
+    'option_rgba': ("red", "green", "blue", "amber"),
+    'option_rgbal': ("red", "green", "blue", "amber", "lime"),
+    'option_cmy': ("cyan", "magenta", "yellow"),
+}
+color_lut_size = 33
+color_luts = {}
+
+
+emitter_model_items = (
+    ('option_rgb', "RGB", "Send red, green and blue as they are"),
+    ('option_rgbw', "RGBW", "Pull the shared white out of red, green and blue into a white emitter"),
+    ('option_rgba', "RGBA", "Pull warm tones into an amber emitter"),
+    ('option_rgbal', "RGBAL", "Pull warm tones into amber and yellow-greens into a lime emitter"),
+    ('option_cmy', "CMY", "Subtractive cyan, magenta and yellow flags"),
+)
+
+
+def solve_emitters(model, rgb):
+    """Emitter levels (0-1) for an array of RGB colors shaped (..., 3). Only used to build the LUTs."""
+    red, green, blue = (rgb[..., i].copy() for i in range(3))
+    emitters = emitter_models[model]
+    
+    if model == 'option_cmy':
+        return np.stack((1 - red, 1 - green, 1 - blue), axis=-1)
+    
+    levels = {}
+    if "white" in emitters:
+        levels["white"] = np.minimum(np.minimum(red, green), blue)
+        red -= levels["white"]
+        green -= levels["white"]
+        blue -= levels["white"]
+    # Amber is treated as (1, 0.5, 0) and lime as (0.5, 1, 0). Like white, they only take what's left over
+    # above the neutral part (blue), so white stays on red, green and blue and only warm tones move over.
+    warm_red = np.maximum(red - blue, 0)
+    warm_green = np.maximum(green - blue, 0)
+    if "lime" in emitters:
+        # Split the warm part between the two by hue. Between their hues it's all amber and lime,
+        # past either one that emitter takes as much as it can and red or green keeps the rest.
+        levels["amber"] = np.maximum(np.minimum((warm_red * 4 - warm_green * 2) / 3, warm_green * 2), 0)
+        levels["lime"] = np.maximum(np.minimum((warm_green * 4 - warm_red * 2) / 3, warm_red * 2), 0)
+    elif "amber" in emitters:
+        levels["amber"] = np.minimum(warm_red, warm_green * 2)
+    if "amber" in emitters:
+        red -= levels["amber"] + levels.get("lime", 0) / 2
+        green -= levels["amber"] / 2 + levels.get("lime", 0)
+        
+    levels.update(red=red, green=green, blue=blue)
+    return np.clip(np.stack([levels[emitter] for emitter in emitters], axis=-1), 0, 1)
+
+
+def get_color_lut(model):
+    lut = color_luts.get(model)
+    if lut is None:
+        axis = np.linspace(0, 1, color_lut_size)
+        grid = np.stack(np.meshgrid(axis, axis, axis, indexing='ij'), axis=-1)
+        lut = solve_emitters(model, grid).astype(np.float32)
+        color_luts[model] = lut
+    return lut
+
+
+def apply_color_lut(lut, colors):
+    """Trilinear LUT lookup for an (N, 3) array of RGB colors, returns (N, emitters)."""
+    size = lut.shape[0] - 1
+    scaled = np.clip(np.asarray(colors, dtype=np.float32), 0, 1) * size
+    low = np.minimum(scaled.astype(np.int64), size - 1)
+    fraction = scaled - low
+    result = np.zeros((len(scaled), lut.shape[-1]), dtype=np.float32)
+    
+    for corner in range(8):
+        offsets = ((corner >> 2) & 1, (corner >> 1) & 1, corner & 1)
+        weight = np.ones(len(scaled), dtype=np.float32)
+        for axis, offset in enumerate(offsets):
+            weight *= fraction[:, axis] if offset else 1 - fraction[:, axis]
+        result += weight[:, None] * lut[low[:, 0] + offsets[0], low[:, 1] + offsets[1], low[:, 2] + offsets[2]]
+        
+    return result
+
+
+def convert_strip_colors(evaluated_strips):
+    """Emitter percentages for every multi-emitter strip this frame, one LUT pass per model."""
+    by_model = {}
+    for strip, values in evaluated_strips:
+        if strip.color_emitter_model != 'option_rgb':
+            by_model.setdefault(strip.color_emitter_model, []).append((strip.name, values["osc_color"]))
+            
+    converted = {}
+    for model, entries in by_model.items():
+        levels = apply_color_lut(get_color_lut(model), [color for name, color in entries])
+        for (name, color), row in zip(entries, levels):
+            converted[name] = {emitter: round(float(level) * 100, 1) for emitter, level in zip(emitter_models[model], row)}
+            
+    return converted
+
+
+def get_emitter_prefix(strip, emitter):
+    # Extra emitters follow the red prefix, so "/eos/chan/5/param/red" gives "/eos/chan/5/param/white".
+    prefix = {"red": strip.red_prefix, "green": strip.green_prefix, "blue": strip.blue_prefix}.get(emitter)
+    if prefix is None and strip.red_prefix.endswith("red"):
+        prefix = strip.red_prefix[:-3] + emitter
+    return prefix
+
+
+def get_color_palette_commands(scene):
+    red, green, blue = (round(value * 100, 1) for value in scene.color_palette_color)
+    selection = "Chan 1 thru thru 1000"
+    levels = {"Red": red, "Green": green, "Blue": blue, "Amber": 0, "Mint": 0, "White": 100 if red + green + blue == 300 else 0}
+    return [f"{selection} {keyword} {level} Enter" for keyword, level in levels.items()]
+
+
+# Output stage: turns evaluated values into the same OSC strings the per-property updaters send.
+def get_animation_messages(scene, strip, values, light_rotations=None, emitter_levels=None, output_cache=None):
+    messages = []
+    if output_cache is None:
+        output_cache = animation_output_cache
+    
+    # Prefixes still holding * only make sense when the strip says which channels the * stands for.
+    allows_wildcard = bool(strip.animation_channels)
+    # The strip's last frame is where a fade ends, so it's sent even inside the deadband.
+    final = scene.frame_current >= strip.frame_final_end - 1
+    
+    def add(prefix, parameter, value):
+        if prefix and ('*' not in prefix or allows_wildcard) and output_cache.should_send(scene, strip.name, parameter, value, final):
+            messages.append((prefix, parameter, str(value)))
+
+    add(strip.intensity_prefix, "intensity", clamp(values["osc_intensity"], 0, 100))
+
+    if strip.color_emitter_model == 'option_rgb':
+        red, green, blue = (round(clamp(value, 0, 1) * 100, 1) for value in values["osc_color"])
+        add(strip.red_prefix, "red", red)
+        add(strip.green_prefix, "green", green)
+        add(strip.blue_prefix, "blue", blue)
+    else:
+        if emitter_levels is None:
+            emitter_levels = convert_strip_colors([(strip, values)])
+        for emitter, level in emitter_levels.get(strip.name, {}).items():
+            add(get_emitter_prefix(strip, emitter), emitter, level)
+    
+    if strip.use_paths:
+        if light_rotations is None:
+            tilt_value, pan_value = get_light_rotation_degrees(str(strip.selected_light))
+        else:
+            tilt_value, pan_value = light_rotations.get(str(strip.selected_light), (None, None))
+        if tilt_value is not None and pan_value is not None:
+            add(strip.pan_prefix, "pan", round(pan_value, 1))
+            add(strip.tilt_prefix, "tilt", round(tilt_value, 1))
+    else:
+        add(strip.pan_prefix, "pan", clamp(values["osc_pan"], -360, 360))
+        add(strip.tilt_prefix, "tilt", clamp(values["osc_tilt"], -360, 360))
+        
+    add(strip.zoom_prefix, "zoom", clamp(values["osc_zoom"], 1, max_zoom))
+    add(strip.iris_prefix, "iris", clamp(values["osc_iris"], 1, 100))
+    
+    return messages
+
+
+eos_target_prefix = re.compile(r'^/?eos/(chan|group)/(\d+(?:\.\d+)?)(?:/param/(\w+))?$')
+eos_parameter_keywords = {
+    None: "At",
+    "red": "Red",
+    "green": "Green",
+    "blue": "Blue",
+    "white": "White",
+    "amber": "Amber",
+    "lime": "Lime",
+    "cyan": "Cyan",
+    "magenta": "Magenta",
+    "yellow": "Yellow",
+    "pan": "Pan",
+    "tilt": "Tilt",
+    "zoom": "Zoom",
+    "iris": "Iris",
+    "edge": "Edge",
+}
+
+
+def batch_eos_commands(messages):
+    """
+    Folds (prefix, parameter, argument) messages aimed at the same Eos channel or group
+    into one command line each, like "Chan 5 Red 40 Green 10 Pan 30 Enter".
+    
+    :return: Tuple of the command lines and the (prefix, argument) messages that can't be expressed that way.
+    """
+    targets = {}
+    leftovers = []
+    
+    for prefix, parameter, argument in messages:
+        match = eos_target_prefix.match(prefix)
+        keyword = eos_parameter_keywords.get(match.group(3)) if match else None
+        if keyword is None:
+            leftovers.append((prefix, argument))
+            continue
+        targets.setdefault((match.group(1), match.group(2)), {})[keyword] = argument
+        
+    commands = []
+    for (kind, number), parameters in targets.items():
+        words = ["Chan" if kind == "chan" else "Group", number]
+        for keyword, argument in parameters.items():
+            words.extend((keyword, argument))
+        commands.append(" ".join(words) + " Enter")
+        
+    return commands, leftovers
+
+
+eos_wildcard_prefix = re.compile(r'^/?eos/\*(?:/param/(\w+))?$')
+
+
+# Parsed animation_channels strings, so wildcard strips don't re-run the regexes every frame.
+channel_set_cache = {}
+
+
+def get_strip_channels(strip):
+    channels = channel_set_cache.get(strip.animation_channels)
+    if channels is None:
+        try:
+            channels = tuple(sorted(set(parse_channels(strip.animation_channels))))
+        except ValueError:
+            # Half-typed, like "a thru 5". Cached as no channels so this strip's wildcards are skipped without stopping the others.
+            print("Can't read the channels", repr(strip.animation_channels), "on", strip.name)
+            channels = ()
+        channel_set_cache[strip.animation_channels] = channels
+    return channels
+
+
+def compact_channel_expression(channels):
+    """
+    Shortest Eos selection for a set of channels, using Thru for runs and Offset for
+    evenly spaced runs, e.g. [1, 2, 3, 4, 10, 12, 14] -> "1 Thru 4 + 10 Thru 14 Offset 2".
+    """
+    channels = sorted(set(channels))
+    parts = []
+    i = 0
+    
+    while i < len(channels):
+        j = i + 1
+        if j < len(channels):
+            step = channels[j] - channels[i]
+            while j + 1 < len(channels) and channels[j + 1] - channels[j] == step:
+                j += 1
+            run_length = j - i + 1
+            if step == 1 or run_length >= 3:
+                offset = "" if step == 1 else f" Offset {step}"
+                parts.append(f"{channels[i]} Thru {channels[j]}{offset}")
+                i = j + 1
+                continue
+        parts.append(str(channels[i]))
+        i += 1
+        
+    return " + ".join(parts)
+
+
+def expand_wildcard_messages(channels, messages):
+    """
+    Turns (prefix, parameter, argument) messages whose prefix holds * into a single command line
+    for the whole channel set, plus per-channel messages for parameters the command line can't express.
+    
+    :return: Tuple of the command lines and the expanded (prefix, argument) messages.
+    """
+    keywords = {}
+    leftovers = []
+    
+    for prefix, parameter, argument in messages:
+        match = eos_wildcard_prefix.match(prefix)
+        keyword = eos_parameter_keywords.get(match.group(1)) if match else None
+        if keyword is not None:
+            keywords[keyword] = argument
+            continue
+        target = "chan/{}" if prefix.lstrip("/").startswith("eos/") else "{}"
+        leftovers.extend((prefix.replace("*", target.format(channel)), argument) for channel in channels)
+        
+    commands = []
+    if keywords and channels:
+        words = ["Chan", compact_channel_expression(channels)]
+        for keyword, argument in keywords.items():
+            words.extend((keyword, argument))
+        commands.append(" ".join(words) + " Enter")
+        
+    return commands, leftovers
+
+
+def get_animation_frame_packets(scene, evaluated_strips, light_rotations=None, output_cache=None):
+    """
+    Everything one frame of animation sends, as (address, argument) messages and
+    (None, [(address, argument), ...]) bundles, following the scene's batching mode.
+    """
+    batching = scene.animation_batching
+    
+    if light_rotations is None:
+        light_rotations = get_light_rotations_degrees(str(strip.selected_light) for strip, values in evaluated_strips if strip.use_paths)
+    emitter_levels = convert_strip_colors(evaluated_strips)
+    packets = []
+    strip_messages = []
+    
+    for strip, values in evaluated_strips:
+        messages = get_animation_messages(scene, strip, values, light_rotations, emitter_levels, output_cache)
+        
+        # Wildcard prefixes drive the whole channel set in one command line, or one bundle for what can't be a command.
+        wildcard_messages = [message for message in messages if '*' in message[0]]
+        if wildcard_messages:
+            messages = [message for message in messages if '*' not in message[0]]
+            commands, leftovers = expand_wildcard_messages(get_strip_channels(strip), wildcard_messages)
+            packets.extend(("/eos/newcmd", command) for command in commands)
+            if leftovers:
+                packets.append((None, leftovers))
+                
+        strip_messages.append(messages)
+    
+    if batching == 'option_bundle':
+        for messages in strip_messages:
+            if messages:
+                packets.append((None, [(prefix, argument) for prefix, parameter, argument in messages]))
+                
+    elif batching == 'option_command':
+        # Strips sharing a channel can be folded into one command line, later strips win on conflicts.
+        if scene.animation_batch_shared_channels:
+            strip_messages = [[message for messages in strip_messages for message in messages]]
+        for messages in strip_messages:
+            commands, leftovers = batch_eos_commands(messages)
+            packets.extend(("/eos/newcmd", command) for command in commands)
+            packets.extend(leftovers)
+                
+    else:
+        for messages in strip_messages:
+            packets.extend((prefix, argument) for prefix, parameter, argument in messages)
+            
+    return packets
+
+
+def send_osc_packet(packet, ip_address, port):
+    address, argument = packet
+    if address is None:
+        send_osc_bundle(argument, ip_address, port)
+    else:
+        send_osc_string(address, ip_address, port, argument)
+
+
+def send_animation_frame(scene, evaluated_strips):
+    ip_address = scene.scene_props.str_osc_ip_address
+    port = scene.scene_props.int_osc_port
+    
+    for packet in get_animation_frame_packets(scene, evaluated_strips):
+        send_osc_packet(packet, ip_address, port)
+
+
+def sample_strip_values(scene, strip, frames):
+    """Evaluates one animation strip's F-curves at each frame straight from the action, without moving the playhead."""
+    statics = {parameter: getattr(strip, parameter) for parameter in animation_parameters}
+    statics["osc_color"] = tuple(strip.osc_color)
+    
+    curves = []
+    animation_data = scene.animation_data
+    if animation_data and animation_data.action:
+        for fcurve in animation_data.action.fcurves:
+            match = animation_data_path.match(fcurve.data_path)
+            if match and match.group(2) in animation_parameters and not fcurve.mute and bpy.utils.unescape_identifier(match.group(1)) == strip.name:
+                curves.append((match.group(2), fcurve))
+                
+    samples = []
+    for frame in frames:
+        values = dict(statics)
+        color = list(values["osc_color"])
+        for parameter, fcurve in curves:
+            if parameter == "osc_color":
+                color[fcurve.array_index] = fcurve.evaluate(frame)
+            elif fcurve.array_index == 0:
+                values[parameter] = fcurve.evaluate(frame)
+        values["osc_color"] = tuple(color)
+        samples.append(values)
+    return samples
+
+
+def sample_qmeo_looks(scene, strip, frames):
+    """(values, light rotations) for each frame of a qmeo, worked out up front without moving the playhead."""
+    light_tilt_pan = sample_light_tilt_pan(scene, str(strip.selected_light), frames) if strip.use_paths else {}
+    light_name = str(strip.selected_light)
+    return [(values, {light_name: light_tilt_pan[frame]} if frame in light_tilt_pan else {})
+            for frame, values in zip(frames, sample_strip_values(scene, strip, frames))]
+
+
+def get_qmeo_look_matrix(looks):
+    """(frames, parameters) array of what each look sends, on the console's own scales, for measuring simplification error."""
+    rows = []
+    for values, light_rotations in looks:
+        tilt, pan = next(iter(light_rotations.values()), (values["osc_tilt"], values["osc_pan"]))
+        red, green, blue = (value * 100 for value in values["osc_color"])
+        rows.append((values["osc_intensity"], red, green, blue, pan, tilt, values["osc_zoom"], values["osc_iris"]))
+    return np.array(rows, dtype=np.float64).reshape(len(rows), -1)
+
+
+def simplify_keyframes(samples, tolerance):
+    """
+    Ramer-Douglas-Peucker over a (frames, parameters) array. Keeps the fewest frames such that
+    fading linearly between kept frames never misses any parameter by more than tolerance.
+    
+    :return: Sorted indices of the frames to keep, always including the first and last.
+    """
+    samples = np.asarray(samples, dtype=np.float64).reshape(len(samples), -1)
+    count = len(samples)
+    if count <= 2 or tolerance <= 0:
+        return list(range(count))
+    
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        position = (np.arange(first + 1, last) - first) / (last - first)
+        line = samples[first] + position[:, None] * (samples[last] - samples[first])
+        error = np.abs(samples[first + 1:last] - line).max(axis=1)
+        worst = int(error.argmax())
+        if error[worst] > tolerance:
+            split = first + 1 + worst
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+            
+    return np.flatnonzero(keep).tolist()
+
+
+def get_eos_record_selection(strip, messages):
+    """
+    Channel and group selection touched by (prefix, parameter, argument) messages, like "Chan 1 Thru 4 + Group 3".
+    None if any prefix isn't an Eos channel or group, since then only a full record is safe.
+    """
+    channels = set()
+    others = []
+    for prefix, parameter, argument in messages:
+        if eos_wildcard_prefix.match(prefix):
+            channels.update(get_strip_channels(strip))
+            continue
+        match = eos_target_prefix.match(prefix)
+        if match is None:
+            return None
+        kind, number = match.group(1), match.group(2)
+        if kind == "chan" and number.isdigit():
+            channels.add(int(number))
+        elif (kind, number) not in others:
+            others.append((kind, number))
+            
+    parts = [f"Chan {compact_channel_expression(channels)}"] if channels else []
+    parts += [("Chan " if kind == "chan" else "Group ") + number for kind, number in others]
+    return " + ".join(parts)
+
+
+def get_qmeo_fingerprints(strip, frames, looks):
+    """Hash of what each frame would record, {frame: hash}, stored after a bake so re-records can skip unchanged frames."""
+    setup = "|".join((strip.intensity_prefix, strip.red_prefix, strip.green_prefix, strip.blue_prefix, strip.pan_prefix,
+                      strip.tilt_prefix, strip.zoom_prefix, strip.iris_prefix, strip.color_emitter_model, strip.animation_channels)).encode()
+    matrix = np.round(get_qmeo_look_matrix(looks), 1) + 0.0  # Adding 0.0 folds -0.0 into 0.0 so it hashes the same.
+    return {str(frame): hashlib.sha1(setup + row.tobytes()).hexdigest()[:16] for frame, row in zip(frames, matrix)}
+
+
+def get_qmeo_record_packets(scene, strip, frames, looks=None, record_delay=0.1, delta=False, record_all_touched=False):
+    """
+    Paced packets that set each look live and record it as cue <list>/<frame>, as (address, argument, delay) tuples.
+    In delta mode each cue only records the channels that changed since the last one, and frames
+    where nothing changed aren't recorded at all. With record_all_touched, delta cues record every
+    channel the strip drives instead, for re-recording cues whose neighbours aren't re-recorded with them.
+    
+    :param looks: Output of sample_qmeo_looks for these frames, sampled here if not given.
+    :return: The packets and the frames that got a cue.
+    """
+    if looks is None:
+        looks = sample_qmeo_looks(scene, strip, frames)
+    output_cache = ExactOutputCache()
+    change_cache = ExactOutputCache()
+    cue_list = str(strip.animation_cue_list_number)
+    
+    packets = []
+    recorded_frames = []
+    for frame, (values, light_rotations) in zip(frames, looks):
+        record = "Record " + cue_list + " / " + str(frame) + " Enter Enter"
+        if delta:
+            changes = get_animation_messages(scene, strip, values, light_rotations, None, ExactOutputCache() if record_all_touched else change_cache)
+            if not changes:
+                continue
+            selection = get_eos_record_selection(strip, changes)
+            if selection:
+                record = selection + " Record_Only " + cue_list + " / " + str(frame) + " Enter Enter"
+                
+        for packet in get_animation_frame_packets(scene, [(strip, values)], light_rotations, output_cache):
+            packets.append(packet + (0,))
+        packets.append(("/eos/newcmd", record, record_delay))
+        recorded_frames.append(frame)
+    return packets, recorded_frames
+
+
+# Streams animation on its own timer during playback so output rate doesn't depend on the scene's fps.
+class AnimationOutputClock:
+    def __init__(self):
+        self.running = False
+        self.fps = 1
+        self.anchor_time = 0
+        self.anchor_frame = 0
+        # Timers are matched by identity, and every self.tick lookup makes a new bound method.
+        self.tick_function = self.tick
+
+    def start(self, scene):
+        if self.running or not scene.animation_output_rate:
+            return
+        self.fps = get_frame_rate(scene)
+        self.mark_frame(scene.frame_current)
+        self.running = True
+        if not bpy.app.timers.is_registered(self.tick_function):
+            bpy.app.timers.register(self.tick_function, first_interval=0)
+
+    def stop(self):
+        self.running = False
+        if bpy.app.timers.is_registered(self.tick_function):
+            bpy.app.timers.unregister(self.tick_function)
+
+    def mark_frame(self, frame):
+        self.anchor_time = time.perf_counter()
+        self.anchor_frame = frame
+
+    def sample_frame(self):
+        # Interpolate between playhead ticks, but never run more than a frame ahead of Blender.
+        elapsed_frames = (time.perf_counter() - self.anchor_time) * self.fps
+        return self.anchor_frame + min(elapsed_frames, 1)
+
+    def tick(self):
+        scene = bpy.context.scene
+        if not self.running or scene is None or not scene.animation_output_rate:
+            self.running = False
+            return None
+        
+        if scene.sequence_editor and scene.is_armed_osc:
+            frame = self.sample_frame()
+            send_animation_frame(scene, list(animation_evaluator.evaluate(scene, frame)))
+            
+        return 1 / scene.animation_output_rate
+    
+    
+animation_output_clock = AnimationOutputClock()
+
+
+# Runs after evaluation so followed lights are read for this frame, not the last one.
+@persistent
+def frame_change_handler_animation(scene, depsgraph=None):
     if not scene.sequence_editor:
         return
+    
+    if not bpy.context.screen or not scene.is_armed_osc:
+        return
 
-    sequences = scene.sequence_editor.sequences_all
-
-    for seq in sequences:
-        if isinstance(seq, bpy.types.ColorSequence):
-            seq.osc_intensity = seq.osc_intensity
-            seq.osc_color = seq.osc_color
-            seq.osc_pan = seq.osc_pan
-            seq.osc_tilt = seq.osc_tilt
-            seq.osc_zoom = seq.osc_zoom
-            seq.osc_iris = seq.osc_iris
+    frame = scene.frame_current
+    
+    # While the output clock runs, frame changes only re-anchor it.
+    if animation_output_clock.running:
+        animation_output_clock.mark_frame(frame)
+        return
+    
+    send_animation_frame(scene, list(animation_evaluator.evaluate(scene, frame)))
 
 
 # Allows real-time updating so you can see what you're doing 
@@ -419,12 +1467,6 @@ def osc_intensity_update(self, context):
         if '*' in self.intensity_prefix:
             return
         
-        if not hasattr(self, "intensity_checker"):
-            self.intensity_checker = 1000
-            
-        if self.intensity_checker == self.osc_intensity:
-            return
-        
         if self.mute:
             return
         
@@ -440,8 +1482,7 @@ def osc_intensity_update(self, context):
         
         osc_intensity_str = str(self.osc_intensity)
         send_osc_string(intensity_prefix, ip_address, port, osc_intensity_str)
-        
-        self.intensity_checker = self.osc_intensity
+        animation_output_cache.remember(self.name, "intensity", self.osc_intensity)
 
         
 def osc_color_update(self, context):
@@ -485,6 +1526,10 @@ def osc_color_update(self, context):
         osc_blue_str = str(blue_value)
         send_osc_string(blue_prefix, ip_address, port, osc_blue_str)
         
+        animation_output_cache.remember(self.name, "red", red_value)
+        animation_output_cache.remember(self.name, "green", green_value)
+        animation_output_cache.remember(self.name, "blue", blue_value)
+        
         
 def osc_pan_update(self, context):
     scene = context.scene
@@ -520,12 +1565,14 @@ def osc_pan_update(self, context):
                 return
             
             pan = round(pan_value, 1)
+            animation_output_cache.remember(self.name, "pan", pan)
             pan = str(pan)
             
             send_osc_string(pan_prefix, ip_address, port, pan)
         else:
             osc_pan_str = str(osc_pan)
             send_osc_string(pan_prefix, ip_address, port, osc_pan_str)
+            animation_output_cache.remember(self.name, "pan", osc_pan)
 
     
 def osc_tilt_update(self, context):
@@ -562,11 +1609,13 @@ def osc_tilt_update(self, context):
                 return
 
             tilt = round(tilt_value, 1)
+            animation_output_cache.remember(self.name, "tilt", tilt)
             tilt = str(tilt)
             send_osc_string(tilt_prefix, ip_address, port, tilt)
         else:
             osc_tilt_str = str(osc_tilt)
             send_osc_string(tilt_prefix, ip_address, port, osc_tilt_str)
+            animation_output_cache.remember(self.name, "tilt", osc_tilt)
 
     
 def osc_zoom_update(self, context):
@@ -595,6 +1644,7 @@ def osc_zoom_update(self, context):
         
         osc_zoom_str = str(osc_zoom)
         send_osc_string(zoom_prefix, ip_address, port, osc_zoom_str)
+        animation_output_cache.remember(self.name, "zoom", osc_zoom)
         
         
 def osc_iris_update(self, context):
@@ -623,6 +1673,425 @@ def osc_iris_update(self, context):
         
         osc_iris_str = str(osc_iris)
         send_osc_string(iris_prefix, ip_address, port, osc_iris_str)
+        animation_output_cache.remember(self.name, "iris", osc_iris)
+
+
+def collect_render_events(scene):
+    """(frame, action) for every macro, cue and flash event Render Strips sends, in event number order."""
+    all_maps = [
+        (get_start_macro_map(scene), "Macro"),
+        (get_end_macro_map(scene), "Macro"),
+        (get_start_flash_macro_map(scene), "Macro"),
+        (get_end_flash_macro_map(scene), "Macro"),
+        (get_cue_map(scene), "Cue")
+    ]
+    
+    events = []
+    for action_map, description in all_maps:
+        for frame in action_map:
+            for label, index in action_map[frame]:
+                events.append((frame, f"{description} {index}"))
+    return events
+
+
+def get_render_events(scene):
+    fps = get_frame_rate(scene)
+    return [(frame_to_timecode(None, frame, fps), action) for frame, action in collect_render_events(scene)]
+
+
+def partition_render_events(scene):
+    """
+    Splits every event in one scan by the timecode sound strip whose range holds it.
+    Events outside every song are left out.
+    
+    :return: Dict of event list number to [(timecode, action), ...].
+    """
+    fps = get_frame_rate(scene)
+    clocks = sorted(((strip.frame_start, strip.frame_final_end, strip.song_timecode_clock_number) for strip in scene.sequence_editor.sequences
+                     if strip.type == 'SOUND' and not strip.mute and getattr(strip, 'song_timecode_clock_number', 0) != 0))
+    clock_starts = [start for start, end, event_list in clocks]
+    
+    partitions = {event_list: [] for start, end, event_list in clocks}
+    for frame, action in collect_render_events(scene):
+        # Latest song starting at or before the frame that still runs, same as find_relevant_clock picks under the playhead.
+        for index in range(bisect.bisect_right(clock_starts, frame) - 1, -1, -1):
+            start, end, event_list = clocks[index]
+            if frame < end:
+                partitions[event_list].append((frame_to_timecode(None, frame, fps), action))
+                break
+    return partitions
+
+
+def get_render_packets(scene, event_list, full, commands, deletions):
+    """The /eos/newcmd arguments that bring one event list up to date, packed to the scene's byte budget."""
+    packets = []
+    if full:
+        packets.append(f"Delete Event {event_list} / Enter Enter")
+        packets.append(f"Event {event_list} / Enter Enter")
+    packets += pack_console_commands(deletions, scene.console_command_byte_budget, scene.osc_datagram_mtu)
+    packets += pack_console_commands(commands, scene.console_command_byte_budget, scene.osc_datagram_mtu)
+    return [("/eos/newcmd", argument) for argument in packets]
+
+
+# Every OSC datagram and pacing wait goes through osc_transport, so a dry run can record them instead.
+class OscTransport:
+    def __init__(self):
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.plan = None
+        self.muted = 0
+        
+    @property
+    def recording(self):
+        return self.plan is not None
+        
+    def sendto(self, data, target):
+        if self.muted:
+            return
+        if self.plan is not None:
+            self.plan.record(data)
+        else:
+            self.sock.sendto(data, target)
+            
+    def sleep(self, seconds):
+        if self.plan is not None:
+            self.plan.elapsed += seconds
+        else:
+            time.sleep(seconds)
+            
+    def clock(self):
+        return self.plan.elapsed if self.plan is not None else time.perf_counter()
+    
+    def schedule(self, job):
+        if self.plan is not None:
+            self.plan.run(job)
+        else:
+            bpy.app.timers.register(job.tick)
+
+
+class CommandPlan:
+    """
+    Everything a dry run would have sent, in order, as (seconds from start, address, argument, bytes).
+    Bundles have an address of None and a list of (address, argument) as their argument, like OscSendJob packets.
+    """
+    def __init__(self, name=""):
+        self.name = name
+        self.commands = []
+        self.elapsed = 0.0
+        self.result = None
+        
+    def record(self, data):
+        if data.startswith(b"#bundle\0"):
+            address, argument, offset = None, [], 16
+            while offset < len(data):
+                size = int.from_bytes(data[offset:offset + 4], "big")
+                element_address, element_arguments = parse_osc_message(data[offset + 4:offset + 4 + size])
+                argument.append((element_address, element_arguments[0] if len(element_arguments) == 1 else element_arguments))
+                offset += 4 + size
+        else:
+            address, arguments = parse_osc_message(data)
+            argument = arguments[0] if len(arguments) == 1 else arguments
+        self.commands.append((self.elapsed, address, argument, len(data)))
+        
+    def run(self, job):
+        # Drains a background job right away, adding up the waits its timer would have made.
+        # Its on_finish is skipped since that's where jobs remember what the console now has.
+        job.on_finish = None
+        delay = job.tick()
+        while delay is not None:
+            self.elapsed += delay
+            delay = job.tick()
+            
+    @property
+    def packet_count(self):
+        return len(self.commands)
+    
+    @property
+    def byte_count(self):
+        return sum(command[3] for command in self.commands)
+    
+    def summary(self):
+        return f"{self.packet_count} packets, {self.byte_count} bytes, about {self.elapsed:.2f} s"
+    
+    def to_text(self):
+        lines = [f"# Alva dry run: {self.name}", f"# {self.summary()}", "time\taddress\targument\tbytes"]
+        for seconds, address, argument, size in self.commands:
+            if address is None:
+                lines.append(f"{seconds:.3f}\t#bundle\t\t{size}")
+                lines.extend(f"\t{element_address}\t{element_argument}" for element_address, element_argument in argument)
+            else:
+                lines.append(f"{seconds:.3f}\t{address}\t{argument}\t{size}")
+        return "\n".join(lines) + "\n"
+
+
+@contextmanager
+def dry_run(name=""):
+    """Everything sent inside the block goes into the yielded CommandPlan instead of out to the console."""
+    plan = CommandPlan(name)
+    previous, osc_transport.plan = osc_transport.plan, plan
+    try:
+        yield plan
+    finally:
+        osc_transport.plan = previous
+
+
+@contextmanager
+def live_output_muted():
+    """Drops everything sent inside the block, for handlers that fire while frames are being sampled."""
+    osc_transport.muted += 1
+    try:
+        yield
+    finally:
+        osc_transport.muted -= 1
+
+
+def dry_run_operator(idname, **properties):
+    """Runs an operator, like "seq.render_strips_operator", against a CommandPlan and returns the plan. Usable from tests and benchmarks."""
+    category, name = idname.split(".")
+    operator = getattr(getattr(bpy.ops, category), name)
+    with dry_run(idname) as plan:
+        plan.result = operator('INVOKE_DEFAULT', **properties)
+    return plan
+
+
+# Sends queued packets from a timer so rendering many event lists doesn't freeze the interface.
+# The job whose timer is still sending. Only one runs at a time, or two would interleave Record and Cue commands.
+active_send_job = None
+
+
+def send_job_running():
+    return active_send_job is not None and not osc_transport.recording
+
+
+# Jobs are timers, which don't survive loading another file.
+@persistent
+def send_job_load_handler(*args):
+    global active_send_job
+    active_send_job = None
+
+
+class OscSendJob:
+    interval = 0.1
+    
+    def __init__(self, ip_address, port, packets, on_finish=None):
+        self.ip_address = ip_address
+        self.port = port
+        self.packets = deque(packets)
+        self.on_finish = on_finish
+        
+    def start(self):
+        """Returns False without sending anything if another job is still running."""
+        global active_send_job
+        if send_job_running():
+            return False
+        if not osc_transport.recording:
+            active_send_job = self
+        osc_transport.schedule(self)
+        return True
+    
+    def stop(self):
+        global active_send_job
+        if active_send_job is self:
+            active_send_job = None
+        
+    def tick(self):
+        if not self.packets:
+            self.stop()
+            if self.on_finish:
+                self.on_finish()
+            return None
+        
+        # Packets may carry their own delay as a third item.
+        address, argument, *delay = self.packets.popleft()
+        try:
+            send_osc_packet((address, argument), self.ip_address, self.port)
+        except Exception as e:
+            print("Render stopped, failed to send OSC command:", e)
+            self.stop()
+            return None
+        return delay[0] if delay else self.interval
+
+
+def parse_osc_message(data):
+    """(address, [arguments]) from a plain OSC message, only string, int and float arguments are read."""
+    def read_string(offset):
+        end = data.index(b"\0", offset)
+        return data[offset:end].decode(errors="replace"), (end + 4) & ~3
+    
+    address, offset = read_string(0)
+    arguments = []
+    if offset < len(data) and data[offset:offset + 1] == b",":
+        tags, offset = read_string(offset)
+        for tag in tags[1:]:
+            if tag == "s":
+                argument, offset = read_string(offset)
+            elif tag in "if":
+                argument = int.from_bytes(data[offset:offset + 4], "big", signed=True) if tag == "i" else struct.unpack(">f", data[offset:offset + 4])[0]
+                offset += 4
+            else:
+                break
+            arguments.append(argument)
+    return address, arguments
+
+
+# Packets with a delay of None wait for the console to answer a ping before the next one goes out.
+# Without a reply port, or if the answer never comes, it falls back to waiting ack_timeout.
+class AckPacedSendJob(OscSendJob):
+    ack_timeout = 1.2
+    poll_interval = 0.01
+    
+    def __init__(self, ip_address, port, packets, reply_port=0, on_finish=None):
+        super().__init__(ip_address, port, packets, on_finish)
+        self.reply_socket = None
+        self.waiting_for = None
+        self.wait_started = 0
+        self.token = 0
+        if reply_port and not osc_transport.recording:
+            try:
+                self.reply_socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+                self.reply_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+                self.reply_socket.bind(("0.0.0.0", reply_port))
+                self.reply_socket.setblocking(False)
+            except OSError as e:
+                print("Can't listen for console replies, pacing by time instead:", e)
+                self.reply_socket = None
+                
+    def start(self):
+        if not super().start():
+            if self.reply_socket is not None:
+                self.reply_socket.close()
+            return False
+        return True
+        
+    def acknowledged(self):
+        if self.reply_socket is None:
+            return False
+        while True:
+            try:
+                data = self.reply_socket.recv(65536)
+            except (BlockingIOError, OSError):
+                return False
+            try:
+                address, arguments = parse_osc_message(data)
+            except (ValueError, IndexError):
+                continue
+            if address == "/eos/out/ping" and self.waiting_for in arguments:
+                return True
+            
+    def tick(self):
+        if self.waiting_for is not None:
+            if not self.acknowledged() and osc_transport.clock() - self.wait_started < self.ack_timeout:
+                return self.poll_interval
+            self.waiting_for = None
+        
+        if not self.packets:
+            self.stop()
+            if self.reply_socket is not None:
+                self.reply_socket.close()
+            if self.on_finish:
+                self.on_finish()
+            return None
+        
+        address, argument, *delay = self.packets.popleft()
+        try:
+            send_osc_packet((address, argument), self.ip_address, self.port)
+            if delay and delay[0] is None:
+                self.token += 1
+                self.waiting_for = f"alva_{self.token}"
+                self.wait_started = osc_transport.clock()
+                send_osc_string("/eos/ping", self.ip_address, self.port, self.waiting_for)
+                return self.poll_interval if self.reply_socket is not None else self.ack_timeout
+        except Exception as e:
+            print("Render stopped, failed to send OSC command:", e)
+            self.stop()
+            if self.reply_socket is not None:
+                self.reply_socket.close()
+            return None
+        return delay[0] if delay else self.interval
+
+
+# What was last rendered to each event list, as {event list: {event number: [hash, action]}}.
+def load_render_manifest(scene):
+    try:
+        return json.loads(scene.render_strips_manifest or "{}")
+    except ValueError:
+        return {}
+
+
+def save_render_manifest(scene, manifest):
+    scene.render_strips_manifest = json.dumps(manifest, separators=(",", ":"))
+
+
+def get_render_event_hash(timecode, action):
+    return hashlib.sha1(f"{timecode}|{action}".encode()).hexdigest()[:16]
+
+
+def diff_render_events(event_list, previous, events):
+    """
+    Works out the console commands that turn the previously rendered event list into this one.
+    Unchanged events keep their numbers and send nothing, moved events are re-timed in place,
+    new events overwrite stale ones where possible and only what is left over is deleted or added.
+    
+    :param previous: Manifest entry from the last render, or None to number everything from 1.
+    :return: List of insert/update commands, list of delete commands and the new manifest entry.
+    """
+    def event_command(number, timecode, action):
+        return f"Event {event_list} / {number} Time {timecode} Show_Control_Action {action} Enter"
+    
+    if previous is None:
+        entry = {str(number): [get_render_event_hash(timecode, action), action] for number, (timecode, action) in enumerate(events, 1)}
+        return [event_command(number, timecode, action) for number, (timecode, action) in enumerate(events, 1)], [], entry
+    
+    unmatched = dict(previous)
+    numbers_by_hash = {}
+    for number, (event_hash, action) in previous.items():
+        numbers_by_hash.setdefault(event_hash, []).append(number)
+    
+    entry = {}
+    changed = []
+    for timecode, action in events:
+        event_hash = get_render_event_hash(timecode, action)
+        numbers = numbers_by_hash.get(event_hash)
+        if numbers:
+            number = numbers.pop()
+            del unmatched[number]
+            entry[number] = [event_hash, action]
+        else:
+            changed.append((timecode, action, event_hash))
+    
+    numbers_by_action = {}
+    for number, (event_hash, action) in sorted(unmatched.items(), key=lambda item: int(item[0])):
+        numbers_by_action.setdefault(action, []).append(number)
+    next_number = max((int(number) for number in previous), default=0) + 1
+    
+    placed = []
+    leftovers = []
+    for timecode, action, event_hash in changed:
+        numbers = numbers_by_action.get(action)
+        if numbers:
+            number = numbers.pop(0)
+            del unmatched[number]
+            placed.append((number, timecode, action, event_hash))
+        else:
+            leftovers.append((timecode, action, event_hash))
+            
+    # Overwriting a stale event costs one command, deleting it and adding a new one costs two.
+    spare_numbers = sorted(unmatched, key=int)
+    for timecode, action, event_hash in leftovers:
+        if spare_numbers:
+            number = spare_numbers.pop(0)
+            del unmatched[number]
+        else:
+            number = str(next_number)
+            next_number += 1
+        placed.append((number, timecode, action, event_hash))
+    
+    commands = []
+    for number, timecode, action, event_hash in placed:
+        entry[number] = [event_hash, action]
+        commands.append(event_command(number, timecode, action))
+    
+    deletions = [f"Delete Event {event_list} / {number} Enter Enter" for number in sorted(unmatched, key=int)]
+    return commands, deletions, entry
 
 
 class RenderStripsOperator(bpy.types.Operator):
@@ -635,61 +2104,138 @@ class RenderStripsOperator(bpy.types.Operator):
         relevant_strips = [strip for strip in context.scene.sequence_editor.sequences_all if strip.frame_final_end >= context.scene.frame_start and strip.frame_start <= context.scene.frame_end and (strip.type == 'COLOR' or strip.type == 'SOUND')]
         return len(relevant_strips) >= 1
 
+    rebuild: bpy.props.BoolProperty(name="Rebuild", default=False, description="Delete and re-send the whole event list instead of only the events that changed since the last render")
+    render_all: bpy.props.BoolProperty(name="Render All", default=False, description="Render the event lists of every timecode sound strip at once, each with the events inside its song. Sent in the background. Shortcut is Ctrl+Shift+Spacebar")
+
     def invoke(self, context, event):
-        all_maps = [
-            (get_start_macro_map(context.scene), "Macro"),
-            (get_end_macro_map(context.scene), "Macro"),
-            (get_start_flash_macro_map(context.scene), "Macro"),
-            (get_end_flash_macro_map(context.scene), "Macro"),
-            (get_cue_map(context.scene), "Cue")
-        ]
-
-        commands = []
-        event_strip = find_relevant_clock(context.scene)
+        scene = context.scene
+        if send_job_running():
+            self.report({'ERROR'}, "Orb is still sending the last bake or render in the background. Try again once it finishes.")
+            return {'CANCELLED'}
+        if self.render_all:
+            return self.render_all_event_lists(context)
+        
+        event_strip = find_relevant_clock(scene)
         if event_strip == None:
             return {'CANCELLED'}
         event_list = event_strip.song_timecode_clock_number
 
-        i = 1
-        for action_map, description in all_maps:
-            for frame in action_map:
-                actions = action_map[frame]
-                for label, index in actions:
-                    fps = get_frame_rate(context.scene)
-                    timecode = frame_to_timecode(self, frame, fps)
-                    argument = f"Event {event_list} / {i} Time {timecode} Show_Control_Action {description} {index} Enter"
-                    commands.append(argument)
-                    i += 1
+        events = get_render_events(scene)
+        manifest = load_render_manifest(scene)
+        previous = None if self.rebuild else manifest.get(str(event_list))
+        commands, deletions, manifest[str(event_list)] = diff_render_events(event_list, previous, events)
+        
+        if previous is not None and not commands and not deletions:
+            self.report({'INFO'}, f"Event list {event_list} is already up to date.")
+            return {'FINISHED'}
                     
-        ip_address = context.scene.scene_props.str_osc_ip_address
-        port = context.scene.scene_props.int_osc_port
+        ip_address = scene.scene_props.str_osc_ip_address
+        port = scene.scene_props.int_osc_port
         self.send_osc_command("/eos/key/blind", ip_address, port, "1")
         self.send_osc_command("/eos/key/blind", ip_address, port, "0")
         
-        self.send_osc_command("/eos/newcmd", ip_address, port, f"Delete Event {event_list} / Enter Enter")
-        self.send_osc_command("/eos/newcmd", ip_address, port, f"Event {event_list} / Enter Enter")
-        
-        for i in range(0, len(commands), 50):
-            batch = commands[i:i+50]
-            argument = ", ".join(batch)
-            self.send_osc_command("/eos/newcmd", ip_address, port, argument)
+        packets = get_render_packets(scene, event_list, previous is None, commands, deletions)
+        for address, argument in packets:
+            self.send_osc_command(address, ip_address, port, argument)
 
         self.send_osc_command("/eos/key/live", ip_address, port, "1")
         self.send_osc_command("/eos/key/live", ip_address, port, "0")
-        if context.scene.orb_finish_snapshot:
-            snapshot = str(context.scene.orb_finish_snapshot)
+        if scene.orb_finish_snapshot:
+            snapshot = str(scene.orb_finish_snapshot)
             self.send_osc_command("/eos/newcmd", ip_address, port, f"Snapshot {snapshot} Enter")
+            
+        if not osc_transport.recording:
+            save_render_manifest(scene, manifest)
+        if commands:
+            self.report({'INFO'}, f"Event list {event_list}: {len(commands)} events sent, {len(deletions)} deleted, {len(packets)} packets ({len(packets) / len(commands):.2f} per event).")
         return{'FINISHED'}
+    
+    def render_all_event_lists(self, context):
+        scene = context.scene
+        manifest = load_render_manifest(scene)
+        packets = [("/eos/key/blind", "1"), ("/eos/key/blind", "0")]
+        changed_lists = []
+        event_count = 0
+        
+        for event_list, events in sorted(partition_render_events(scene).items()):
+            previous = None if self.rebuild else manifest.get(str(event_list))
+            commands, deletions, manifest[str(event_list)] = diff_render_events(event_list, previous, events)
+            if previous is None or commands or deletions:
+                packets.extend(get_render_packets(scene, event_list, previous is None, commands, deletions))
+                changed_lists.append(event_list)
+                event_count += len(commands)
+                
+        if not changed_lists:
+            self.report({'INFO'}, "All event lists are already up to date.")
+            return {'FINISHED'}
+        
+        packets += [("/eos/key/live", "1"), ("/eos/key/live", "0")]
+        if scene.orb_finish_snapshot:
+            packets.append(("/eos/newcmd", f"Snapshot {scene.orb_finish_snapshot} Enter"))
+        
+        # Only remember the lists as rendered once everything has actually gone out.
+        scene_name = scene.name
+        manifest_json = json.dumps(manifest, separators=(",", ":"))
+        def on_finish():
+            finished_scene = bpy.data.scenes.get(scene_name)
+            if finished_scene:
+                finished_scene.render_strips_manifest = manifest_json
+        
+        OscSendJob(scene.scene_props.str_osc_ip_address, scene.scene_props.int_osc_port, packets, on_finish).start()
+        self.report({'INFO'}, f"Rendering event lists {', '.join(str(event_list) for event_list in changed_lists)}: {event_count} events in {len(packets)} packets ({len(packets) / max(event_count, 1):.2f} per event).")
+        return {'FINISHED'}
 
     def send_osc_command(self, address, ip, port, command):
         try:
             send_osc_string(address, ip, port, command)
-            time.sleep(0.1)
+            osc_transport.sleep(0.1)
         except Exception as e:
             self.report({'ERROR'}, f"Failed to send OSC command: {e}")
             return {'CANCELLED'}
 
 
+dry_run_targets = {
+    "option_render": ("seq.render_strips_operator", {}),
+    "option_render_all": ("seq.render_strips_operator", {"render_all": True}),
+    "option_bake_qmeo": ("my.bake_fcurves_to_cues_operator", {}),
+    "option_rerecord_qmeo": ("my.rerecord_cues_operator", {}),
+}
+
+
+class DryRunOperator(bpy.types.Operator):
+    bl_idname = "seq.dry_run_operator"
+    bl_label = "Dry Run"
+    bl_description = "See everything Orb would send to the console, and about how long it would take, without sending anything. The command plan is written to the Alva Dry Run text"
+    
+    target: bpy.props.EnumProperty(
+        name="Operation",
+        items=[
+            ('option_render', "Render Strips", "Render the event list of the current song"),
+            ('option_render_all', "Render All", "Render the event lists of every song"),
+            ('option_bake_qmeo', "Bake F-curves To Cues", "Record the active animation strip as cues"),
+            ('option_rerecord_qmeo', "Re-record Cues", "Re-record the active animation strip's cues"),
+        ],
+        default='option_render'
+    )
+    
+    def invoke(self, context, event):
+        return context.window_manager.invoke_props_dialog(self)
+    
+    def execute(self, context):
+        idname, properties = dry_run_targets[self.target]
+        try:
+            plan = dry_run_operator(idname, **properties)
+        except RuntimeError as e:
+            self.report({'ERROR'}, f"Dry run failed: {e}")
+            return {'CANCELLED'}
+        
+        text_block = bpy.data.texts.get("Alva Dry Run") or bpy.data.texts.new(name="Alva Dry Run")
+        text_block.clear()
+        text_block.write(plan.to_text())
+        self.report({'INFO'}, f"Dry run: {plan.summary()}.")
+        return {'FINISHED'}
+
+
 # Defines lists of strips with relevant enumerator and checkbox choices.
 def filter_eos_cue_strips(sequences):
     return [strip for strip in sequences if strip.type == 'COLOR' and strip.my_settings.motif_type_enum == 'option_eos_cue' and not strip.mute]
@@ -1736,46 +3282,17 @@ def color_palette_color_updater(self, context):
     scene = bpy.context.scene
     
     if scene.preview_color_palette:
-        cp_number = scene.color_palette_number
-        cp_red = scene.color_palette_color[0]
-        cp_green = scene.color_palette_color[1]
-        cp_blue = scene.color_palette_color[2]
-        cp_label = scene.color_palette_name
         newcmd = "/eos/newcmd"
         live = "/eos/key/live"
-        enter = "/eos/key/enter"
         down = "1"
         up = "0"
         
-        cp_red = round(cp_red * 100, 1)
-        cp_green = round(cp_green * 100, 1)
-        cp_blue = round(cp_blue * 100, 1)
-        
         send_osc_string(live, ip_address, port, down)
         send_osc_string(live, ip_address, port, up)
         
-        argument = "Chan 1 thru thru 1000 Red " + str(cp_red) + " Enter"
-        send_osc_string(newcmd, ip_address, port, argument)
-        
-        argument = "Chan 1 thru thru 1000 Green " + str(cp_green) + " Enter"
-        send_osc_string(newcmd, ip_address, port, argument)
-        
-        argument = "Chan 1 thru thru 1000 Amber 0 Enter"
-        send_osc_string(newcmd, ip_address, port, argument)
-        
-        argument = "Chan 1 thru thru 1000 Mint 0 Enter"
-        send_osc_string(newcmd, ip_address, port, argument)
-        
-        if cp_red + cp_green + cp_blue != 300:
-            argument = "Chan 1 thru thru 1000 White 0 Enter"
-            send_osc_string(newcmd, ip_address, port, argument)
-        else: 
-            argument = "Chan 1 thru thru 1000 White 100 Enter"
+        for argument in pack_console_commands(get_color_palette_commands(scene), scene.console_command_byte_budget, scene.osc_datagram_mtu):
             send_osc_string(newcmd, ip_address, port, argument)
         
-        argument = "Chan 1 thru thru 1000 Blue " + str(cp_blue) + " Enter"
-        send_osc_string(newcmd, ip_address, port, argument)  
-        
                      
 def replacement_value_updater(self, context):
     ''' This needs to 1: clear all prefix fields. 2: press the "my.load_preset()" button. 3: press the "my.replace_button()", and finally, 4: update the strip name to reflect self. '''   
@@ -2144,6 +3661,12 @@ def parse_concurrent_commands(input_string):
     return concurrent_commands
 
 
+# Generate one command string per channel, swapping each channel in for the command's first number.
+def generate_command_strings(command, channels):
+    template = re.sub(r'\b\d+\b', '{}', command.replace("{", "{{").replace("}", "}}"), count=1)
+    return [template.format(chan) for chan in channels]
+
+
 # Generate command strings for concurrent commands.
 def generate_concurrent_command_strings(command, concurrent_commands):
     command_lists = []
@@ -2160,19 +3683,63 @@ def generate_concurrent_command_strings(command, concurrent_commands):
 
 
 # This function is updated to handle concurrent commands.
-def get_offset_triggers(strip):
+def expand_offset_triggers(friend_list, osc_trigger):
     # Detect and parse concurrent commands.
-    concurrent_commands = parse_concurrent_commands(strip.friend_list)
+    concurrent_commands = parse_concurrent_commands(friend_list)
     # Check if we have concurrent commands.
     if len(concurrent_commands) > 1 or any(isinstance(i, list) for i in concurrent_commands):
-        command_list = generate_concurrent_command_strings(strip.osc_trigger, concurrent_commands)
+        command_list = generate_concurrent_command_strings(osc_trigger, concurrent_commands)
     else:  # Fallback to original behavior for sequential commands.
-        channels = parse_channels(strip.friend_list)
-        command_list = generate_command_strings(strip.osc_trigger, channels)
+        channels = parse_channels(friend_list)
+        command_list = generate_command_strings(osc_trigger, channels)
+    
+    return command_list
+
+
+# Expanded friend_list commands keyed on (friend_list, osc_trigger) so playback start doesn't re-run the regexes.
+offset_trigger_cache = {}
+
+
+def get_offset_triggers(strip):
+    if not strip.friend_list:
+        return ()
     
+    key = (strip.friend_list, strip.osc_trigger)
+    command_list = offset_trigger_cache.get(key)
+    
+    if command_list is None:
+        try:
+            command_list = tuple(expand_offset_triggers(strip.friend_list, strip.osc_trigger))
+        except ValueError:
+            # Half-typed friend list, like "a thru 5". Cached as no offsets until it's edited into something readable.
+            command_list = ()
+        offset_trigger_cache[key] = command_list
+        
     return command_list
 
 
+# Drops expansions no trigger strip uses anymore and precompiles the edited one, so the cost lands on the edit, not on play.
+def offset_trigger_cache_updater(self, context):
+    if not context.scene or not context.scene.sequence_editor:
+        return
+    
+    live_keys = set()
+    for strip in filter_trigger_strips(context.scene.sequence_editor.sequences_all):
+        if strip.friend_list:
+            live_keys.add((strip.friend_list, strip.osc_trigger))
+            
+    for key in list(offset_trigger_cache):
+        if key not in live_keys:
+            del offset_trigger_cache[key]
+            
+    get_offset_triggers(self)
+    
+    
+def osc_trigger_updater(self, context):
+    trigger_motif_property_updater(self, context)
+    offset_trigger_cache_updater(self, context)
+
+
 class SimpleCommandLine(bpy.types.Operator):
     bl_idname = "sequencer.simple_command_line"
     bl_label = "Simple Command Line"
@@ -2281,29 +3848,64 @@ class AudioObjectSettings(bpy.types.PropertyGroup):
     )
     
     
-def render_volume(speaker, empty, sensitivity, object_size, int_mixer_channel):
-    distance = (speaker.location - empty.location).length
-    adjusted_distance = max(distance - object_size, 0)
-    final_distance = adjusted_distance + sensitivity
-    final_distance = max(final_distance, 1e-6)
-    base_volume = 1.0
-    volume = base_volume / final_distance
-    volume = max(0, min(volume, 1))
+def get_speaker_gain_matrix(speaker_positions, object_positions, object_sizes, sensitivities):
+    """
+    Inverse-distance gain from every audio object to every speaker in one pass. Distance inside
+    an object's size counts as zero, and each speaker's sensitivity is added before inverting.
     
-    if bpy.context.screen:
-        for area in bpy.context.screen.areas:
-            if area.type == 'SEQUENCE_EDITOR':
-                area.tag_redraw()
-            
-    if bpy.context.scene.str_audio_ip_address != "":
-        address = bpy.context.scene.audio_osc_address.format("#", str(int_mixer_channel))
+    :param speaker_positions: (speakers, 3) array.
+    :param object_positions: (objects, 3) array.
+    :param object_sizes: (objects,) array.
+    :param sensitivities: (speakers,) array.
+    :return: (speakers, objects) array of gains from 0 to 1.
+    """
+    distances = np.linalg.norm(speaker_positions[:, None, :] - object_positions[None, :, :], axis=2)
+    final_distances = np.maximum(distances - object_sizes[None, :], 0) + sensitivities[:, None]
+    return np.clip(1.0 / np.maximum(final_distances, 1e-6), 0, 1)
+
+
+def get_speaker_volumes(scene):
+    """
+    Volume of every speaker strip from the audio object strip playing the same sound file.
+    
+    :return: List of (speaker strip, volume).
+    """
+    audio_objects = {}
+    speaker_strips = []
+    for strip in scene.sequence_editor.sequences_all:
+        if strip.type != 'SOUND' or not strip.sound:
+            continue
+        if strip.audio_type_enum == "option_object" and strip.audio_object_activated:
+            audio_objects[strip.sound.filepath] = (strip.selected_empty, strip.audio_object_size)
+        elif strip.audio_type_enum == "option_speaker":
+            speaker_strips.append(strip)
+    
+    object_files = [filepath for filepath, (empty, object_size) in audio_objects.items() if empty]
+    object_indices = {filepath: index for index, filepath in enumerate(object_files)}
+    routed = [(strip, object_indices[strip.sound.filepath]) for strip in speaker_strips if strip.selected_speaker and strip.sound.filepath in object_indices]
+    if not routed:
+        return []
+    
+    gains = get_speaker_gain_matrix(
+        np.array([tuple(strip.selected_speaker.location) for strip, index in routed], dtype=np.float64),
+        np.array([tuple(audio_objects[filepath][0].location) for filepath in object_files], dtype=np.float64),
+        np.array([audio_objects[filepath][1] for filepath in object_files], dtype=np.float64),
+        np.array([getattr(strip, 'speaker_sensitivity', 1) for strip, index in routed], dtype=np.float64))
+    volumes = gains[np.arange(len(routed)), [index for strip, index in routed]]
+    return [(strip, float(volume)) for (strip, index), volume in zip(routed, volumes)]
+
+
+def send_speaker_volumes(scene, speaker_volumes):
+    if scene.str_audio_ip_address == "":
+        return
+    ip_address = scene.str_audio_ip_address
+    port = scene.int_audio_port
+    for strip, volume in speaker_volumes:
+        address = scene.audio_osc_address.format("#", str(strip.int_mixer_channel))
         address = address.format("$", round(volume))
-        argument = bpy.context.scene.audio_osc_argument.format("#", str(int_mixer_channel))
+        argument = scene.audio_osc_argument.format("#", str(strip.int_mixer_channel))
         argument = argument.format("$", round(volume))
-        ip_address = bpy.context.scene.str_audio_ip_address
-        port = bpy.context.scene.int_audio_port
         send_osc_string(address, ip_address, port, argument)
-    return volume
 
 
 @persistent
@@ -2311,23 +3913,21 @@ def render_audio_objects(scene):
     if not hasattr(scene, "sequence_editor") or not scene.sequence_editor:
         return
 
-    audio_objects = {}
-    for strip in scene.sequence_editor.sequences_all:
-        if strip.type == 'SOUND' and strip.audio_type_enum == "option_object" and strip.audio_object_activated:
-            audio_objects[strip.sound.filepath] = (strip.selected_empty, strip.audio_object_size)
-
-    for strip in scene.sequence_editor.sequences_all:
-        if strip.type == 'SOUND' and strip.audio_type_enum == "option_speaker":
-            if strip.sound.filepath in audio_objects:
-                empty, object_size = audio_objects[strip.sound.filepath]
-                speaker = strip.selected_speaker
-                if speaker and empty:
-                    sensitivity = getattr(strip, 'speaker_sensitivity', 1)
-                    strip.dummy_volume = render_volume(speaker, empty, sensitivity, object_size, strip.int_mixer_channel)
+    speaker_volumes = get_speaker_volumes(scene)
+    if not speaker_volumes:
+        return
+    
+    for strip, volume in speaker_volumes:
+        strip.dummy_volume = volume
+    send_speaker_volumes(scene, speaker_volumes)
+    
+    if bpy.context.screen:
+        for area in bpy.context.screen.areas:
+            if area.type == 'SEQUENCE_EDITOR':
+                area.tag_redraw()
 
 
-# Output socket setup and send_osc_string function (For OSC output).
-def send_osc_string(osc_addr, addr, port, string):
+def build_osc_message(osc_addr, string):
     
     def pad(data):
         return data + b"\0" * (4 - (len(data) % 4 or 4))
@@ -2339,15 +3939,61 @@ def send_osc_string(osc_addr, addr, port, string):
     string = string.encode() + b"\0"
     tag = ",s".encode()
 
-    message = b"".join(map(pad, (osc_addr, tag, string)))
+    return b"".join(map(pad, (osc_addr, tag, string)))
+
+
+def pack_console_commands(commands, byte_budget, mtu, osc_addr="/eos/newcmd", separator=", "):
+    """
+    Joins console commands into as few strings as fit both the console's byte budget for one
+    command line and one UDP datagram once wrapped as an OSC message. A command too long for
+    either still goes out on its own.
+    
+    :return: List of joined command strings, one per packet.
+    """
+    overhead = len(build_osc_message(osc_addr, "")) - 4  # Address and type tag, the empty string pads to 4.
+    separator_bytes = len(separator.encode())
+    
+    packed = []
+    current = []
+    current_bytes = 0
+    for command in commands:
+        command_bytes = len(command.encode())
+        candidate = current_bytes + separator_bytes + command_bytes if current else command_bytes
+        datagram = overhead + (candidate + 4) // 4 * 4
+        if current and (candidate > byte_budget or datagram > mtu):
+            packed.append(separator.join(current))
+            current = []
+            candidate = command_bytes
+        current.append(command)
+        current_bytes = candidate
+    if current:
+        packed.append(separator.join(current))
+    return packed
+
+
+# Sends several (address, string) messages as one OSC bundle with an "immediately" time tag.
+def send_osc_bundle(messages, addr, port):
+    elements = [build_osc_message(osc_addr, string) for osc_addr, string in messages]
+    bundle = b"#bundle\0" + (1).to_bytes(8, "big") + b"".join(len(element).to_bytes(4, "big") + element for element in elements)
+    try:
+        osc_transport.sendto(bundle, (addr, port))
+
+    except Exception:
+        import traceback
+        traceback.print_exc()
+
+
+# Output socket setup and send_osc_string function (For OSC output).
+def send_osc_string(osc_addr, addr, port, string):
+    message = build_osc_message(osc_addr, string)
     try:
-        sock.sendto(message, (addr, port))
+        osc_transport.sendto(message, (addr, port))
 
     except Exception:
         import traceback
         traceback.print_exc()
 
-sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+osc_transport = OscTransport()
 
 
 def register(): 
@@ -2360,6 +4006,7 @@ def register():
     
     bpy.utils.register_class(MySettings)
     bpy.utils.register_class(RenderStripsOperator)
+    bpy.utils.register_class(DryRunOperator)
     bpy.types.Sequence.my_settings = bpy.props.PointerProperty(type=MySettings)
     
     bpy.utils.register_class(MyMotifs)
@@ -2370,6 +4017,9 @@ def register():
     bpy.types.Scene.triggers_enabled = bpy.props.BoolProperty(default=False)
     bpy.types.ColorSequence.animation_cue_list_number = bpy.props.IntProperty(default=10, min=2, max=99999)
     bpy.types.ColorSequence.animation_event_list_number = bpy.props.IntProperty(default=10, min=2, max=99999)
+    bpy.types.ColorSequence.qmeo_fingerprints = bpy.props.StringProperty(default="", description="Per-frame hashes of the last qmeo bake, so re-recording only touches frames that changed")
+    bpy.types.ColorSequence.qmeo_delta = bpy.props.BoolProperty(default=False, name="Delta", description="Only record the channels that changed since the previous cue with Record Only, and skip frames where nothing changed. Keeps qmeos small when the effect only touches a few fixtures")
+    bpy.types.ColorSequence.qmeo_tolerance = bpy.props.FloatProperty(default=0, min=0, max=50, name="Tolerance", description="Only record the frames needed to stay within this many units (percent, degrees) of the animation, fading between them over the gap. 0 records every frame")
     
     bpy.types.Scene.i_know_the_shortcuts = bpy.props.BoolProperty(default=False)
     bpy.types.Scene.house_down_on_play = bpy.props.BoolProperty(default=False, description="Automatically dip the house lights during playback")
@@ -2379,6 +4029,25 @@ def register():
     bpy.types.Scene.house_up_argument = bpy.props.StringProperty(default="500 at 75 Enter", description="Argument needed to raise house lights on stop")
     bpy.types.Scene.sync_timecode = bpy.props.BoolProperty(default=True, description="Sync console's timecode clock with Sorcerer on play/stop/scrub based on top-most active sound strip's event list number")
     bpy.types.Scene.timecode_expected_lag = bpy.props.IntProperty(default=0, min=0, max=100, description="Expected lag in frames")
+    bpy.types.Scene.animation_deadband_absolute = bpy.props.FloatProperty(default=0, min=0, max=100, description="Animation values that moved less than this since the last send are not sent again")
+    bpy.types.Scene.animation_deadband_relative = bpy.props.FloatProperty(default=0, min=0, max=100, subtype='PERCENTAGE', description="Animation values that moved less than this percentage of the last sent value are not sent again")
+    bpy.types.Scene.animation_refresh_interval = bpy.props.FloatProperty(default=0, min=0, max=60, unit='TIME_ABSOLUTE', description="Resend unchanged animation values this often, in seconds, in case a packet was lost. 0 never resends a static hold")
+    bpy.types.Scene.animation_output_rate = bpy.props.IntProperty(default=0, min=0, max=100, description="During playback, stream animation on its own clock at this many updates per second, sampling F-curves between frames. 0 sends once per scene frame")
+    bpy.types.Scene.animation_batching = bpy.props.EnumProperty(
+        name="Animation Batching",
+        items=[
+            ('option_separate', "Separate", "Send every animated parameter as its own OSC message"),
+            ('option_command', "Command Line", "Merge parameters aimed at the same Eos channel or group into one /eos/newcmd expression"),
+            ('option_bundle', "OSC Bundle", "Send all parameters of a strip in one OSC bundle"),
+        ],
+        default='option_separate',
+        description="How animation strips send their parameters each frame"
+    )
+    bpy.types.Scene.animation_batch_shared_channels = bpy.props.BoolProperty(default=False, description="In command line mode, also merge strips that drive the same channel or group into one expression")
+    bpy.types.Scene.console_command_byte_budget = bpy.props.IntProperty(default=1024, min=64, max=65000, description="Most bytes of commands Render Strips, qmeos and color palettes join into one /eos/newcmd message. Lower this if the console drops long command lines")
+    bpy.types.Scene.osc_datagram_mtu = bpy.props.IntProperty(default=1472, min=64, max=65507, description="Largest UDP datagram to send, in bytes. 1472 fits a standard 1500 byte Ethernet frame without fragmenting")
+    bpy.types.Scene.render_strips_manifest = bpy.props.StringProperty(default="", description="Events sent by the last Render Strips per event list, so the next render only sends what changed")
+    bpy.types.Scene.record_trigger_timing = bpy.props.BoolProperty(default=False, description="Log how late each trigger strip fires during playback and write percentiles, dropped frames and missed events to a text block on stop")
     bpy.types.Scene.orb_finish_snapshot = bpy.props.IntProperty(default=0, min=0, max=9999, description="Snapshot that Orb should set when done")
 
     bpy.types.Scene.color_palette_color = bpy.props.FloatVectorProperty(
@@ -2435,7 +4104,8 @@ def register():
     bpy.types.ColorSequence.selected_light = bpy.props.StringProperty()
     bpy.types.Scene.selected_constraint = bpy.props.StringProperty()
     
-    bpy.types.ColorSequence.friend_list = bpy.props.StringProperty(default="", description='Use this to create an offset effect timed by strip length. Type something like "1 thru 5" in this box and something like "1 at full enter" as the Strip Start Argument to make the offset friends join in. Beware: this feature is not stable')
+    bpy.types.ColorSequence.animation_channels = bpy.props.StringProperty(default="", description='Channels that a * left in the prefixes stands for, like "1 thru 48" or "1-12, 20, 30 thru 40". The whole set is driven with one command. Leave blank to skip prefixes that still contain *')
+    bpy.types.ColorSequence.friend_list = bpy.props.StringProperty(default="", update=offset_trigger_cache_updater, description='Use this to create an offset effect timed by strip length. Type something like "1 thru 5" in this box and something like "1 at full enter" as the Strip Start Argument to make the offset friends join in. Beware: this feature is not stable')
     bpy.types.Scene.replacement_value = bpy.props.StringProperty(default="group/1", update=replacement_value_updater)
     bpy.types.Scene.auto_update_replacement = bpy.props.BoolProperty(default=False, description="When user updates this value, automatically update prefixes and strip name as well")
     bpy.types.Scene.offset_value = bpy.props.IntProperty(name="", min=-100000, max=10000)
@@ -2474,7 +4144,7 @@ def register():
     bpy.types.ColorSequence.end_flash = bpy.props.StringProperty(name="", default="")
     
     bpy.types.ColorSequence.trigger_prefix = bpy.props.StringProperty(name="", default="/eos/newcmd", description="Prefix, aka address, is the first half of an OSC message. The top three fields here will definitely work on any console brand/type that has an OSC input library", update=trigger_motif_property_updater)
-    bpy.types.ColorSequence.osc_trigger = bpy.props.StringProperty(name="", description="This argument will be fired with the above prefix when frame 1 of the strip comes up in the sequencer. The top three fields here will definitely work on any console brand/type that has an OSC input library", update=trigger_motif_property_updater)
+    bpy.types.ColorSequence.osc_trigger = bpy.props.StringProperty(name="", description="This argument will be fired with the above prefix when frame 1 of the strip comes up in the sequencer. The top three fields here will definitely work on any console brand/type that has an OSC input library", update=osc_trigger_updater)
     bpy.types.ColorSequence.osc_trigger_end = bpy.props.StringProperty(name="", description="This argument will be fired with the above prefix when the final frame of the strip comes up in the sequencer. The top three fields here will definitely work on any console brand/type that has an OSC input library", update=trigger_motif_property_updater)
     bpy.types.ColorSequence.eos_cue_number = bpy.props.StringProperty(name="", update=cue_motif_property_updater, description="This argument will be fired with the above prefix when frame 1 of the strip comes up in the sequencer. The top three fields here will definitely work on any console brand/type that has an OSC input library")
     
@@ -2490,7 +4160,6 @@ def register():
     bpy.types.ColorSequence.end_macro_muted = bpy.props.BoolProperty(name="", description="Toggle mute/unmute for the end macro", default=False)
     
     bpy.types.ColorSequence.osc_intensity  = bpy.props.FloatProperty(name="Intensity", min=0, max=100, options={'ANIMATABLE'}, update=osc_intensity_update, description="")
-    bpy.types.ColorSequence.intensity_checker = bpy.props.FloatProperty(name="", min=-10000, max=10000, default=10000)
     bpy.types.ColorSequence.osc_color = bpy.props.FloatVectorProperty(
     name="Color",
     subtype='COLOR',
@@ -2500,6 +4169,7 @@ def register():
     options={'ANIMATABLE'},
     update=osc_color_update
 )
+    bpy.types.ColorSequence.color_emitter_model = bpy.props.EnumProperty(items=emitter_model_items, name="Emitters", description="Emitters this fixture mixes color with. Extra emitters use the red prefix with red swapped for the emitter name, like /eos/chan/5/param/white")
     bpy.types.ColorSequence.osc_pan  = bpy.props.FloatProperty(name="Pan:", min=-360, max=360, options={'ANIMATABLE'}, update=osc_pan_update)
     bpy.types.ColorSequence.osc_tilt  = bpy.props.FloatProperty(name="Tilt:", min=-360, max=360, options={'ANIMATABLE'}, update=osc_tilt_update)
     bpy.types.ColorSequence.osc_zoom  = bpy.props.FloatProperty(name="Zoom:", min=1, max=max_zoom, options={'ANIMATABLE'}, update=osc_zoom_update, default=10)
@@ -2666,7 +4336,15 @@ def register():
     bpy.app.handlers.frame_change_pre.append(playback_monitor.frame_change_handler)
     bpy.app.handlers.animation_playback_pre.append(playback_monitor.playback_start_handler)
     bpy.app.handlers.animation_playback_post.append(playback_monitor.playback_stop_handler)
-    bpy.app.handlers.frame_change_pre.append(frame_change_handler_animation)
+    bpy.app.handlers.frame_change_post.append(light_matrix_cache_handler)
+    bpy.app.handlers.depsgraph_update_post.append(light_matrix_cache_update_handler)
+    bpy.app.handlers.load_post.append(light_matrix_cache_load_handler)
+    bpy.app.handlers.frame_change_post.append(frame_change_handler_animation)
+    bpy.app.handlers.depsgraph_update_post.append(animation_evaluator_invalidate_handler)
+    bpy.app.handlers.undo_post.append(animation_evaluator_invalidate_handler)
+    bpy.app.handlers.redo_post.append(animation_evaluator_invalidate_handler)
+    bpy.app.handlers.load_post.append(animation_evaluator_invalidate_handler)
+    bpy.app.handlers.load_post.append(send_job_load_handler)
     bpy.app.handlers.frame_change_pre.append(frame_change_handler)
     
     #Command line stuff.
@@ -2676,6 +4354,8 @@ def register():
     km = wm.keyconfigs.addon.keymaps.new(name='Sequencer', space_type='SEQUENCE_EDITOR')
     kmi = km.keymap_items.new(SimpleCommandLine.bl_idname, 'C', 'PRESS')
     kmi = km.keymap_items.new(RenderStripsOperator.bl_idname, 'SPACE', 'PRESS', shift=True)
+    kmi = km.keymap_items.new(RenderStripsOperator.bl_idname, 'SPACE', 'PRESS', shift=True, ctrl=True)
+    kmi.properties.render_all = True
     bpy.types.Scene.command_line_label = bpy.props.StringProperty(default="Cmd Line: ")
     
 
@@ -2684,8 +4364,21 @@ def unregister():
     km = wm.keyconfigs.addon.keymaps['Sequencer']
     wm.keyconfigs.addon.keymaps.remove(km)
     bpy.utils.unregister_class(SimpleCommandLine)
+    # Its timer would otherwise keep ticking against properties that are about to go away.
+    animation_output_clock.stop()
     bpy.app.handlers.frame_change_pre.remove(frame_change_handler)
-    bpy.app.handlers.frame_change_pre.remove(frame_change_handler_animation)
+    bpy.app.handlers.load_post.remove(animation_evaluator_invalidate_handler)
+    bpy.app.handlers.load_post.remove(send_job_load_handler)
+    bpy.app.handlers.redo_post.remove(animation_evaluator_invalidate_handler)
+    bpy.app.handlers.undo_post.remove(animation_evaluator_invalidate_handler)
+    bpy.app.handlers.depsgraph_update_post.remove(animation_evaluator_invalidate_handler)
+    bpy.app.handlers.frame_change_post.remove(frame_change_handler_animation)
+    if light_matrix_cache_load_handler in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(light_matrix_cache_load_handler)
+    if light_matrix_cache_update_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(light_matrix_cache_update_handler)
+    if light_matrix_cache_handler in bpy.app.handlers.frame_change_post:
+        bpy.app.handlers.frame_change_post.remove(light_matrix_cache_handler)
     bpy.app.handlers.animation_playback_post.remove(playback_monitor.playback_stop_handler)
     bpy.app.handlers.animation_playback_pre.remove(playback_monitor.playback_start_handler)
     bpy.app.handlers.frame_change_pre.remove(playback_monitor.frame_change_handler)
@@ -2693,6 +4386,7 @@ def unregister():
     bpy.app.handlers.frame_change_pre.remove(render_audio_objects)
     bpy.utils.unregister_class(MySettings)
     bpy.utils.unregister_class(RenderStripsOperator)
+    bpy.utils.unregister_class(DryRunOperator)
     bpy.utils.unregister_class(MyMotifs)
     del bpy.types.Scene.cue_builder_id_offset
     del bpy.types.ColorSequence.cue_builder_effect_id
@@ -2746,7 +4440,7 @@ def unregister():
     del bpy.types.ColorSequence.osc_tilt
     del bpy.types.ColorSequence.osc_pan
     del bpy.types.ColorSequence.osc_color
-    del bpy.types.ColorSequence.intensity_checker
+    del bpy.types.ColorSequence.color_emitter_model
     del bpy.types.ColorSequence.osc_intensity
     del bpy.types.ColorSequence.end_macro_muted
     del bpy.types.ColorSequence.start_macro_muted
@@ -2793,6 +4487,7 @@ def unregister():
     del bpy.types.Scene.auto_update_replacement
     del bpy.types.Scene.replacement_value
     del bpy.types.ColorSequence.friend_list
+    del bpy.types.ColorSequence.animation_channels
     del bpy.types.Scene.selected_constraint
     del bpy.types.ColorSequence.selected_light
     del bpy.types.Scene.selected_curve
@@ -2816,6 +4511,16 @@ def unregister():
     del bpy.types.Scene.preview_color_palette
     del bpy.types.Scene.color_palette_color
     del bpy.types.Scene.orb_finish_snapshot
+    del bpy.types.Scene.record_trigger_timing
+    del bpy.types.Scene.render_strips_manifest
+    del bpy.types.Scene.osc_datagram_mtu
+    del bpy.types.Scene.console_command_byte_budget
+    del bpy.types.Scene.animation_batch_shared_channels
+    del bpy.types.Scene.animation_batching
+    del bpy.types.Scene.animation_output_rate
+    del bpy.types.Scene.animation_refresh_interval
+    del bpy.types.Scene.animation_deadband_relative
+    del bpy.types.Scene.animation_deadband_absolute
     del bpy.types.Scene.timecode_expected_lag
     del bpy.types.Scene.sync_timecode
     del bpy.types.Scene.house_up_argument
@@ -2826,6 +4531,9 @@ def unregister():
     del bpy.types.Scene.i_know_the_shortcuts
     del bpy.types.ColorSequence.animation_event_list_number
     del bpy.types.ColorSequence.animation_cue_list_number
+    del bpy.types.ColorSequence.qmeo_tolerance
+    del bpy.types.ColorSequence.qmeo_delta
+    del bpy.types.ColorSequence.qmeo_fingerprints
     del bpy.types.Scene.triggers_enabled
     del bpy.types.Scene.animation_enabled
     del bpy.types.Scene.my_tool
@@ -29,11 +29,14 @@
 # pyright: reportInvalidTypeForm=false
 
 import bpy
-import socket
-import time
+import os
+import json
 from functools import partial
 
-from .sequencer_main import find_available_channel
+from .sequencer_main import find_available_channel, get_color_palette_commands, pack_console_commands, get_qmeo_record_packets, OscSendJob, sample_qmeo_looks, get_qmeo_look_matrix, simplify_keyframes, get_qmeo_fingerprints, AckPacedSendJob, osc_transport, send_job_running, \
+    filter_eos_cue_strips, filter_eos_macro_strips, filter_eos_flash_strips, filter_trigger_strips, filter_animation_strips, partition_render_events, \
+    sample_strip_values, animation_parameters
+from .show_timeline import make_timeline, section_rows, read_timeline, write_timeline, timeline_fields
 
 
 max_zoom = 1000
@@ -56,14 +59,12 @@ def send_osc_string(osc_addr, addr, port, string):
 
     message = b"".join(map(pad, (osc_addr, tag, string)))
     try:
-        sock.sendto(message, (addr, port))
+        osc_transport.sendto(message, (addr, port))
 
     except Exception:
         import traceback
         traceback.print_exc()
 
-sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-
 
 def osc_zoom_update(self, context):
     scene = context.scene
@@ -880,7 +881,7 @@ class ClearTimecodeClockOperator(bpy.types.Operator):
             send_osc_string(one_address, ip_address, port, enter_argument)
             send_osc_string(one_address, ip_address, port, enter_argument)
             send_osc_string(tab_address, ip_address, port, enter_argument)
-            time.sleep(.1)
+            osc_transport.sleep(.1)
             send_osc_string(cmd_address, ip_address, port, final_argument)
             
         return {'FINISHED'}
@@ -909,7 +910,7 @@ class ExecuteOnCueOperator(bpy.types.Operator):
             send_osc_string(address_one, ip_address, port, argument_one)
             send_osc_string(address_two, ip_address, port, argument_two)
             send_osc_string(address_one, ip_address, port, argument_off)
-            time.sleep(2)
+            osc_transport.sleep(2)
         
         address_three = "/eos/key/macro"
         argument_three = "11 Enter"
@@ -917,28 +918,28 @@ class ExecuteOnCueOperator(bpy.types.Operator):
         send_osc_string(address_three, ip_address, port, argument_three)  
         send_osc_string(address_three, ip_address, port, argument_three)  
         
-        time.sleep(.5)    
+        osc_transport.sleep(.5)    
         
         address_four = "/eos/newcmd"
         argument_four = "Delete " + str(active_strip.execute_with_macro_number) + " Enter Enter"
         
         send_osc_string(address_four, ip_address, port, argument_four)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         address_four_half = "/eos/newcmd"
         argument_four_half = str(active_strip.execute_with_macro_number) + " Enter"
         
         send_osc_string(address_four_half, ip_address, port, argument_four_half)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         address_five = "/eos/softkey/6"
         argument_five = "1"
         
         send_osc_string(address_five, ip_address, port, argument_five)
         
-        time.sleep(.1)
+        osc_transport.sleep(.1)
         
         address_six = "/eos/key/event"
         argument_six = "1"
@@ -951,7 +952,7 @@ class ExecuteOnCueOperator(bpy.types.Operator):
         for digit in event_list_number:
             key = "/eos/key/" + digit
             send_osc_string(key, ip_address, port, down)
-            time.sleep(.5)
+            osc_transport.sleep(.5)
 
         address_seven = "/eos/key/\\"
         argument_seven = "1"
@@ -974,17 +975,17 @@ class ExecuteOnCueOperator(bpy.types.Operator):
         address_twelve_half = "/eos/softkey/3"
         argument_twelve_half = "1"
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_seven, ip_address, port, argument_seven)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_eight, ip_address, port, argument_eight)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_time, ip_address, port, argument_time)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_ten, ip_address, port, argument_ten)        
         
         #Event
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_six, ip_address, port, argument_six)        
         
         event_list_number = str(active_strip.song_timecode_clock_number)
@@ -992,34 +993,34 @@ class ExecuteOnCueOperator(bpy.types.Operator):
         for digit in event_list_number:
             key = "/eos/key/" + digit
             send_osc_string(key, ip_address, port, down)
-            time.sleep(.5)
+            osc_transport.sleep(.5)
                 
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_seven, ip_address, port, argument_seven)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_eight, ip_address, port, argument_eight)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_nine, ip_address, port, argument_nine)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_ten, ip_address, port, argument_ten)       
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_twelve, ip_address, port, argument_twelve)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_twelve_half, ip_address, port, argument_twelve_half)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_ten, ip_address, port, argument_ten)
-        time.sleep(.5)        
+        osc_transport.sleep(.5)        
         
         address_thirteen = "/eos/key/live"
         argument_thirteen = "1"
         
         send_osc_string(address_thirteen, ip_address, port, argument_thirteen)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
 
         address_fourteen = "/eos/newcmd"
         argument_fourteen = "Cue " + str(active_strip.execute_on_cue_number) + " Execute Macro " + str(active_strip.execute_with_macro_number) + "Enter Enter"
@@ -1065,7 +1066,7 @@ class DisableOnCueOperator(bpy.types.Operator):
             send_osc_string(address_two, ip_address, port, argument_two)
             send_osc_string(address_one, ip_address, port, argument_off)
             
-            time.sleep(2)
+            osc_transport.sleep(2)
         
         address_three = "/eos/key/macro"
         argument_three = "11 Enter"
@@ -1073,28 +1074,28 @@ class DisableOnCueOperator(bpy.types.Operator):
         send_osc_string(address_three, ip_address, port, argument_three)  
         send_osc_string(address_three, ip_address, port, argument_three)  
         
-        time.sleep(.5)    
+        osc_transport.sleep(.5)    
         
         address_four = "/eos/newcmd"
         argument_four = "Delete " + str(active_strip.disable_with_macro_number) + " Enter Enter"
         
         send_osc_string(address_four, ip_address, port, argument_four)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         address_four_half = "/eos/newcmd"
         argument_four_half = str(active_strip.disable_with_macro_number) + " Enter"
         
         send_osc_string(address_four_half, ip_address, port, argument_four_half)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         address_five = "/eos/softkey/6"
         argument_five = "1"
         
         send_osc_string(address_five, ip_address, port, argument_five)
         
-        time.sleep(.1)
+        osc_transport.sleep(.1)
         
         address_six = "/eos/key/event"
         argument_six = "1"
@@ -1107,7 +1108,7 @@ class DisableOnCueOperator(bpy.types.Operator):
         for digit in event_list_number:
             key = "/eos/key/" + digit
             send_osc_string(key, ip_address, port, down)
-            time.sleep(.5)
+            osc_transport.sleep(.5)
 
         address_seven = "/eos/key/\\"
         argument_seven = "1"
@@ -1130,17 +1131,17 @@ class DisableOnCueOperator(bpy.types.Operator):
         address_twelve_half = "/eos/softkey/3"
         argument_twelve_half = "1"
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_seven, ip_address, port, argument_seven)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_eight, ip_address, port, argument_eight)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_time, ip_address, port, argument_time)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_ten, ip_address, port, argument_ten)        
         
         #Event
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_six, ip_address, port, argument_six)
                
         event_list_number = str(active_strip.song_timecode_clock_number)
@@ -1148,34 +1149,34 @@ class DisableOnCueOperator(bpy.types.Operator):
         for digit in event_list_number:
             key = "/eos/key/" + digit
             send_osc_string(key, ip_address, port, down)
-            time.sleep(.5)        
+            osc_transport.sleep(.5)        
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_seven, ip_address, port, argument_seven)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_eight, ip_address, port, argument_eight)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_nine, ip_address, port, argument_nine)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_ten, ip_address, port, argument_ten)       
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_twelve, ip_address, port, argument_twelve)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_twelve_half, ip_address, port, argument_twelve_half)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_ten, ip_address, port, argument_ten)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
                 
         address_thirteen = "/eos/key/live"
         argument_thirteen = "1"
         
         send_osc_string(address_thirteen, ip_address, port, argument_thirteen)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
 
         address_fourteen = "/eos/newcmd"
         argument_fourteen = "Cue " + str(active_strip.disable_on_cue_number) + " Execute Macro " + str(active_strip.disable_with_macro_number) + "Enter Enter"
@@ -1234,7 +1235,7 @@ class ExecuteAnimationOnCueOperator(bpy.types.Operator):
             send_osc_string(address_two, ip_address, port, argument_two)
             send_osc_string(address_one, ip_address, port, argument_off)
             
-            time.sleep(2)
+            osc_transport.sleep(2)
         
         address_three = "/eos/key/macro"
         argument_three = "11 Enter"
@@ -1242,28 +1243,28 @@ class ExecuteAnimationOnCueOperator(bpy.types.Operator):
         send_osc_string(address_three, ip_address, port, argument_three)  
         send_osc_string(address_three, ip_address, port, argument_three)  
         
-        time.sleep(.5)    
+        osc_transport.sleep(.5)    
         
         address_four = "/eos/newcmd"
         argument_four = "Delete " + str(active_strip.execute_animation_with_macro_number) + " Enter Enter"
         
         send_osc_string(address_four, ip_address, port, argument_four)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         address_four_half = "/eos/newcmd"
         argument_four_half = str(active_strip.execute_animation_with_macro_number) + " Enter"
         
         send_osc_string(address_four_half, ip_address, port, argument_four_half)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         address_five = "/eos/softkey/6"
         argument_five = "1"
         
         send_osc_string(address_five, ip_address, port, argument_five)
         
-        time.sleep(.1)
+        osc_transport.sleep(.1)
         
         address_six = "/eos/key/event"
         argument_six = "1"
@@ -1275,7 +1276,7 @@ class ExecuteAnimationOnCueOperator(bpy.types.Operator):
         for digit in event_list_number:
             key = "/eos/key/" + digit
             send_osc_string(key, ip_address, port, down)
-            time.sleep(.5)
+            osc_transport.sleep(.5)
 
         address_seven = "/eos/key/\\"
         argument_seven = "1"
@@ -1298,25 +1299,25 @@ class ExecuteAnimationOnCueOperator(bpy.types.Operator):
         address_twelve_half = "/eos/softkey/3"
         argument_twelve_half = "1"
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_seven, ip_address, port, argument_seven)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_eight, ip_address, port, argument_eight)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_time, ip_address, port, argument_time)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         down = "1"
         for digit in start_frame_in_timecode:
             key = "/eos/key/" + digit
             send_osc_string(key, ip_address, port, down)
-            time.sleep(.2)
+            osc_transport.sleep(.2)
             
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_ten, ip_address, port, argument_ten)
                 
         #Event
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_six, ip_address, port, argument_six)        
         
         event_list_number = str(active_strip.animation_event_list_number)
@@ -1324,34 +1325,34 @@ class ExecuteAnimationOnCueOperator(bpy.types.Operator):
         for digit in event_list_number:
             key = "/eos/key/" + digit
             send_osc_string(key, ip_address, port, down)
-            time.sleep(.5)        
+            osc_transport.sleep(.5)        
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_seven, ip_address, port, argument_seven)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_eight, ip_address, port, argument_eight)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_nine, ip_address, port, argument_nine)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_ten, ip_address, port, argument_ten)       
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_twelve, ip_address, port, argument_twelve)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_twelve_half, ip_address, port, argument_twelve_half)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_ten, ip_address, port, argument_ten)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
                
         address_thirteen = "/eos/key/live"
         argument_thirteen = "1"
         
         send_osc_string(address_thirteen, ip_address, port, argument_thirteen)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
 
         address_fourteen = "/eos/newcmd"
         argument_fourteen = "Cue 1 / " + str(active_strip.execute_animation_on_cue_number) + " Execute Macro " + str(active_strip.execute_animation_with_macro_number) + "Enter Enter"
@@ -1397,7 +1398,7 @@ class DisableAnimationOnCueOperator(bpy.types.Operator):
             send_osc_string(address_two, ip_address, port, argument_two)
             send_osc_string(address_one, ip_address, port, argument_off)
             
-            time.sleep(2)
+            osc_transport.sleep(2)
         
         address_three = "/eos/key/macro"
         argument_three = "11 Enter"
@@ -1405,28 +1406,28 @@ class DisableAnimationOnCueOperator(bpy.types.Operator):
         send_osc_string(address_three, ip_address, port, argument_three)  
         send_osc_string(address_three, ip_address, port, argument_three)  
         
-        time.sleep(.5)    
+        osc_transport.sleep(.5)    
         
         address_four = "/eos/newcmd"
         argument_four = "Delete " + str(active_strip.disable_animation_with_macro_number) + " Enter Enter"
         
         send_osc_string(address_four, ip_address, port, argument_four)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         address_four_half = "/eos/newcmd"
         argument_four_half = str(active_strip.disable_animation_with_macro_number) + " Enter"
         
         send_osc_string(address_four_half, ip_address, port, argument_four_half)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         address_five = "/eos/softkey/6"
         argument_five = "1"
         
         send_osc_string(address_five, ip_address, port, argument_five)
         
-        time.sleep(.1)
+        osc_transport.sleep(.1)
         
         address_six = "/eos/key/event"
         argument_six = "1"
@@ -1439,7 +1440,7 @@ class DisableAnimationOnCueOperator(bpy.types.Operator):
         for digit in event_list_number:
             key = "/eos/key/" + digit
             send_osc_string(key, ip_address, port, down)
-            time.sleep(.5)
+            osc_transport.sleep(.5)
 
 
         address_seven = "/eos/key/\\"
@@ -1463,17 +1464,17 @@ class DisableAnimationOnCueOperator(bpy.types.Operator):
         address_twelve_half = "/eos/softkey/3"
         argument_twelve_half = "1"
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_seven, ip_address, port, argument_seven)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_eight, ip_address, port, argument_eight)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_time, ip_address, port, argument_time)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_ten, ip_address, port, argument_ten)
                
         #Event
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_six, ip_address, port, argument_six)
                 
         event_list_number = str(active_strip.animation_event_list_number)
@@ -1481,34 +1482,34 @@ class DisableAnimationOnCueOperator(bpy.types.Operator):
         for digit in event_list_number:
             key = "/eos/key/" + digit
             send_osc_string(key, ip_address, port, down)
-            time.sleep(.5)
+            osc_transport.sleep(.5)
                 
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_seven, ip_address, port, argument_seven)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_eight, ip_address, port, argument_eight)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_nine, ip_address, port, argument_nine)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_ten, ip_address, port, argument_ten)       
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_twelve, ip_address, port, argument_twelve)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_twelve_half, ip_address, port, argument_twelve_half)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(address_ten, ip_address, port, argument_ten)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
                 
         address_thirteen = "/eos/key/live"
         argument_thirteen = "1"
         
         send_osc_string(address_thirteen, ip_address, port, argument_thirteen)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
 
         address_fourteen = "/eos/newcmd"
         argument_fourteen = "Cue 1 / " + str(active_strip.disable_animation_on_cue_number) + " Execute Macro " + str(active_strip.disable_animation_with_macro_number) + "Enter Enter"
@@ -1560,7 +1561,7 @@ class GenerateStartFrameMacroOperator(bpy.types.Operator):
             send_osc_string(address_two, ip_address, port, argument_two)
             send_osc_string(address_one, ip_address, port, argument_off)
             
-            time.sleep(2)
+            osc_transport.sleep(2)
         
         address_three = "/eos/key/macro"
         argument_three = "1"
@@ -1570,14 +1571,14 @@ class GenerateStartFrameMacroOperator(bpy.types.Operator):
         
         send_osc_string(address_six, ip_address, port, argument_six)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         address_seven = "/eos/key/macro"
         argument_seven = "1"
         
         send_osc_string(address_seven, ip_address, port, argument_seven)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         
         macro_number = str(active_strip.start_frame_macro)
@@ -1585,25 +1586,25 @@ class GenerateStartFrameMacroOperator(bpy.types.Operator):
         for digit in macro_number:
             key = "/eos/key/" + digit
             send_osc_string(key, ip_address, port, down)
-            time.sleep(.5)
+            osc_transport.sleep(.5)
             
         address_eight = "/eos/key/enter"
         argument_eight = "1"
         
         send_osc_string(address_eight, ip_address, port, argument_eight)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         send_osc_string(address_eight, ip_address, port, argument_eight)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         address_nine = "/eos/newcmd"
         argument_nine = active_strip.start_frame_macro_text
         
         send_osc_string(address_nine, ip_address, port, argument_nine)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         send_osc_string(address_six, ip_address, port, argument_six)
         
@@ -1648,7 +1649,7 @@ class GenerateEndFrameMacroOperator(bpy.types.Operator):
             send_osc_string(address_two, ip_address, port, argument_two)
             send_osc_string(address_one, ip_address, port, argument_off)
             
-            time.sleep(2)
+            osc_transport.sleep(2)
         
         address_three = "/eos/key/macro"
         argument_three = "1"
@@ -1658,14 +1659,14 @@ class GenerateEndFrameMacroOperator(bpy.types.Operator):
         
         send_osc_string(address_six, ip_address, port, argument_six)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         address_seven = "/eos/key/macro"
         argument_seven = "1"
         
         send_osc_string(address_seven, ip_address, port, argument_seven)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         
         macro_number = str(active_strip.end_frame_macro)
@@ -1673,7 +1674,7 @@ class GenerateEndFrameMacroOperator(bpy.types.Operator):
         for digit in macro_number:
             key = "/eos/key/" + digit
             send_osc_string(key, ip_address, port, down)
-            time.sleep(.5)
+            osc_transport.sleep(.5)
             
         
         address_eight = "/eos/key/enter"
@@ -1681,18 +1682,18 @@ class GenerateEndFrameMacroOperator(bpy.types.Operator):
         
         send_osc_string(address_eight, ip_address, port, argument_eight)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         send_osc_string(address_eight, ip_address, port, argument_eight)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         address_nine = "/eos/newcmd"
         argument_nine = active_strip.end_frame_macro_text
         
         send_osc_string(address_nine, ip_address, port, argument_nine)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         send_osc_string(address_six, ip_address, port, argument_six)
         
@@ -1759,34 +1760,34 @@ class BuildFlashMacrosOperator(bpy.types.Operator):
             send_osc_string(update, ip_address, port, up)
             send_osc_string(shift, ip_address, port, up)
             
-            time.sleep(2)
+            osc_transport.sleep(2)
         
         # Learn M 1
         send_osc_string(live, ip_address, port, down)
         send_osc_string(live, ip_address, port, up)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(learn, ip_address, port, enter_arg)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(macro, ip_address, port, down)
         send_osc_string(macro, ip_address, port, up)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         macro_number = str(active_strip.start_flash_macro_number)
         for digit in macro_number:
             key = "/eos/key/" + digit
             send_osc_string(key, ip_address, port, down)
             send_osc_string(key, ip_address, port, up)
-            time.sleep(.5)
+            osc_transport.sleep(.5)
             
         send_osc_string(enter, ip_address, port, down)
         send_osc_string(enter, ip_address, port, up)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         send_osc_string(enter, ip_address, port, down)
         send_osc_string(enter, ip_address, port, up)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         scene = bpy.context.scene
         frame_rate = get_frame_rate(scene)
@@ -1801,34 +1802,34 @@ class BuildFlashMacrosOperator(bpy.types.Operator):
         m1 = str(active_strip.flash_input_background) + " Sneak Time " + str(start_length) + " Enter "
         
         send_osc_string(new_cmd, ip_address, port, m1)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(enter, ip_address, port, down)
         send_osc_string(enter, ip_address, port, up)
         send_osc_string(learn, ip_address, port, enter_arg)
                 
         # Learn M 2
         send_osc_string(learn, ip_address, port, enter_arg)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(macro, ip_address, port, down)
         send_osc_string(macro, ip_address, port, up)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         macro_number = str(active_strip.end_flash_macro_number)
         for digit in macro_number:
             key = "/eos/key/" + digit
             send_osc_string(key, ip_address, port, down)
             send_osc_string(key, ip_address, port, up)
-            time.sleep(.5)
+            osc_transport.sleep(.5)
             
         send_osc_string(enter, ip_address, port, down)
         send_osc_string(enter, ip_address, port, up)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         send_osc_string(enter, ip_address, port, down)
         send_osc_string(enter, ip_address, port, up)
         
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         
         scene = bpy.context.scene
         frame_rate = get_frame_rate(scene)
@@ -1843,7 +1844,7 @@ class BuildFlashMacrosOperator(bpy.types.Operator):
         m1 = str(active_strip.flash_input_background) + " Sneak Time " + str(start_length) + " Enter "
         m2 = str(active_strip.flash_down_input_background) + " Sneak Time " + str(end_length) + " Enter"
         send_osc_string(new_cmd, ip_address, port, m2)
-        time.sleep(.5)
+        osc_transport.sleep(.5)
         send_osc_string(enter, ip_address, port, down)
         send_osc_string(enter, ip_address, port, up)
         send_osc_string(learn, ip_address, port, enter_arg)
@@ -3164,9 +3165,6 @@ class ColorPaletteOperator(bpy.types.Operator):
         port = context.scene.scene_props.int_osc_port
         scene = bpy.context.scene
         cp_number = scene.color_palette_number
-        cp_red = scene.color_palette_color[0]
-        cp_green = scene.color_palette_color[1]
-        cp_blue = scene.color_palette_color[2]
         cp_label = scene.color_palette_name
         newcmd = "/eos/newcmd"
         live = "/eos/key/live"
@@ -3174,58 +3172,24 @@ class ColorPaletteOperator(bpy.types.Operator):
         down = "1"
         up = "0"
         
-        cp_red = round(cp_red * 100, 1)
-        cp_green = round(cp_green * 100, 1)
-        cp_blue = round(cp_blue * 100, 1)
-        
         send_osc_string(live, ip_address, port, down)
         send_osc_string(live, ip_address, port, up)
         
-        time.sleep(.3)
-        
-        argument = "Chan 1 thru thru 1000 Red " + str(cp_red) + " Enter"
-        send_osc_string(newcmd, ip_address, port, argument)
-        
-        time.sleep(.3)
-        
-        argument = "Chan 1 thru thru 1000 Green " + str(cp_green) + " Enter"
-        send_osc_string(newcmd, ip_address, port, argument)
-        
-        time.sleep(.3)
-        
-        argument = "Chan 1 thru thru 1000 Blue " + str(cp_blue) + " Enter"
-        send_osc_string(newcmd, ip_address, port, argument)
-        
-        time.sleep(.3)
-        
-        argument = "Chan 1 thru thru 1000 Amber 0 Enter"
-        send_osc_string(newcmd, ip_address, port, argument)
-        
-        time.sleep(.3)
-        
-        argument = "Chan 1 thru thru 1000 Mint 0 Enter"
-        send_osc_string(newcmd, ip_address, port, argument)
-        
-        time.sleep(.3)
+        osc_transport.sleep(.3)
         
-        if cp_red + cp_green + cp_blue != 300:
-            argument = "Chan 1 thru thru 1000 White 0 Enter"
+        for argument in pack_console_commands(get_color_palette_commands(scene), scene.console_command_byte_budget, scene.osc_datagram_mtu):
             send_osc_string(newcmd, ip_address, port, argument)
-        else: 
-            argument = "Chan 1 thru thru 1000 White 100 Enter"
-            send_osc_string(newcmd, ip_address, port, argument)
-        
-        time.sleep(.3)
+            osc_transport.sleep(.3)
         
         argument = "Chan 1 thru thru 1000 Record Color_Palette " + str(cp_number) + " Enter Enter"
         send_osc_string(newcmd, ip_address, port, argument)
         
-        time.sleep(.3)
+        osc_transport.sleep(.3)
         
         argument = "Color_Palette " + str(cp_number) + " Label " + str(cp_label)
         send_osc_string(newcmd, ip_address, port, argument)
         
-        time.sleep(.3)
+        osc_transport.sleep(.3)
         
         send_osc_string(enter, ip_address, port, down)
         send_osc_string(enter, ip_address, port, up)
@@ -3261,7 +3225,7 @@ class DeleteAnimationCueListOperator(bpy.types.Operator):
         send_osc_string(address, ip_address, port, down)
         send_osc_string(address, ip_address, port, up)
         
-        time.sleep(.2)
+        osc_transport.sleep(.2)
         
         address = "/eos/newcmd"
         argument = "Delete Cue " + str(cue_list) + " / Enter"
@@ -3287,7 +3251,7 @@ class DeleteAnimationEventListOperator(bpy.types.Operator):
         send_osc_string(address, ip_address, port, down)
         send_osc_string(address, ip_address, port, up)
         
-        time.sleep(.2)
+        osc_transport.sleep(.2)
         
         address = "/eos/newcmd"
         argument = "Delete Event " + str(event_list) + " / Enter"
@@ -3313,116 +3277,135 @@ class StopAnimationClockOperator(bpy.types.Operator):
         return {'FINISHED'}
 
 
+def load_qmeo_fingerprints(strip):
+    """Returns ({frame: fingerprint} for every sampled frame, sorted frames that have cues) from the last bake."""
+    stored = json.loads(strip.qmeo_fingerprints) if strip.qmeo_fingerprints else {"frames": {}, "cues": []}
+    return {int(frame): fingerprint for frame, fingerprint in stored["frames"].items()}, sorted(stored["cues"])
+
+
+def store_qmeo_fingerprints(scene_name, strip_name, fingerprints, cue_frames):
+    scene = bpy.data.scenes.get(scene_name)
+    strip = scene.sequence_editor.sequences_all.get(strip_name) if scene and scene.sequence_editor else None
+    if strip:
+        strip.qmeo_fingerprints = json.dumps({"frames": fingerprints, "cues": list(cue_frames)}, separators=(",", ":"))
+
+
+def qmeo_frame_to_timecode(frame, fps):
+    """Convert frame number to timecode format."""
+    hours = int(frame // (fps * 3600))
+    minutes = int((frame % (fps * 3600)) // (fps * 60))
+    seconds = int((frame % (fps * 60)) // fps)
+    frames = int(frame % fps)  # No rounding needed for non-drop frame
+
+    return "{:02}:{:02}:{:02}:{:02}".format(hours, minutes, seconds, frames)
+
+
+def get_qmeo_timing_packets(scene, strip, cue_frames, frames, recorded_frames=None):
+    """
+    Fade times and timecode events for a qmeo's cues.
+
+    :param cue_frames: Sorted frames that have cues.
+    :param frames: Every frame of the strip, for the single thru command when every frame has a cue.
+    :param recorded_frames: Cues actually recorded, if delta mode held some of cue_frames.
+    """
+    frame_rate = get_frame_rate(scene)
+    cue_duration = round(1 / frame_rate, 2)
+    cue_list = str(strip.animation_cue_list_number)
+    event_list = str(strip.animation_event_list_number)
+    budget, mtu = scene.console_command_byte_budget, scene.osc_datagram_mtu
+    newcmd = "/eos/newcmd"
+    packets = []
+
+    # Each cue fades over its whole segment, fired the frame after the previous kept cue,
+    # which is the usual one-frame fade when nothing was dropped.
+    fire_frames = cue_frames[:1] + [previous + 1 for previous in cue_frames[:-1]]
+    fade_times = [cue_duration] + [round((frame - previous) / frame_rate, 2) for previous, frame in zip(cue_frames, cue_frames[1:])]
+
+    if recorded_frames is not None and recorded_frames != cue_frames:
+        # Delta mode holds unchanged frames by not recording them, so their cue and event drop out too.
+        recorded = set(recorded_frames)
+        kept = [index for index, frame in enumerate(cue_frames) if frame in recorded]
+        cue_frames = [cue_frames[index] for index in kept]
+        fire_frames = [fire_frames[index] for index in kept]
+        fade_times = [fade_times[index] for index in kept]
+
+    if cue_frames == frames:
+        # Enter and execute command to set duration for all new cues
+        packets.append((newcmd, "Cue " + cue_list + " / " + str(frames[0]) + " thru " + str(frames[-1] + 1) + " Time " + str(cue_duration) + " Enter ", .5))
+
+        # Set up timecode clock to fire the cues
+        packets.append((newcmd, "Event " + event_list + " / " + str(frames[0]) + " thru " + str(frames[-1] + 1) + " Enter", .3))
+    else:
+        cue_commands = ["Cue " + cue_list + " / " + str(frame) + " Time " + str(fade_time) + " Enter" for frame, fade_time in zip(cue_frames, fade_times)]
+        for argument in pack_console_commands(cue_commands, budget, mtu):
+            packets.append((newcmd, argument, .3))
+
+        # Same event list setup as a full bake, one command per run of consecutive cue frames.
+        runs = []
+        for frame in cue_frames:
+            if runs and runs[-1][1] == frame - 1:
+                runs[-1][1] = frame
+            else:
+                runs.append([frame, frame])
+        event_setup = ["Event " + event_list + " / " + (str(first) if first == last else str(first) + " thru " + str(last)) + " Enter" for first, last in runs]
+        for argument in pack_console_commands(event_setup, budget, mtu):
+            packets.append((newcmd, argument, .3))
+
+    # Events don't depend on the frame's look, so they go out packed instead of one per frame.
+    event_commands = []
+    for frame, fire_frame in zip(cue_frames, fire_frames):
+        timecode = qmeo_frame_to_timecode(fire_frame, frame_rate)
+        event_commands.append("Event " + event_list + " / " + str(frame) + " Time " + str(timecode) + " Show_Control_Action Cue " + str(frame) + " Enter")
+
+    for argument in pack_console_commands(event_commands, budget, mtu):
+        packets.append((newcmd, argument, .3))
+
+    return packets, cue_frames
+
+
 class BakeFCurvesToCuesOperator(bpy.types.Operator):
     bl_idname = "my.bake_fcurves_to_cues_operator"
     bl_label = "Bake F-curves To Cues"
     bl_description = "Orb will create a qmeo. A qmeo is like a video, only each frame is a lighting cue. Use it to store complex animation data on the lighting console" 
 
-    def frame_to_timecode(self, frame, fps=None):
-        """Convert frame number to timecode format."""
-        scene = bpy.context.scene
-        context = bpy.context
-        active_strip = context.scene.sequence_editor.active_strip
-        frame_rate = get_frame_rate(scene)
-        start_frame = active_strip.frame_start
-        end_frame = active_strip.frame_final_end  
-        ip_address = bpy.context.scene.scene_props.str_osc_ip_address
-        port = bpy.context.scene.scene_props.int_osc_port
-        current_frame_number = scene.frame_current
-        cue_duration = 1 / frame_rate
-        cue_duration = round(cue_duration, 2)
-        event_list_number = active_strip.animation_event_list_number
-        fps = frame_rate
-        
-        hours = int(frame // (fps * 3600))
-        minutes = int((frame % (fps * 3600)) // (fps * 60))
-        seconds = int((frame % (fps * 60)) // fps)
-        frames = int(frame % fps)  # No rounding needed for non-drop frame
-
-        return "{:02}:{:02}:{:02}:{:02}".format(hours, minutes, seconds, frames)
-    
     def execute(self, context):
         scene = context.scene
+        if send_job_running():
+            self.report({'ERROR'}, "Orb is still sending the last bake or render in the background. Try again once it finishes.")
+            return {'CANCELLED'}
         active_strip = context.scene.sequence_editor.active_strip
-        frame_rate = get_frame_rate(scene)
-        start_frame = active_strip.frame_start
-        end_frame = active_strip.frame_final_end  
         ip_address = scene.scene_props.str_osc_ip_address
         port = scene.scene_props.int_osc_port
-        current_frame_number = scene.frame_current
-        cue_duration = 1 / frame_rate
-        cue_duration = round(cue_duration, 2)
-        event_list_number = active_strip.animation_event_list_number
-        
-        newcmd = "/eos/newcmd"
-        softkey_2 = "/eos/softkey/2"
-        zero = "/eos/key/0"
-        enter = "/eos/key/enter"
-        go = "/eos/key/go"
-        event = "/eos/key/event"
-        
-        down = "1"
-        up = "0"
 
         # Create a sorted list of frames
-        start_frame = int(start_frame)
-        end_frame = int(end_frame)
-        frames = list(range(start_frame, end_frame))
-
-        # Iterate through the frames and perform operations
-        for frame in frames:
-            context.scene.frame_set(frame)
-            depsgraph = context.evaluated_depsgraph_get()  # Get the dependency graph
-            context.view_layer.update()
-            bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
-            
-            current_frame_number = scene.frame_current
-            
-            # Record cue
-            argument = "Record " + str(active_strip.animation_cue_list_number) + " / " + str(current_frame_number) + " Enter Enter"
-            send_osc_string(newcmd, ip_address, port, argument)
-            time.sleep(.1)
-        
-        time.sleep(.5)
-            
-        # Enter and execute command to set duration for all new cues
-        argument = "Cue " + str(active_strip.animation_cue_list_number) + " / " + str(start_frame) + " thru " + str(end_frame) + " Time " + str(cue_duration) + " Enter "
-        send_osc_string(newcmd, ip_address, port, argument)
-        
-        time.sleep(.5)
-        
-        # Set up timecode clock to fire the cues
-        argument = "Event " + str(event_list_number) + " / " + str(start_frame) + " thru " + str(end_frame) + " Enter"
-        send_osc_string(newcmd, ip_address, port, argument)
-        
-        time.sleep(.3)
-        
-        # Create all events to help with organization
-        argument = "Event " + str(active_strip.animation_event_list_number) + " / " + str(start_frame) + " thru " + str(end_frame) + " Enter"
-        send_osc_string(newcmd, ip_address, port, argument)
-        
-        time.sleep(.3)
+        frames = list(range(int(active_strip.frame_start), int(active_strip.frame_final_end)))
+
+        # Every cue's look is sampled up front, then everything streams out on a timer instead of stepping the playhead.
+        frame_looks = sample_qmeo_looks(scene, active_strip, frames)
+        if active_strip.qmeo_tolerance > 0:
+            kept = simplify_keyframes(get_qmeo_look_matrix(frame_looks), active_strip.qmeo_tolerance)
+            cue_frames = [frames[index] for index in kept]
+            looks = [frame_looks[index] for index in kept]
+        else:
+            cue_frames = frames
+            looks = frame_looks
         
-        for frame in frames:         
-            # Record all cues
-            bpy.context.scene.frame_set(frame)
-            bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
-            
-            time.sleep(.1)
-            current_frame_number = scene.frame_current
-            
-            timecode = self.frame_to_timecode(frame)
-            
-            argument = "Event " + str(active_strip.animation_event_list_number) + " / " + str(current_frame_number) + " Time " + str(timecode) + " Show_Control_Action Cue " + str(frame) + " Enter"
-            send_osc_string(newcmd, ip_address, port, argument)
+        packets, recorded_frames = get_qmeo_record_packets(scene, active_strip, cue_frames, looks, delta=active_strip.qmeo_delta)
+        if packets:
+            packets[-1] = packets[-1][:2] + (.5,)
             
-            time.sleep(.3)
+        timing_packets, cue_frames = get_qmeo_timing_packets(scene, active_strip, cue_frames, frames, recorded_frames)
+        packets += timing_packets
             
         if context.scene.orb_finish_snapshot:
             snapshot = str(context.scene.orb_finish_snapshot)
-            send_osc_string("/eos/newcmd", ip_address, port, f"Snapshot {snapshot} Enter")
+            packets.append(("/eos/newcmd", f"Snapshot {snapshot} Enter"))
             
-        self.report({'INFO'}, "Orb complete.")
+        # Fingerprints of every sampled frame, cue or not, so Re-record Cues can find whatever changed.
+        fingerprints = get_qmeo_fingerprints(active_strip, frames, frame_looks)
+        
+        OscSendJob(ip_address, port, packets, on_finish=partial(store_qmeo_fingerprints, scene.name, active_strip.name, fingerprints, cue_frames)).start()
+        self.report({'INFO'}, f"Orb is recording {len(cue_frames)} cues in the background.")
         
         return {'FINISHED'}
  
@@ -3430,102 +3413,53 @@ class BakeFCurvesToCuesOperator(bpy.types.Operator):
 class RerecordCuesOperator(bpy.types.Operator):
     bl_idname = "my.rerecord_cues_operator"
     bl_label = "Re-record Cues"
-    bl_description = "Orb will re-record the cues. Use this instead of the left button if you already used that button, updated the animation without changing its length, and just want to re-record the existing cues. This is far shorter" 
+    bl_description = "Orb will re-record the cues. Use this instead of the left button if you already used that button, updated the animation without changing its length, and just want to re-record the existing cues. Only frames that changed since the last bake are re-recorded, in the background" 
     
     def execute(self, context):
         scene = context.scene
+        if send_job_running():
+            self.report({'ERROR'}, "Orb is still sending the last bake or render in the background. Try again once it finishes.")
+            return {'CANCELLED'}
         active_strip = scene.sequence_editor.active_strip
-        frame_rate = get_frame_rate(scene)
-        start_frame = active_strip.frame_start
-        end_frame = active_strip.frame_final_end  
         ip_address = scene.scene_props.str_osc_ip_address
         port = scene.scene_props.int_osc_port
-        current_frame_number = scene.frame_current
-        cue_duration = 1 / frame_rate
-        cue_duration = round(cue_duration, 2)
-        event_list_number = active_strip.animation_event_list_number
         
-        newcmd = "/eos/newcmd"
-        softkey_2 = "/eos/softkey/2"
-        zero = "/eos/key/0"
-        enter = "/eos/key/enter"
-        go = "/eos/key/go"
-        event = "/eos/key/event"
+        # The whole strip is compared, so frames the last bake held or dropped get cues once they differ.
+        stored, stored_cues = load_qmeo_fingerprints(active_strip)
+        frames = list(range(int(active_strip.frame_start), int(active_strip.frame_final_end)))
         
-        down = "1"
-        up = "0"
-
-        # Create a sorted list of frames
-        start_frame = int(start_frame)
-        end_frame = int(end_frame)
-        frames = list(range(start_frame, end_frame))
-
-        # Iterate through the frames and perform operations
-        for frame in frames:
-            scene.frame_set(frame)
-            bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
-
-            current_frame_number = scene.frame_current
-            
-            # Record all cues
-            argument = "Record " + str(active_strip.animation_cue_list_number) + " / " + str(current_frame_number) + " Enter Enter"
-            send_osc_string(newcmd, ip_address, port, argument)
-            time.sleep(1.2)
+        looks = sample_qmeo_looks(scene, active_strip, frames)
+        fingerprints = get_qmeo_fingerprints(active_strip, frames, looks)
+        changed = [index for index, frame in enumerate(frames) if stored.get(frame) != fingerprints[str(frame)]]
         
-        time.sleep(.5)
-            
-        # Enter and execute command to set duration for all new cues
-        argument = "Cue " + str(active_strip.animation_cue_list_number) + " / " + str(start_frame) + " thru " + str(end_frame) + " Time " + str(cue_duration) + " Enter "
-        send_osc_string(newcmd, ip_address, port, argument)
+        if not changed:
+            self.report({'INFO'}, "Every cue already matches the animation.")
+            return {'FINISHED'}
+        
+        changed_frames = [frames[index] for index in changed]
+        packets, recorded_frames = get_qmeo_record_packets(scene, active_strip, changed_frames, [looks[index] for index in changed], record_delay=None, 
+                                                           delta=active_strip.qmeo_delta, record_all_touched=True)
+        
+        # New cues change their neighbours' fades, so timing goes out again whenever the cue set grows.
+        cue_frames = sorted(set(stored_cues) | set(recorded_frames))
+        if cue_frames != stored_cues:
+            timing_packets, cue_frames = get_qmeo_timing_packets(scene, active_strip, cue_frames, frames)
+            packets += timing_packets
         
         if context.scene.orb_finish_snapshot:
             snapshot = str(context.scene.orb_finish_snapshot)
-            send_osc_string("/eos/newcmd", ip_address, port, f"Snapshot {snapshot} Enter")
+            packets.append(("/eos/newcmd", f"Snapshot {snapshot} Enter"))
+            
+        # Unchanged frames keep their stored fingerprints, which already match.
+        AckPacedSendJob(ip_address, port, packets, scene.scene_props.int_osc_reply_port, 
+                        on_finish=partial(store_qmeo_fingerprints, scene.name, active_strip.name, fingerprints, cue_frames)).start()
 
-        self.report({'INFO'}, "Orb complete.")
+        self.report({'INFO'}, f"Orb is re-recording {len(changed_frames)} of {len(frames)} frames in the background.")
         
         return {'FINISHED'}
  
  
-class GenerateTextOperator(bpy.types.Operator):
-    bl_idname = "my.generate_text"
-    bl_label = "CIA > Import > USITT ASCII"
-    bl_description = "Save event list into a .txt file for USITT ASCII import into Eos. Then, save as .esf3d console file. Then open up the main show file and merge the Show Control from the newly created .esf3d console file"
-    
-    def frame_to_timecode(self, frame, fps=None):
-        context = bpy.context
-        scene = context.scene
-        """Convert frame number to timecode format."""
-        if fps is None:
-            fps = get_frame_rate(scene)
-        hours = int(frame // (fps * 3600))
-        frame %= fps * 3600
-        minutes = int(frame // (fps * 60))
-        frame %= fps * 60
-        seconds = int(frame // fps)
-        frames = int(round(frame % fps))
-        return "{:02}:{:02}:{:02}:{:02}".format(hours, minutes, seconds, frames)
-
-    
-    def execute(self, context):
-        scene = context.scene
-        song_timecode_clock_number = context.scene.sequence_editor.active_strip.song_timecode_clock_number
-        seq_start = context.scene.frame_start
-        seq_end = context.scene.frame_end
-        active_strip = context.scene.sequence_editor.active_strip
-        frames_per_second = get_frame_rate(scene)
-        
-        #Determines if song strip starts at frame 1 and if not, by what positive or negative amount
-        if active_strip.frame_start > 1:
-            slide_factor = active_strip.frame_start - 1
-        elif active_strip.frame_start < 1:
-            slide_factor = 1 - active_strip.frame_start
-        else:
-            slide_factor = 0
-            
-        text_block = bpy.data.texts.new(name="Generated Show File.txt")
-        
-        text_block.write("""Ident 3:0
+usitt_ascii_header = """Ident 3:0
 Manufacturer ETC
 Console Eos
 $$Format 3.20
@@ -3558,77 +3492,94 @@ $$Software Version 3.2.2 Build 25  Fixture Library 3.2.0.75, 26.Apr.2023
 !                   if Macro then macro number
 
 
-""")
-
-        text_block.write("$SCList " + str(active_strip.song_timecode_clock_number) + " 2\n")
-        text_block.write("$$FirstFrame  00:00:00:00\n")
-        text_block.write("$$LastFrame  23:59:59:00\n")
-        text_block.write("$$FramesPerSecond " + str(frames_per_second) + "\n")
-        text_block.write("\n")
-        text_block.write("\n")
-        text_block.write("\n")
-        text_block.write("\n")
-
-        for strip in context.scene.sequence_editor.sequences:
-            if strip.type == "COLOR" and strip.my_settings.motif_type_enum == 'option_eos_cue' and seq_start <= strip.frame_start <= seq_end and not strip.mute:
-                eos_cue_number = strip.eos_cue_number
-                strip_name = strip.name
-                start_frame = strip.frame_start - slide_factor
-                if eos_cue_number:         
-                    text_block.write("$Timecode  " + self.frame_to_timecode(start_frame) + "\n")
-                    text_block.write("Text " + strip_name + "\n")
-                    text_block.write("$$SCData C 1/" + str(eos_cue_number) + "\n")
-                    text_block.write("\n")
-                    text_block.write("\n")
-
-            # Check if it's a color strip and lies within sequencer's start and end frame and is a macro strip
-            if strip.type == "COLOR" and strip.my_settings.motif_type_enum == 'option_eos_macro' and seq_start <= strip.frame_start <= seq_end and not strip.mute:
-                start_macro_number = strip.start_frame_macro
-                end_macro_number = strip.end_frame_macro
-                strip_name = strip.name
-                start_frame = strip.frame_start - slide_factor
-                end_frame = strip.frame_final_end - slide_factor
-                if start_macro_number != 0 and not strip.start_macro_muted:         
-                    text_block.write("$Timecode  " + self.frame_to_timecode(start_frame) + "\n")
-                    text_block.write("Text " + strip_name + " (Start Macro)" + "\n")
-                    text_block.write("$$SCData M " + str(start_macro_number) + "\n")  
-                    text_block.write("\n")
-                    text_block.write("\n")
-                if end_macro_number != 0 and not strip.end_macro_muted:         
-                    text_block.write("$Timecode  " + self.frame_to_timecode(end_frame) + "\n")
-                    text_block.write("Text " + strip_name + " (End Macro)" + "\n")
-                    text_block.write("$$SCData M " + str(end_macro_number) + "\n")    
-                    text_block.write("\n")
-                    text_block.write("\n")
-                    
-            if strip.type == "COLOR" and strip.my_settings.motif_type_enum == 'option_eos_flash' and seq_start <= strip.frame_start <= seq_end and not strip.mute:
-                start_flash_macro_number = strip.start_flash_macro_number
-                end_flash_macro_number = strip.end_flash_macro_number
-                strip_name = strip.name
-                start_frame = strip.frame_start - slide_factor
-                end_frame = strip.frame_final_end
-                bias = strip.flash_bias
-                frame_rate = get_frame_rate(scene)
-                strip_length_in_frames = strip.frame_final_duration
-                bias_in_frames = calculate_bias_offseter(bias, frame_rate, strip_length_in_frames)
-                start_frame = strip.frame_start - slide_factor
-                end_flash_macro_frame = start_frame + bias_in_frames
-                end_flash_macro_frame = int(round(end_flash_macro_frame))
-                end_frame = end_flash_macro_frame
-
-                # If only the start flash macro is provided
-                if start_flash_macro_number != 0:         
-                    text_block.write("$Timecode  " + self.frame_to_timecode(start_frame) + "\n")
-                    text_block.write("Text " + strip_name + " (Flash Up)" + "\n")
-                    text_block.write("$$SCData M " + str(start_flash_macro_number) + "\n")  
-                    text_block.write("\n")
-                    text_block.write("\n")
-                if end_flash_macro_number != 0:         
-                    text_block.write("$Timecode  " + self.frame_to_timecode(end_frame) + "\n")
-                    text_block.write("Text " + strip_name + " (Flash Down)" + "\n")
-                    text_block.write("$$SCData M " + str(end_flash_macro_number) + "\n")    
-                    text_block.write("\n")
-                    text_block.write("\n")
+"""
+
+
+def frame_to_usitt_timecode(frame, fps):
+    """Convert frame number to timecode format."""
+    hours = int(frame // (fps * 3600))
+    frame %= fps * 3600
+    minutes = int(frame // (fps * 60))
+    frame %= fps * 60
+    seconds = int(frame // fps)
+    frames = int(round(frame % fps))
+    return "{:02}:{:02}:{:02}:{:02}".format(hours, minutes, seconds, frames)
+
+
+#Determines if song strip starts at frame 1 and if not, by what positive or negative amount
+def get_slide_factor(song_strip):
+    if song_strip.frame_start > 1:
+        return song_strip.frame_start - 1
+    elif song_strip.frame_start < 1:
+        return 1 - song_strip.frame_start
+    else:
+        return 0
+
+
+def get_usitt_list_header(event_list_number, frames_per_second):
+    return ("$SCList " + str(event_list_number) + " 2\n"
+            "$$FirstFrame  00:00:00:00\n"
+            "$$LastFrame  23:59:59:00\n"
+            "$$FramesPerSecond " + str(frames_per_second) + "\n"
+            "\n\n\n\n")
+
+
+def usitt_event(timecode, text, data):
+    return "$Timecode  " + timecode + "\n" + "Text " + text + "\n" + "$$SCData " + data + "\n\n\n"
+
+
+def iter_usitt_events(scene, strips, slide_factor, first_frame, last_frame):
+    """Yields one $Timecode record at a time for the cue, macro and flash strips starting between first_frame and last_frame."""
+    fps = get_frame_rate(scene)
+    
+    for strip in strips:
+        if strip.type != "COLOR" or strip.mute or not first_frame <= strip.frame_start <= last_frame:
+            continue
+        motif_type = strip.my_settings.motif_type_enum
+        start_frame = strip.frame_start - slide_factor
+        
+        if motif_type == 'option_eos_cue':
+            if strip.eos_cue_number:
+                yield usitt_event(frame_to_usitt_timecode(start_frame, fps), strip.name, "C 1/" + str(strip.eos_cue_number))
+
+        elif motif_type == 'option_eos_macro':
+            end_frame = strip.frame_final_end - slide_factor
+            if strip.start_frame_macro != 0 and not strip.start_macro_muted:
+                yield usitt_event(frame_to_usitt_timecode(start_frame, fps), strip.name + " (Start Macro)", "M " + str(strip.start_frame_macro))
+            if strip.end_frame_macro != 0 and not strip.end_macro_muted:
+                yield usitt_event(frame_to_usitt_timecode(end_frame, fps), strip.name + " (End Macro)", "M " + str(strip.end_frame_macro))
+                
+        elif motif_type == 'option_eos_flash':
+            bias_in_frames = calculate_bias_offseter(strip.flash_bias, fps, strip.frame_final_duration)
+            end_frame = int(round(start_frame + bias_in_frames))
+            if strip.start_flash_macro_number != 0:
+                yield usitt_event(frame_to_usitt_timecode(start_frame, fps), strip.name + " (Flash Up)", "M " + str(strip.start_flash_macro_number))
+            if strip.end_flash_macro_number != 0:
+                yield usitt_event(frame_to_usitt_timecode(end_frame, fps), strip.name + " (Flash Down)", "M " + str(strip.end_flash_macro_number))
+                
+
+class GenerateTextOperator(bpy.types.Operator):
+    bl_idname = "my.generate_text"
+    bl_label = "CIA > Import > USITT ASCII"
+    bl_description = "Save event list into a .txt file for USITT ASCII import into Eos. Then, save as .esf3d console file. Then open up the main show file and merge the Show Control from the newly created .esf3d console file"
+    
+    def frame_to_timecode(self, frame, fps=None):
+        if fps is None:
+            fps = get_frame_rate(bpy.context.scene)
+        return frame_to_usitt_timecode(frame, fps)
+
+    
+    def execute(self, context):
+        scene = context.scene
+        active_strip = context.scene.sequence_editor.active_strip
+        frames_per_second = get_frame_rate(scene)
+        slide_factor = get_slide_factor(active_strip)
+            
+        text_block = bpy.data.texts.new(name="Generated Show File.txt")
+        
+        text_block.write(usitt_ascii_header)
+        text_block.write(get_usitt_list_header(active_strip.song_timecode_clock_number, frames_per_second))
+        text_block.write("".join(iter_usitt_events(scene, scene.sequence_editor.sequences, slide_factor, scene.frame_start, scene.frame_end)))
                     
         for area in bpy.context.screen.areas:
             if area.type == 'SEQUENCE_EDITOR':
@@ -3642,6 +3593,75 @@ $$Software Version 3.2.2 Build 25  Fixture Library 3.2.0.75, 26.Apr.2023
         return {'FINISHED'}
     
     
+def get_usitt_exports(scene, filepath, split_event_lists):
+    """(path, song strip, first frame, last frame) for each file to write. Without splitting, the active sound strip's list covers the whole scene."""
+    if not split_event_lists:
+        active_strip = scene.sequence_editor.active_strip
+        if active_strip is None or active_strip.type != 'SOUND':
+            return []
+        return [(filepath, active_strip, scene.frame_start, scene.frame_end)]
+    
+    root, extension = os.path.splitext(filepath)
+    exports = {}
+    for strip in scene.sequence_editor.sequences:
+        if strip.type == 'SOUND' and not strip.mute and strip.song_timecode_clock_number != 0:
+            exports.setdefault(strip.song_timecode_clock_number, 
+                               (f"{root}_event_list_{strip.song_timecode_clock_number}{extension or '.asc'}", strip, strip.frame_start, strip.frame_final_end - 1))
+    return [exports[number] for number in sorted(exports)]
+
+
+def write_usitt_exports(scene, exports):
+    """Streams each export to disk. Returns events and bytes written, raises OSError if a file can't be written."""
+    frames_per_second = get_frame_rate(scene)
+    events_written = 0
+    bytes_written = 0
+    
+    for path, song_strip, first_frame, last_frame in exports:
+        events = iter_usitt_events(scene, scene.sequence_editor.sequences, get_slide_factor(song_strip), first_frame, last_frame)
+        with open(bpy.path.abspath(path), 'w', encoding='utf-8', newline='\n', buffering=1 << 16) as file:
+            file.write(usitt_ascii_header)
+            file.write(get_usitt_list_header(song_strip.song_timecode_clock_number, frames_per_second))
+            for record in events:
+                file.write(record)
+                events_written += 1
+        bytes_written += os.path.getsize(bpy.path.abspath(path))
+        
+    return events_written, bytes_written
+
+
+class ExportUsittAsciiOperator(bpy.types.Operator):
+    bl_idname = "my.export_usitt_ascii"
+    bl_label = "Export USITT ASCII"
+    bl_description = "Write the event list straight to a USITT ASCII file on disk for import into Eos, without creating a text block in the .blend file"
+    
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.asc;*.txt", options={'HIDDEN'})
+    split_event_lists: bpy.props.BoolProperty(name="One File per Event List", default=False, description="Write a separate file for every timecode sound strip, named after its event list number. Each file only holds the events inside that song")
+    
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = bpy.path.ensure_ext(bpy.path.abspath("//Show Control") if bpy.data.filepath else "Show Control", ".asc")
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def execute(self, context):
+        exports = get_usitt_exports(context.scene, self.filepath, self.split_event_lists)
+        
+        if not exports:
+            self.report({'ERROR'}, "Select a sound strip with an event list number first.")
+            return {'CANCELLED'}
+        
+        try:
+            events_written, bytes_written = write_usitt_exports(context.scene, exports)
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not write {e.filename}: {e.strerror}")
+            return {'CANCELLED'}
+            
+        self.report({'INFO'}, f"Wrote {events_written} events ({bytes_written} bytes) to {len(exports)} file(s).")
+        
+        return {'FINISHED'}
+    
+    
 def get_motif_name_items(self, context):
     unique_names = set()
 
@@ -3653,15 +3673,409 @@ def get_motif_name_items(self, context):
     return items
     
     
+def usitt_timecode_to_seconds(timecode, fps):
+    hours, minutes, seconds, frames = (int(part) for part in timecode.replace(";", ":").split(":"))
+    return hours * 3600 + minutes * 60 + seconds + frames / fps
+
+
+def usitt_time_to_seconds(time_string):
+    # Cue times are seconds, or minutes:seconds.
+    seconds = 0
+    for part in time_string.split(":"):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def read_usitt_ascii(lines):
+    """
+    Streams a USITT ASCII show file one line at a time.
+    
+    :param lines: Any iterable of lines, like an open file.
+    :return: List of (event list, seconds, kind, number, text) show control events with kind "C" or "M",
+             dict of cue number to (label, up time in seconds) and dict of macro number to label.
+    """
+    events = []
+    cues = {}
+    macros = {}
+    event_list = 1
+    fps = 30
+    record = None  # Whichever $Timecode, Cue or Macro the following lines belong to.
+    
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("!"):
+            continue
+        keyword, _, rest = line.partition(" ")
+        keyword = keyword.lower()
+        rest = rest.strip()
+        argument = rest.split()[0] if rest else ""
+        
+        # Records missing their number are skipped along with whatever lines follow them.
+        if keyword in ("$sclist", "$$framespersecond", "$timecode", "cue", "macro", "$macro", "up") and not argument:
+            if not keyword.startswith("$$") and keyword != "up":
+                record = None
+            continue
+        
+        if keyword == "$sclist":
+            event_list = int(argument)
+            record = None
+        elif keyword == "$$framespersecond":
+            fps = float(argument)
+        elif keyword == "$timecode":
+            record = {"type": "event", "list": event_list, "seconds": usitt_timecode_to_seconds(argument, fps), "text": ""}
+        elif keyword == "$$scdata" and record is not None and record["type"] == "event":
+            kind, _, number = rest.partition(" ")
+            kind = kind.upper()
+            if kind == "C":
+                number = number.split("/")[-1].strip()
+            if kind in ("C", "M") and number:
+                events.append((record["list"], record["seconds"], kind, number.strip(), record["text"]))
+        elif keyword == "cue":
+            number = argument
+            record = {"type": "cue", "number": number}
+            cues[number] = ("", None)
+        elif keyword in ("macro", "$macro"):
+            number = argument
+            record = {"type": "macro", "number": number}
+            macros[number] = ""
+        elif keyword in ("text", "label", "$$text") and record is not None:
+            if record["type"] == "event":
+                record["text"] = rest
+                # Text may come after $$SCData as well.
+                if events and events[-1][0] == record["list"] and events[-1][1] == record["seconds"] and not events[-1][4]:
+                    events[-1] = events[-1][:4] + (rest,)
+            elif record["type"] == "cue":
+                cues[record["number"]] = (rest, cues[record["number"]][1])
+            else:
+                macros[record["number"]] = rest
+        elif keyword == "up" and record is not None and record["type"] == "cue":
+            try:
+                cues[record["number"]] = (cues[record["number"]][0], usitt_time_to_seconds(argument))
+            except ValueError:
+                pass
+        elif keyword.startswith("$") and not keyword.startswith("$$"):
+            record = None
+            
+    return events, cues, macros
+
+
+usitt_paired_macros = {
+    " (Start Macro)": ('option_eos_macro', " (End Macro)"),
+    " (Flash Up)": ('option_eos_flash', " (Flash Down)"),
+}
+
+
+def plan_usitt_strips(events, cues, macros):
+    """
+    Turns show control events into strips. Start/End Macro and Flash Up/Down pairs
+    written by the exporter become one macro or flash strip again.
+    
+    :return: List of (event list, start seconds, end seconds or None, motif type, name, numbers) tuples.
+    """
+    plans = []
+    open_pairs = {}
+    
+    for event_list, seconds, kind, number, text in sorted(events, key=lambda event: (event[0], event[1])):
+        if kind == "C":
+            label, up_time = cues.get(number, ("", None))
+            end = seconds + up_time if up_time else None
+            plans.append((event_list, seconds, end, 'option_eos_cue', text or label or "Cue " + number, (number,)))
+            continue
+        
+        for start_suffix, (motif_type, end_suffix) in usitt_paired_macros.items():
+            if text.endswith(start_suffix):
+                plan = [event_list, seconds, None, motif_type, text[:-len(start_suffix)], (int(number), 0)]
+                open_pairs[(event_list, plan[4], end_suffix)] = plan
+                plans.append(plan)
+                break
+            if text.endswith(end_suffix):
+                plan = open_pairs.pop((event_list, text[:-len(end_suffix)], end_suffix), None)
+                if plan is not None:
+                    plan[2] = seconds
+                    plan[5] = (plan[5][0], int(number))
+                else:
+                    plans.append([event_list, seconds, None, motif_type, text[:-len(end_suffix)], (0, int(number))])
+                break
+        else:
+            plans.append((event_list, seconds, None, 'option_eos_macro', text or macros.get(number) or "Macro " + number, (int(number), 0)))
+            
+    return [tuple(plan) for plan in plans]
+
+
 class ImportUsittAsciiOperator(bpy.types.Operator):
     bl_idname = "my.import_usitt_ascii_operator"
     bl_label = "Import USITT ASCII"
+    bl_description = "Build cue, macro and flash strips from the show control event lists in a USITT ASCII file exported from Eos"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.asc;*.txt", options={'HIDDEN'})
+    
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
     
     def execute(self, context):
-        for area in bpy.context.screen.areas:
-            if area.type == 'SEQUENCE_EDITOR':
-                area.type = 'TEXT_EDITOR'
-                break
+        scene = context.scene
+        if not scene.sequence_editor:
+            scene.sequence_editor_create()
+        sequence_editor = scene.sequence_editor
+        fps = get_frame_rate(scene)
+        
+        try:
+            with open(bpy.path.abspath(self.filepath), encoding='utf-8', errors='replace') as file:
+                events, cues, macros = read_usitt_ascii(file)
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Could not read {self.filepath}: {e}")
+            return {'CANCELLED'}
+        
+        plans = plan_usitt_strips(events, cues, macros)
+        if not plans:
+            self.report({'WARNING'}, "No cue or macro events found.")
+            return {'CANCELLED'}
+        
+        # Line events up with the song strip that owns their event list, like the exporter slides them.
+        slide_factors = {}
+        for strip in sequence_editor.sequences:
+            if strip.type == 'SOUND' and strip.song_timecode_clock_number != 0:
+                slide_factors.setdefault(strip.song_timecode_clock_number, get_slide_factor(strip))
+        
+        placed = []
+        for event_list, start, end, motif_type, name, numbers in plans:
+            frame_start = int(round(start * fps)) + slide_factors.get(event_list, 0)
+            if end is None:
+                length = int(round(fps))
+            else:
+                length = max(1, int(round((end - start) * fps)))
+                if motif_type == 'option_eos_flash':
+                    length *= 2  # Flash down sits in the middle of the strip at zero bias.
+            placed.append((frame_start, frame_start + length, motif_type, name, numbers))
+        placed.sort(key=lambda plan: plan[0])
+        
+        # Pack into lanes above everything already in the sequencer instead of searching for free channels per strip.
+        base_channel = max((strip.channel for strip in sequence_editor.sequences_all), default=0) + 1
+        lane_ends = []
+        lanes = []
+        for frame_start, frame_end, motif_type, name, numbers in placed:
+            lane = next((index for index, lane_end in enumerate(lane_ends) if lane_end <= frame_start), len(lane_ends))
+            if lane == len(lane_ends):
+                lane_ends.append(frame_end)
+            else:
+                lane_ends[lane] = frame_end
+            lanes.append(lane)
+            
+        if base_channel + len(lane_ends) - 1 > 128:
+            self.report({'ERROR'}, f"These events need {len(lane_ends)} channels starting at {base_channel}, but the sequencer stops at 128.")
+            return {'CANCELLED'}
+        
+        colors = {'option_eos_cue': (0, 0, .5), 'option_eos_macro': (1, 0, 0), 'option_eos_flash': (1, 1, 0)}
+        for lane, (frame_start, frame_end, motif_type, name, numbers) in zip(lanes, placed):
+            color_strip = sequence_editor.sequences.new_effect(
+                name=name,
+                type='COLOR',
+                channel=base_channel + lane,
+                frame_start=frame_start,
+                frame_end=frame_end)
+            color_strip.color = colors[motif_type]
+            color_strip.select = False
+            color_strip.my_settings.motif_type_enum = motif_type
+            
+            if motif_type == 'option_eos_cue':
+                color_strip.eos_cue_number = numbers[0]
+            elif motif_type == 'option_eos_macro':
+                color_strip.start_frame_macro, color_strip.end_frame_macro = numbers
+            else:
+                color_strip.start_flash_macro_number, color_strip.end_flash_macro_number = numbers
+                
+        self.report({'INFO'}, f"Imported {len(placed)} strips from {len(events)} events.")
+        
+        return {'FINISHED'}
+
+
+def get_show_timeline(scene):
+    """The show as a show_timeline dict, built from the same strips and event lists Render Strips sends."""
+    sequences = scene.sequence_editor.sequences
+    
+    def bounds(strip):
+        return [strip.name, strip.channel, int(strip.frame_start), int(strip.frame_final_end)]
+    
+    sections = {
+        "clocks": [bounds(strip) + [strip.song_timecode_clock_number, strip.sound.filepath if strip.sound else ""] for strip in sequences 
+                   if strip.type == 'SOUND' and not strip.mute and strip.song_timecode_clock_number != 0],
+        "cues": [bounds(strip) + [strip.eos_cue_number] for strip in filter_eos_cue_strips(sequences)],
+        "macros": [bounds(strip) + [strip.start_frame_macro, strip.end_frame_macro, strip.start_macro_muted, strip.end_macro_muted, 
+                                    strip.start_frame_macro_text, strip.end_frame_macro_text] for strip in filter_eos_macro_strips(sequences)],
+        "flashes": [bounds(strip) + [strip.start_flash_macro_number, strip.end_flash_macro_number, strip.flash_bias] for strip in filter_eos_flash_strips(sequences)],
+        "triggers": [bounds(strip) + [strip.trigger_prefix, strip.osc_trigger, strip.osc_trigger_end, strip.friend_list] for strip in filter_trigger_strips(sequences)],
+        "animations": [],
+    }
+    
+    for strip in filter_animation_strips(sequences):
+        samples = sample_strip_values(scene, strip, range(int(strip.frame_start), int(strip.frame_final_end)))
+        columns = {parameter: [round(values[parameter], 4) for values in samples] for parameter in animation_parameters if parameter != "osc_color"}
+        columns["osc_color"] = [[round(channel, 4) for channel in values["osc_color"]] for values in samples]
+        sections["animations"].append(bounds(strip) + [strip.animation_cue_list_number, strip.animation_event_list_number, columns])
+    
+    return make_timeline(get_frame_rate(scene), scene.frame_start, scene.frame_end, sections, partition_render_events(scene))
+
+
+def key_timeline_samples(scene, strip, frame_start, samples):
+    """Keys a strip's parameters from timeline samples, linear between the fewest keys that stay within rounding."""
+    if scene.animation_data is None:
+        scene.animation_data_create()
+    if scene.animation_data.action is None:
+        scene.animation_data.action = bpy.data.actions.new(scene.name + "Action")
+    fcurves = scene.animation_data.action.fcurves
+    strip_path = f'sequence_editor.sequences_all["{bpy.utils.escape_identifier(strip.name)}"].'
+    
+    for parameter, values in samples.items():
+        if parameter not in animation_parameters or not values:
+            continue
+        columns = list(zip(*values)) if parameter == "osc_color" else [values]
+        for index, column in enumerate(columns):
+            kept = simplify_keyframes(column, .0001)
+            # A curve left behind by a deleted strip of the same name would keep its old keys.
+            stale = fcurves.find(strip_path + parameter, index=index)
+            if stale is not None:
+                fcurves.remove(stale)
+            fcurve = fcurves.new(strip_path + parameter, index=index)
+            fcurve.keyframe_points.add(len(kept))
+            fcurve.keyframe_points.foreach_set("co", [value for frame in kept for value in (frame_start + frame, column[frame])])
+            for point in fcurve.keyframe_points:
+                point.interpolation = 'LINEAR'
+            fcurve.update()
+
+
+def apply_show_timeline(scene, timeline):
+    """
+    Builds strips from a timeline. Into an empty sequencer they land on their original channels,
+    otherwise everything moves up above what's already there. The events section is derived, so it's ignored.
+    
+    :return: Strips created and clocks whose sound file couldn't be found.
+    :raises ValueError: If the strips won't fit below the sequencer's top channel. Nothing is created then.
+    """
+    if not scene.sequence_editor:
+        scene.sequence_editor_create()
+    sequence_editor = scene.sequence_editor
+    channel_offset = max((strip.channel for strip in sequence_editor.sequences_all), default=0)
+    new_rows = [row for name in timeline_fields for row in section_rows(timeline, name)
+                if name != "clocks" or getattr(sequence_editor.sequences_all.get(row["name"] or ""), "type", None) != 'SOUND']
+    highest_channel = max((row["channel"] or 1 for row in new_rows), default=0) + channel_offset
+    if highest_channel > 128:
+        raise ValueError(f"the timeline needs channels up to {highest_channel} above what's already in the sequencer, but there are only 128")
+    created = 0
+    missing_clocks = []
+    
+    for clock in section_rows(timeline, "clocks"):
+        sound_strip = sequence_editor.sequences_all.get(clock["name"])
+        if sound_strip is None or sound_strip.type != 'SOUND':
+            filepath = bpy.path.abspath(clock["filepath"] or "")
+            if not clock["filepath"] or not os.path.isfile(filepath):
+                missing_clocks.append(clock["name"])
+                continue
+            sound_strip = sequence_editor.sequences.new_sound(clock["name"], filepath, (clock["channel"] or 1) + channel_offset, clock["frame_start"])
+            created += 1
+        sound_strip.song_timecode_clock_number = clock["event_list"] or 0
+    
+    colors = {"cues": (0, 0, .5), "macros": (1, 0, 0), "flashes": (1, 1, 0), "triggers": (1, 1, 1), "animations": (0, 1, 0)}
+    motif_types = {"cues": 'option_eos_cue', "macros": 'option_eos_macro', "flashes": 'option_eos_flash', "triggers": 'option_trigger', "animations": 'option_animation'}
+    
+    for section, motif_type in motif_types.items():
+        for row in section_rows(timeline, section):
+            strip = sequence_editor.sequences.new_effect(
+                name=row["name"] or section[:-1].title(),
+                type='COLOR',
+                channel=(row["channel"] or 1) + channel_offset,
+                frame_start=row["frame_start"],
+                frame_end=max(row["frame_end"], row["frame_start"] + 1))
+            strip.color = colors[section]
+            strip.select = False
+            strip.my_settings.motif_type_enum = motif_type
+            created += 1
+            
+            if section == "cues":
+                strip.eos_cue_number = str(row["cue"] or "")
+            elif section == "macros":
+                strip.start_frame_macro, strip.end_frame_macro = row["start_macro"] or 0, row["end_macro"] or 0
+                strip.start_macro_muted, strip.end_macro_muted = bool(row["start_muted"]), bool(row["end_muted"])
+                strip.start_frame_macro_text, strip.end_frame_macro_text = row["start_text"] or "", row["end_text"] or ""
+            elif section == "flashes":
+                strip.start_flash_macro_number, strip.end_flash_macro_number = row["start_macro"] or 0, row["end_macro"] or 0
+                strip.flash_bias = row["bias"] or 0
+            elif section == "triggers":
+                strip.trigger_prefix = row["prefix"] or "/eos/newcmd"
+                strip.osc_trigger, strip.osc_trigger_end = row["start"] or "", row["end"] or ""
+                strip.friend_list = row["friends"] or ""
+            else:
+                strip.animation_cue_list_number = row["cue_list"] or 10
+                strip.animation_event_list_number = row["event_list"] or 10
+                key_timeline_samples(scene, strip, row["frame_start"], row["samples"] or {})
+                
+    return created, missing_clocks
+
+
+class ExportShowTimelineOperator(bpy.types.Operator):
+    bl_idname = "my.export_show_timeline"
+    bl_label = "Export Timeline"
+    bl_description = "Write every cue, macro, flash, trigger, animation and clock to a versioned JSON or MessagePack file that other tools can read without Blender"
+    
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.json;*.msgpack;*.mpk", options={'HIDDEN'})
+    
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = bpy.path.ensure_ext(bpy.path.abspath("//Show Timeline") if bpy.data.filepath else "Show Timeline", ".json")
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def execute(self, context):
+        if not context.scene.sequence_editor:
+            self.report({'ERROR'}, "There is nothing in the sequencer to export.")
+            return {'CANCELLED'}
+        
+        timeline = get_show_timeline(context.scene)
+        try:
+            bytes_written = write_timeline(timeline, bpy.path.abspath(self.filepath))
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not write {e.filename}: {e.strerror}")
+            return {'CANCELLED'}
+        
+        strip_count = sum(len(timeline[name]["rows"]) for name in timeline_fields)
+        self.report({'INFO'}, f"Wrote {strip_count} strips ({bytes_written} bytes) to {os.path.basename(self.filepath)}.")
+        
+        return {'FINISHED'}
+
+
+class ImportShowTimelineOperator(bpy.types.Operator):
+    bl_idname = "my.import_show_timeline"
+    bl_label = "Import Timeline"
+    bl_description = "Build strips from a JSON or MessagePack timeline written by Export Timeline"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    filepath: bpy.props.StringProperty(subtype='FILE_PATH')
+    filter_glob: bpy.props.StringProperty(default="*.json;*.msgpack;*.mpk", options={'HIDDEN'})
+    
+    def invoke(self, context, event):
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def execute(self, context):
+        try:
+            timeline = read_timeline(bpy.path.abspath(self.filepath))
+        except (OSError, ValueError) as e:
+            self.report({'ERROR'}, f"Could not read {self.filepath}: {e}")
+            return {'CANCELLED'}
+        
+        try:
+            created, missing_clocks = apply_show_timeline(context.scene, timeline)
+        except ValueError as e:
+            self.report({'ERROR'}, f"Could not import {os.path.basename(self.filepath)}: {e}")
+            return {'CANCELLED'}
+        
+        if missing_clocks:
+            self.report({'WARNING'}, f"Imported {created} strips. No sound file for {', '.join(missing_clocks)}, so those clocks were skipped.")
+        else:
+            self.report({'INFO'}, f"Imported {created} strips.")
         
         return {'FINISHED'}
     
@@ -4364,6 +4778,14 @@ class StopEffectOperator(bpy.types.Operator):
         return {'FINISHED'}
     
     
+def bake_audio_volumes(scene, speaker_strips):
+    for frame in range(scene.frame_start, scene.frame_end + 1):
+        scene.frame_set(frame)
+        for strip in speaker_strips:
+            strip.volume = strip.dummy_volume
+            strip.keyframe_insert(data_path="volume", frame=frame)
+
+
 class BakeAudioOperator(bpy.types.Operator):
     bl_idname = "seq.bake_audio_operator"
     bl_label = "Bake Audio"
@@ -4378,11 +4800,7 @@ class BakeAudioOperator(bpy.types.Operator):
         correct_frame_end = active_strip.frame_final_duration
         matching_strips = [strip for strip in sequences if strip.type == 'SOUND' and strip.audio_type_enum == "option_speaker" and strip.frame_start == correct_frame_start and strip.frame_final_duration == correct_frame_end]
         
-        for frame in range(scene.frame_start, scene.frame_end + 1):
-            scene.frame_set(frame)
-            for strip in matching_strips:
-                strip.volume = strip.dummy_volume
-                strip.keyframe_insert(data_path="volume", frame=frame)
+        bake_audio_volumes(scene, matching_strips)
         
         self.report({'INFO'}, "Bake complete.")
         
@@ -4667,7 +5085,10 @@ classes = (
     DisplaysOperator,
     AboutOperator,
     GenerateTextOperator,
+    ExportUsittAsciiOperator,
     ImportUsittAsciiOperator,
+    ExportShowTimelineOperator,
+    ImportShowTimelineOperator,
     RecordOperator,
     ColorTriggerOperator,
     StripNameTriggerOperator,
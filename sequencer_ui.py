@@ -178,6 +178,11 @@ class AlvaConsolePanel(bpy.types.Panel):
                 column.separator()
                 row = box.row()
                 row.operator("my.generate_text", icon="TEXT")
+                row.operator("my.export_usitt_ascii", icon="EXPORT")
+                row.operator("my.import_usitt_ascii_operator", icon="IMPORT")
+                row = box.row()
+                row.operator("my.export_show_timeline", icon="EXPORT")
+                row.operator("my.import_show_timeline", icon="IMPORT")
                 box.separator()
                 row = box.row(align=True)
                 row.operator("my.bump_left_five", icon='BACK')
@@ -510,7 +515,7 @@ class AlvaConsolePanel(bpy.types.Panel):
                     row = box.row(align=True)
                     row.operator("my.clear_red", icon='CANCEL')
                     row.prop(active_strip, "red_prefix", text="")
-                    row.label(text="")
+                    row.prop(active_strip, "color_emitter_model", text="")
                     row = box.row(align=True)
                     row.operator("my.clear_green", icon='CANCEL')
                     row.prop(active_strip, "green_prefix", text="")
@@ -583,6 +588,9 @@ class AlvaConsolePanel(bpy.types.Panel):
                     row.alert = 0
                     row.operator("my.add_strip_operator", text="", icon='ADD')
                     row = box.row(align=True)
+                    row.label(text="Or drive * as channels:")
+                    row.prop(active_strip, "animation_channels", text="")
+                    row = box.row(align=True)
                     row.operator("my.record_preset", text="Store Preset", icon='NLA_PUSHDOWN')
                     row.operator("my.load_preset", text="Load Preset", icon='FILE_PARENT')
                     row = box.separator()
@@ -640,6 +648,8 @@ class AlvaConsolePanel(bpy.types.Panel):
                         row.operator("my.stop_animation_clock_operator", text="", icon='PAUSE')
                         row.prop(active_strip, "animation_event_list_number", text="Event List")
                         row = box.row()
+                        row.prop(active_strip, "qmeo_tolerance", text="Tolerance")
+                        row.prop(active_strip, "qmeo_delta", text="Delta", toggle=True)
                         row.operator("my.bake_fcurves_to_cues_operator", text="Create Qmeo", icon_value=orb.icon_id)
                         row = box.row()
                         row.operator("my.rerecord_cues_operator", text="Re-record Cues", icon_value=orb.icon_id)
@@ -997,6 +1007,9 @@ class ButtonsPanel(bpy.types.Panel):
             flow.operator("my.add_trigger", icon='SETTINGS', text="Trigger" if region_width > 200 else "")
         flow.separator()
         flow.operator("seq.render_strips_operator", icon_value=orb.icon_id, text="Render" if region_width > 200 else "")
+        flow.operator("seq.render_strips_operator", icon='RENDER_ANIMATION', text="Render All" if region_width > 200 else "").render_all = True
+        flow.operator("seq.render_strips_operator", icon='FILE_REFRESH', text="Rebuild" if region_width > 200 else "").rebuild = True
+        flow.operator("seq.dry_run_operator", icon='HIDE_OFF', text="Dry Run" if region_width > 200 else "")
         flow.operator("my.add_strip_operator", icon='ADD', text="Add Strip" if region_width > 200 else "", emboss=True)
         flow.operator("my.go_to_cue_out_operator", icon='GHOST_ENABLED', text="Cue 0" if region_width > 200 else "")
         flow.operator("my.displays_operator", icon='MENU_PANEL', text="Displays" if region_width > 200 else "")
@@ -1107,6 +1120,33 @@ class SettingsPanel(bpy.types.Panel):
             row = column.separator()
             row = column.separator()
             row = column.row()
+            row.prop(context.scene, "record_trigger_timing", slider=True, text="Record trigger timing")
+            row = column.separator()
+            row = column.separator()
+            row = column.row()
+            row.prop(context.scene, "console_command_byte_budget", text="Bytes per command")
+            row.prop(context.scene, "osc_datagram_mtu", text="Datagram size")
+            row = column.separator()
+            row = column.separator()
+            if context.scene.animation_enabled:
+                box = column.box()
+                row = box.row()
+                row.label(text="Animation output:")
+                row = box.row()
+                row.prop(scene, "animation_output_rate", text="Output rate (Hz)")
+                row = box.row()
+                row.prop(scene, "animation_deadband_absolute", text="Absolute")
+                row.prop(scene, "animation_deadband_relative", text="Relative")
+                row = box.row()
+                row.prop(scene, "animation_refresh_interval", text="Refresh every")
+                row = box.row()
+                row.prop(scene, "animation_batching", text="Batching")
+                if scene.animation_batching == 'option_command':
+                    row = box.row()
+                    row.prop(scene, "animation_batch_shared_channels", text="Merge strips sharing a channel", slider=True)
+                row = column.separator()
+                row = column.separator()
+            row = column.row()
             row.prop(context.scene, "is_armed_release", slider=True, text="Add secondary strip on release of O key")    
             row = column.separator()
             row = column.separator()
@@ -1187,6 +1227,9 @@ class SettingsPanel(bpy.types.Panel):
                 row = box.row()
                 row.label(text="Port:")
                 row.prop(scene.scene_props, "int_osc_port", text="")
+                row = box.row()
+                row.label(text="Reply port:")
+                row.prop(scene.scene_props, "int_osc_reply_port", text="")
                 
                 
 def draw_alva_sequencer_menu(self, layout):
@@ -0,0 +1,284 @@
+# This file is part of Alva Sequencer.
+# Copyright (C) 2024 Alva Theaters
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+'''
+=====================================================================
+                      DESIGNED BY ALVA THEATERS
+                       FOR THE SOLE PURPOSE OF
+                         MAKING PEOPLE HAPPY
+=====================================================================
+'''
+
+
+## Double hashtag indicates notes for future development requiring some level of attention
+
+
+'''
+Machine-readable show timelines: cues, macros, flashes, triggers, animation samples and clocks.
+Written as JSON (.json) or MessagePack (.msgpack). Nothing here needs Blender, so other tools and
+CI can read show data straight from this file:
+
+    python show_timeline.py show.msgpack
+    python show_timeline.py show.msgpack --json show.json
+
+Each section is {"fields": [...], "rows": [[...], ...]} so big shows stay compact. Readers should go
+through section_rows, which fills fields a file doesn't have with None and ignores ones it doesn't know.
+Bump timeline_version when a field changes meaning, not when one is added.
+'''
+
+
+import argparse
+import json
+import os
+import struct
+import sys
+
+
+timeline_format = "alva-timeline"
+timeline_version = 1
+
+timeline_fields = {
+    "clocks": ("name", "channel", "frame_start", "frame_end", "event_list", "filepath"),
+    "cues": ("name", "channel", "frame_start", "frame_end", "cue"),
+    "macros": ("name", "channel", "frame_start", "frame_end", "start_macro", "end_macro", "start_muted", "end_muted", "start_text", "end_text"),
+    "flashes": ("name", "channel", "frame_start", "frame_end", "start_macro", "end_macro", "bias"),
+    "triggers": ("name", "channel", "frame_start", "frame_end", "prefix", "start", "end", "friends"),
+    # Samples are {parameter: [one value per frame from frame_start]}, colors as [r, g, b].
+    "animations": ("name", "channel", "frame_start", "frame_end", "cue_list", "event_list", "samples"),
+}
+
+
+def make_timeline(fps, frame_start, frame_end, sections, events):
+    """
+    :param sections: Dict of section name to rows, each row in timeline_fields order.
+    :param events: Dict of event list number to [(timecode, action), ...], as partition_render_events gives.
+    """
+    timeline = {"format": timeline_format, "version": timeline_version, "fps": fps, "frame_start": frame_start, "frame_end": frame_end}
+    for name, fields in timeline_fields.items():
+        timeline[name] = {"fields": list(fields), "rows": [list(row) for row in sections.get(name, ())]}
+    timeline["events"] = {str(event_list): [list(event) for event in event_events] for event_list, event_events in events.items()}
+    return timeline
+
+
+def check_timeline(timeline):
+    if not isinstance(timeline, dict) or timeline.get("format") != timeline_format:
+        raise ValueError("not an Alva show timeline")
+    version = timeline.get("version")
+    if not isinstance(version, int) or version > timeline_version:
+        raise ValueError(f"timeline version {version} is newer than this add-on reads ({timeline_version})")
+    return timeline
+
+
+def section_rows(timeline, name):
+    """Rows of one section as dicts keyed by this version's field names."""
+    section = timeline.get(name) or {}
+    fields = section.get("fields", ())
+    rows = []
+    for row in section.get("rows", ()):
+        values = dict(zip(fields, row))
+        rows.append({field: values.get(field) for field in timeline_fields[name]})
+    return rows
+
+
+def pack_msgpack(value):
+    """MessagePack for the types a timeline uses, so Blender's Python doesn't need the msgpack module."""
+    output = bytearray()
+
+    def pack(item):
+        if item is None:
+            output.append(0xc0)
+        elif item is True or item is False:
+            output.append(0xc3 if item else 0xc2)
+        elif isinstance(item, int):
+            if 0 <= item < 0x80 or -32 <= item < 0:
+                output.extend(struct.pack(">b", item) if item < 0 else bytes((item,)))
+            elif 0 <= item < 0x10000000000000000:
+                for tag, code, limit in ((0xcc, "B", 0x100), (0xcd, "H", 0x10000), (0xce, "I", 0x100000000), (0xcf, "Q", 0x10000000000000000)):
+                    if item < limit:
+                        output.extend(struct.pack(">B" + code, tag, item))
+                        break
+            elif -0x8000000000000000 <= item < 0:
+                for tag, code, limit in ((0xd0, "b", 0x80), (0xd1, "h", 0x8000), (0xd2, "i", 0x80000000), (0xd3, "q", 0x8000000000000000)):
+                    if item >= -limit:
+                        output.extend(struct.pack(">B" + code, tag, item))
+                        break
+            else:
+                raise ValueError(f"integer {item} doesn't fit in MessagePack")
+        elif isinstance(item, float):
+            output.extend(struct.pack(">Bd", 0xcb, item))
+        elif isinstance(item, str):
+            data = item.encode()
+            if len(data) < 32:
+                output.append(0xa0 | len(data))
+            elif len(data) < 0x100:
+                output.extend(struct.pack(">BB", 0xd9, len(data)))
+            elif len(data) < 0x10000:
+                output.extend(struct.pack(">BH", 0xda, len(data)))
+            else:
+                output.extend(struct.pack(">BI", 0xdb, len(data)))
+            output.extend(data)
+        elif isinstance(item, (list, tuple)):
+            if len(item) < 16:
+                output.append(0x90 | len(item))
+            elif len(item) < 0x10000:
+                output.extend(struct.pack(">BH", 0xdc, len(item)))
+            else:
+                output.extend(struct.pack(">BI", 0xdd, len(item)))
+            for element in item:
+                pack(element)
+        elif isinstance(item, dict):
+            if len(item) < 16:
+                output.append(0x80 | len(item))
+            elif len(item) < 0x10000:
+                output.extend(struct.pack(">BH", 0xde, len(item)))
+            else:
+                output.extend(struct.pack(">BI", 0xdf, len(item)))
+            for key, element in item.items():
+                pack(key)
+                pack(element)
+        else:
+            raise TypeError(f"can't write {type(item).__name__} to MessagePack")
+
+    pack(value)
+    return bytes(output)
+
+
+def unpack_msgpack(data):
+    offset = 0
+
+    def read(code):
+        nonlocal offset
+        values = struct.unpack_from(">" + code, data, offset)
+        offset += struct.calcsize(">" + code)
+        return values[0]
+
+    def read_bytes(length):
+        nonlocal offset
+        if offset + length > len(data):
+            raise ValueError("MessagePack data ends early")
+        chunk = data[offset:offset + length]
+        offset += length
+        return chunk
+
+    def unpack():
+        tag = read("B")
+        if tag < 0x80:
+            return tag
+        if tag >= 0xe0:
+            return tag - 0x100
+        if 0x80 <= tag <= 0x8f:
+            return unpack_map(tag & 0x0f)
+        if 0x90 <= tag <= 0x9f:
+            return [unpack() for _ in range(tag & 0x0f)]
+        if 0xa0 <= tag <= 0xbf:
+            return read_bytes(tag & 0x1f).decode()
+        if tag in fixed:
+            return fixed[tag]
+        if tag in numbers:
+            return read(numbers[tag])
+        if tag in strings:
+            return read_bytes(read(strings[tag])).decode()
+        if tag in binaries:
+            return bytes(read_bytes(read(binaries[tag])))
+        if tag in arrays:
+            return [unpack() for _ in range(read(arrays[tag]))]
+        if tag in maps:
+            return unpack_map(read(maps[tag]))
+        raise ValueError(f"unsupported MessagePack type 0x{tag:02x}")
+
+    def unpack_map(length):
+        result = {}
+        for _ in range(length):
+            key = unpack()
+            result[key] = unpack()
+        return result
+
+    fixed = {0xc0: None, 0xc2: False, 0xc3: True}
+    numbers = {0xca: "f", 0xcb: "d", 0xcc: "B", 0xcd: "H", 0xce: "I", 0xcf: "Q", 0xd0: "b", 0xd1: "h", 0xd2: "i", 0xd3: "q"}
+    strings = {0xd9: "B", 0xda: "H", 0xdb: "I"}
+    binaries = {0xc4: "B", 0xc5: "H", 0xc6: "I"}
+    arrays = {0xdc: "H", 0xdd: "I"}
+    maps = {0xde: "H", 0xdf: "I"}
+
+    try:
+        value = unpack()
+    except struct.error:
+        raise ValueError("MessagePack data ends early")
+    if offset != len(data):
+        raise ValueError("trailing bytes after MessagePack data")
+    return value
+
+
+def is_msgpack_path(path):
+    return os.path.splitext(path)[1].lower() in (".msgpack", ".mpk")
+
+
+def write_timeline(timeline, path, as_msgpack=None):
+    """Writes MessagePack for .msgpack paths and JSON otherwise, unless told which. Returns bytes written."""
+    if as_msgpack is None:
+        as_msgpack = is_msgpack_path(path)
+    if as_msgpack:
+        data = pack_msgpack(timeline)
+    else:
+        data = json.dumps(timeline, separators=(",", ":")).encode()
+    with open(path, "wb") as file:
+        file.write(data)
+    return len(data)
+
+
+def read_timeline(path):
+    with open(path, "rb") as file:
+        data = file.read()
+    if is_msgpack_path(path):
+        timeline = unpack_msgpack(data)
+    else:
+        timeline = json.loads(data.decode())
+    # Event list numbers are map keys, which JSON always turns into strings.
+    if isinstance(timeline, dict) and isinstance(timeline.get("events"), dict):
+        timeline["events"] = {str(event_list): events for event_list, events in timeline["events"].items()}
+    return check_timeline(timeline)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="show_timeline", description="Summarize or convert an Alva show timeline.")
+    parser.add_argument("timeline", help=".json or .msgpack timeline")
+    parser.add_argument("--json", metavar="PATH", help="Write the timeline as JSON, - for standard output")
+    parser.add_argument("--msgpack", metavar="PATH", help="Write the timeline as MessagePack")
+    args = parser.parse_args(argv)
+
+    try:
+        timeline = read_timeline(args.timeline)
+    except (OSError, ValueError) as e:
+        print(f"{args.timeline}: {e}", file=sys.stderr)
+        return 1
+
+    if args.json == "-":
+        json.dump(timeline, sys.stdout, indent=1)
+        print()
+    elif args.json:
+        write_timeline(timeline, args.json, False)
+    if args.msgpack:
+        write_timeline(timeline, args.msgpack, True)
+    if args.json != "-":
+        counts = ", ".join(f"{len(section_rows(timeline, name))} {name}" for name in timeline_fields)
+        events = sum(len(events) for events in timeline["events"].values())
+        print(f"{args.timeline}: version {timeline['version']}, {timeline['fps']} fps, {counts}, {events} events")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
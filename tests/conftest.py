@@ -0,0 +1,43 @@
+# This file is part of Alva Sequencer.
+# Copyright (C) 2024 Alva Theaters
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+'''
+The add-on only imports inside Blender, so run these with Blender's Python:
+
+    blender -b --factory-startup --python-expr "import sys, pytest; sys.exit(pytest.main(['tests']))"
+
+Outside Blender, the tests that need bpy are skipped.
+'''
+
+
+import importlib
+import os
+import sys
+
+import pytest
+
+
+addon_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_addon_module(name):
+    """Imports one of the add-on's modules as part of its package, so relative imports resolve."""
+    pytest.importorskip("bpy")
+    parent, package = os.path.split(addon_root)
+    if parent not in sys.path:
+        sys.path.insert(0, parent)
+    return importlib.import_module(f"{package}.{name}")
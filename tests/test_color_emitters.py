@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from conftest import import_addon_module
+
+
+sequencer_main = import_addon_module("sequencer_main")
+
+
+def solve(model, color):
+    return dict(zip(sequencer_main.emitter_models[model], sequencer_main.solve_emitters(model, np.array(color, dtype=np.float64))))
+
+
+def test_yellow_green_lights_lime():
+    levels = solve('option_rgbal', (0.5, 1, 0))
+    assert levels["lime"] == pytest.approx(1)
+    assert levels["amber"] == pytest.approx(0)
+
+
+def test_orange_lights_amber():
+    levels = solve('option_rgbal', (1, 0.5, 0))
+    assert levels["amber"] == pytest.approx(1)
+    assert levels["lime"] == pytest.approx(0)
+
+
+def test_rgbal_lut_uses_both_emitters():
+    lut = sequencer_main.get_color_lut('option_rgbal')
+    assert lut[..., 3].max() > 0.9
+    assert lut[..., 4].max() > 0.9
+
+
+def test_white_stays_on_rgb():
+    for model in ('option_rgba', 'option_rgbal'):
+        levels = solve(model, (1, 1, 1))
+        assert (levels["red"], levels["green"], levels["blue"]) == pytest.approx((1, 1, 1))
+        assert levels["amber"] == pytest.approx(0)
+
+
+def test_rgbal_mixes_back_to_the_color():
+    colors = np.random.default_rng(0).random((1000, 3))
+    levels = sequencer_main.solve_emitters('option_rgbal', colors)
+    red = levels[:, 0] + levels[:, 3] + levels[:, 4] / 2
+    green = levels[:, 1] + levels[:, 3] / 2 + levels[:, 4]
+    assert np.allclose(np.stack((red, green, levels[:, 2]), axis=-1), colors)
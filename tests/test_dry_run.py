@@ -0,0 +1,64 @@
+from types import SimpleNamespace
+
+import pytest
+
+from conftest import import_addon_module
+
+
+sequencer_main = import_addon_module("sequencer_main")
+
+
+def make_strip():
+    return SimpleNamespace(name="Qmeo", frame_final_end=4, animation_cue_list_number=5, animation_channels="", color_emitter_model='option_rgb', use_paths=False,
+                           intensity_prefix="/eos/chan/1", red_prefix="", green_prefix="", blue_prefix="", pan_prefix="", tilt_prefix="", zoom_prefix="", iris_prefix="")
+
+
+def make_look(intensity):
+    return {"osc_intensity": intensity, "osc_color": (1, 1, 1), "osc_pan": 0, "osc_tilt": 0, "osc_zoom": 1, "osc_iris": 100}, {}
+
+
+def record_plan(**options):
+    scene = SimpleNamespace(frame_current=1, animation_batching='option_separate')
+    looks = [make_look(50), make_look(50), make_look(75)]
+    packets, recorded_frames = sequencer_main.get_qmeo_record_packets(scene, make_strip(), [1, 2, 3], looks, **options)
+    with sequencer_main.dry_run("qmeo") as plan:
+        assert sequencer_main.OscSendJob("127.0.0.1", 8000, packets).start()
+    return plan, recorded_frames
+
+
+def test_qmeo_record_plan():
+    plan, recorded_frames = record_plan()
+
+    # The unchanged intensity isn't sent again, but every frame is still recorded.
+    assert recorded_frames == [1, 2, 3]
+    assert [command[:3] for command in plan.commands] == [
+        (0.0, "/eos/chan/1", "50"),
+        (0.0, "/eos/newcmd", "Record 5 / 1 Enter Enter"),
+        (pytest.approx(0.1), "/eos/newcmd", "Record 5 / 2 Enter Enter"),
+        (pytest.approx(0.2), "/eos/chan/1", "75"),
+        (pytest.approx(0.2), "/eos/newcmd", "Record 5 / 3 Enter Enter"),
+    ]
+    assert plan.packet_count == 5
+    assert plan.byte_count == sum(len(sequencer_main.build_osc_message(address, argument)) for seconds, address, argument, size in plan.commands)
+    assert plan.elapsed == pytest.approx(0.3)
+
+
+def test_delta_plan_skips_unchanged_frames():
+    plan, recorded_frames = record_plan(delta=True)
+
+    assert recorded_frames == [1, 3]
+    assert [argument for seconds, address, argument, size in plan.commands if address == "/eos/newcmd"] == [
+        "Chan 1 Record_Only 5 / 1 Enter Enter",
+        "Chan 1 Record_Only 5 / 3 Enter Enter",
+    ]
+
+
+def test_dry_run_sends_nothing(monkeypatch):
+    def sendto(data, target):
+        raise AssertionError("sent during a dry run")
+    monkeypatch.setattr(sequencer_main.osc_transport, "sock", SimpleNamespace(sendto=sendto))
+
+    with sequencer_main.dry_run() as plan:
+        sequencer_main.send_osc_string("/eos/newcmd", "127.0.0.1", 8000, "Go_To_Cue 1 Enter")
+    assert not sequencer_main.osc_transport.recording
+    assert plan.to_text().splitlines()[-1] == "0.000\t/eos/newcmd\tGo_To_Cue 1 Enter\t36"
@@ -0,0 +1,43 @@
+import math
+import random
+
+import numpy as np
+import pytest
+
+from conftest import import_addon_module
+
+
+mathutils = pytest.importorskip("mathutils")
+sequencer_main = import_addon_module("sequencer_main")
+
+
+def scalar_tilt_pan(matrix):
+    # Same as get_light_rotation_degrees.
+    euler = matrix.to_euler('XYZ')
+    pan = math.degrees(euler.z)
+    return math.degrees(euler.x), pan - 360 if pan > 90 else pan
+
+
+def assert_matches_to_euler(matrices):
+    tilt, pan = sequencer_main.rotation_matrices_to_tilt_pan(np.array([[list(row) for row in matrix] for matrix in matrices], dtype=np.float64))
+    for index, matrix in enumerate(matrices):
+        expected_tilt, expected_pan = scalar_tilt_pan(matrix)
+        assert tilt[index] == pytest.approx(expected_tilt, abs=1e-3)
+        assert pan[index] == pytest.approx(expected_pan, abs=1e-3)
+
+
+def test_random_rotations_match_to_euler():
+    generator = random.Random(0)
+    matrices = [mathutils.Euler([generator.uniform(-math.pi, math.pi) for _ in range(3)], 'XYZ').to_matrix() for _ in range(500)]
+    assert_matches_to_euler(matrices)
+
+
+def test_second_solution_is_picked():
+    # mathutils gives (-10, 180, -10) for this, not the first solution.
+    assert_matches_to_euler([mathutils.Euler((math.radians(170), 0, math.radians(170)), 'XYZ').to_matrix()])
+
+
+def test_scaled_and_gimbal_locked_rotations_match_to_euler():
+    scaled = mathutils.Euler((0.3, -1.2, 2.5), 'XYZ').to_matrix() @ mathutils.Matrix.Diagonal((2, 0.5, 3))
+    locked = mathutils.Euler((0.7, math.pi / 2, 0.4), 'XYZ').to_matrix()
+    assert_matches_to_euler([scaled, locked])
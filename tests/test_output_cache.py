@@ -0,0 +1,35 @@
+from types import SimpleNamespace
+
+from conftest import import_addon_module
+
+
+sequencer_main = import_addon_module("sequencer_main")
+
+
+def make_scene(refresh_interval=0):
+    return SimpleNamespace(animation_deadband_absolute=1, animation_deadband_relative=0, animation_refresh_interval=refresh_interval)
+
+
+def sent(cache, scene, values, final_index=None):
+    return [value for index, value in enumerate(values) if cache.should_send(scene, "Strip", "intensity", value, index == final_index)]
+
+
+def test_deadband_drops_small_steps():
+    cache = sequencer_main.AnimationOutputCache()
+    assert sent(cache, make_scene(), [0, 0.5, 0.8, 2, 2.4, 5]) == [0, 2, 5]
+
+
+def test_settled_value_is_sent_without_refresh():
+    cache = sequencer_main.AnimationOutputCache()
+    assert sent(cache, make_scene(), [0, 0.5, 0.8, 0.8, 0.8]) == [0, 0.8]
+
+
+def test_final_frame_is_sent():
+    cache = sequencer_main.AnimationOutputCache()
+    assert sent(cache, make_scene(refresh_interval=10), [0, 0.5, 0.8], final_index=2) == [0, 0.8]
+
+
+def test_ui_edits_are_remembered_not_filtered():
+    cache = sequencer_main.AnimationOutputCache()
+    cache.remember("Strip", "intensity", 50)
+    assert not cache.should_send(make_scene(refresh_interval=10), "Strip", "intensity", 50.5)
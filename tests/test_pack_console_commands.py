@@ -0,0 +1,58 @@
+from conftest import import_addon_module
+
+
+sequencer_main = import_addon_module("sequencer_main")
+pack_console_commands = sequencer_main.pack_console_commands
+build_osc_message = sequencer_main.build_osc_message
+
+
+def event_commands(count):
+    return [f"Event 1 / {number} Time 00:00:{number // 30 % 60:02}:{number % 30:02} Show_Control_Action Cue {number} Enter" for number in range(1, count + 1)]
+
+
+def assert_packed(commands, packed, byte_budget, mtu):
+    # Nothing dropped, duplicated or reordered.
+    assert ", ".join(packed) == ", ".join(commands)
+    for index, argument in enumerate(packed):
+        if ", " not in argument:
+            continue
+        assert len(argument.encode()) <= byte_budget
+        assert len(build_osc_message("/eos/newcmd", argument)) <= mtu
+        # Greedy, so the next command wouldn't have fit.
+        if index + 1 < len(packed):
+            grown = argument + ", " + packed[index + 1].split(", ")[0]
+            assert len(grown.encode()) > byte_budget or len(build_osc_message("/eos/newcmd", grown)) > mtu
+
+
+def test_byte_budget_limits_each_packet():
+    commands = event_commands(500)
+    packed = pack_console_commands(commands, 256, 1472)
+    assert_packed(commands, packed, 256, 1472)
+    assert len(packed) < len(commands) / 2
+
+
+def test_mtu_limits_each_packet():
+    commands = event_commands(500)
+    packed = pack_console_commands(commands, 100000, 576)
+    assert_packed(commands, packed, 100000, 576)
+    assert max(len(build_osc_message("/eos/newcmd", argument)) for argument in packed) > 500
+
+
+def test_exact_fit():
+    commands = ["Cue 1 / 1 Enter", "Cue 1 / 2 Enter"]
+    assert pack_console_commands(commands, len("Cue 1 / 1 Enter, Cue 1 / 2 Enter"), 1472) == ["Cue 1 / 1 Enter, Cue 1 / 2 Enter"]
+    assert pack_console_commands(commands, len("Cue 1 / 1 Enter, Cue 1 / 2 Enter") - 1, 1472) == commands
+
+
+def test_long_command_goes_out_alone():
+    long_command = "Chan " + " + ".join(str(channel) for channel in range(1, 200)) + " Enter"
+    commands = ["Cue 1 / 1 Enter", long_command, "Cue 1 / 2 Enter"]
+    assert pack_console_commands(commands, 256, 1472) == commands
+
+
+def test_packets_per_event():
+    # The number Render Strips reports, at the default byte budget and MTU.
+    commands = event_commands(1000)
+    packed = pack_console_commands(commands, 1024, 1472)
+    assert_packed(commands, packed, 1024, 1472)
+    assert len(packed) / len(commands) < 0.1